@@ -1,4 +1,6 @@
 from ajson.aserializer import ASerializer
-from ajson.class_decorator import AJson
+from ajson.backends import set_default_backend
+from ajson.class_decorator import AJson, warm_up
+from ajson.report_cache import enable_report_cache
 
 __version__ = '0.12.0'
@@ -0,0 +1,90 @@
+import keyword
+import tokenize
+from io import StringIO
+from typing import Dict, List, Optional
+
+from ajson.regex import as_comment_regex
+
+# tokens that are not part of the code of a statement
+_ignored_tokens = (tokenize.COMMENT, tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER)
+_comparison_operators = ('==', '!=', '<=', '>=')
+
+
+def _is_assignment_operator(token: tokenize.TokenInfo) -> bool:
+    # `=`, `:` (annotations) and augmented assignments like `+=`
+    return token.type == tokenize.OP and (token.string in ('=', ':') or (
+        token.string.endswith('=') and token.string not in _comparison_operators))
+
+
+def _get_assigned_attribute(statement: List[tokenize.TokenInfo]) -> Optional[str]:
+    """
+    Returns the attribute assigned by a statement like `self.a = 1`, `a = 1` or `a: int`
+    """
+    if len(statement) >= 4 and statement[0].string == 'self' and statement[1].string == '.' \
+            and statement[2].type == tokenize.NAME and _is_assignment_operator(statement[3]):
+        return statement[2].string
+    if len(statement) >= 2 and statement[0].type == tokenize.NAME and not keyword.iskeyword(statement[0].string) \
+            and _is_assignment_operator(statement[1]):
+        return statement[0].string
+    return None
+
+
+def _is_docstring(statement: List[tokenize.TokenInfo]) -> bool:
+    return bool(statement) and all(token.type == tokenize.STRING for token in statement)
+
+
+def extract_aj_annotations(source: str) -> Dict[str, str]:
+    """
+    Maps every attribute of a class source to its @aj annotation, reading the source tokens only once.
+
+    The annotation can be a comment in the line of the attribute (split in several comment lines if needed)
+    or a docstring placed right after it:
+
+    >>> extract_aj_annotations('''
+    ... class A:
+    ...     a = 1  # @aj(name=first_a)
+    ...     def __init__(self):
+    ...         self.b = 2
+    ...         \"\"\" @aj(groups=["admin"]) \"\"\"
+    ... ''')
+    {'a': '@aj(name=first_a)', 'b': '@aj(groups=["admin"])'}
+    """
+    annotations = {}
+    statement = []
+    previous_attribute = None
+    # lines of an @aj comment that is not closed yet, and the attribute it belongs to
+    comment_lines = None
+    comment_attribute = None
+
+    for token in tokenize.generate_tokens(StringIO(source).readline):
+        if token.type == tokenize.COMMENT:
+            if comment_lines is not None:
+                comment_lines.append(token.string)
+            elif '@aj(' in token.string:
+                comment_lines = [token.string]
+                comment_attribute = _get_assigned_attribute(statement)
+            else:
+                continue
+            matches = as_comment_regex.findall('\n'.join(comment_lines))
+            if matches:
+                if comment_attribute is not None:
+                    annotations[comment_attribute] = matches[-1]
+                comment_lines = None
+            continue
+
+        if token.type not in (tokenize.NEWLINE, tokenize.NL):
+            # an unclosed annotation ends with the comment lines
+            comment_lines = None
+
+        if token.type == tokenize.NEWLINE:
+            if _is_docstring(statement):
+                matches = as_comment_regex.findall(''.join(string.string for string in statement))
+                if matches and previous_attribute is not None:
+                    annotations[previous_attribute] = matches[0]
+            else:
+                previous_attribute = _get_assigned_attribute(statement)
+            statement = []
+        elif token.type not in _ignored_tokens:
+            statement.append(token)
+
+    return annotations
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from ajson.json_type_reports import AJsonAnnotationParseError
+
+_brackets = {'[': ']', '{': '}', '(': ')'}
+_quotes = ('"', "'")
+
+
+def _skip_separators(aj_str: str, pos: int) -> int:
+    while pos < len(aj_str) and (aj_str[pos].isspace() or aj_str[pos] == ','):
+        pos += 1
+    return pos
+
+
+def _skip_spaces(aj_str: str, pos: int) -> int:
+    while pos < len(aj_str) and aj_str[pos].isspace():
+        pos += 1
+    return pos
+
+
+def _find_closing_quote(aj_str: str, pos: int) -> int:
+    end = aj_str.find(aj_str[pos], pos + 1)
+    if end == -1:
+        raise AJsonAnnotationParseError('unterminated quote in "{}"'.format(aj_str))
+    return end
+
+
+def _read_key(aj_str: str, pos: int) -> int:
+    while pos < len(aj_str) and not aj_str[pos].isspace() and aj_str[pos] not in '=,':
+        pos += 1
+    return pos
+
+
+def _read_unquoted_value(aj_str: str, pos: int) -> int:
+    # values end with a space or a comma, unless they are inside brackets or quotes: groups=["a", "b"]
+    closing_brackets = []
+    while pos < len(aj_str):
+        char = aj_str[pos]
+        if char in _quotes and closing_brackets:
+            pos = _find_closing_quote(aj_str, pos)
+        elif char in _brackets:
+            closing_brackets.append(_brackets[char])
+        elif closing_brackets and char == closing_brackets[-1]:
+            closing_brackets.pop()
+        elif not closing_brackets and (char.isspace() or char == ','):
+            break
+        pos += 1
+    return pos
+
+
+def _to_groups(value: str) -> Union[List, str]:
+    try:
+        return json.loads(value.replace("'", '"'))
+    except ValueError:
+        # kept as it is, the attribute report raises the error with the attribute name
+        return value
+
+
+def _convert(key: str, value: Optional[str]) -> Any:
+    if key == 'required':
+        return value is None or value.lower() != 'false'
+    if value is None:
+        return ''
+    if key == 'groups':
+        return _to_groups(value)
+    return value
+
+
+def parse_aj_annotation(aj_str: str) -> Dict[str, Any]:
+    """
+    Parses the parameters of an @aj annotation into a dict with typed values:
+    `groups` is a list, `required` is a bool and any other parameter is a str.
+
+    Parameters are separated by spaces or commas, and their values can be quoted or not.
+    The `#` are ignored, so annotations can be split in multiple comment lines.
+
+    >>> parse_aj_annotation('@aj(name=firstName, groups=["public", "admin"] required)')
+    {'name': 'firstName', 'groups': ['public', 'admin'], 'required': True}
+    """
+    start = aj_str.index('(') + 1
+    end = aj_str.rindex(')')
+    aj_str = aj_str[start:end].replace('#', '')
+
+    params = {}
+    pos = _skip_separators(aj_str, 0)
+    while pos < len(aj_str):
+        key_end = _read_key(aj_str, pos)
+        key = aj_str[pos:key_end].lower()
+        pos = _skip_spaces(aj_str, key_end)
+        value = None
+        if pos < len(aj_str) and aj_str[pos] == '=':
+            pos = _skip_spaces(aj_str, pos + 1)
+            if pos < len(aj_str) and aj_str[pos] in _quotes:
+                value_end = _find_closing_quote(aj_str, pos)
+                value = aj_str[pos + 1:value_end]
+                pos = value_end + 1
+            else:
+                value_end = _read_unquoted_value(aj_str, pos)
+                value = aj_str[pos:value_end]
+                pos = value_end
+        if key:
+            params[key] = _convert(key, value)
+        pos = _skip_separators(aj_str, pos)
+    return params
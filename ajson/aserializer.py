@@ -1,14 +1,125 @@
-import collections
+import io
 import json
+import os
+import re
 from datetime import datetime
-from typing import Any, Callable, Dict, List, NewType, Optional, Set, Tuple, Type, Union
+from itertools import islice
+from time import perf_counter
+from types import GeneratorType
+from typing import IO, Any, AnyStr, Callable, Dict, FrozenSet, Iterable, Iterator, List, NewType, Optional, Sequence, \
+    Tuple, Type, Union
 
-from ajson.json_type_reports import ISO_FORMAT, JsonTypeReports, _AttrReport, _TypeReport
+from ajson import parallel
+from ajson.backends import JsonBackend, get_backend
+from ajson.datetime_formatter import DatetimeFormatter, compile_datetime_format
+from ajson.decoders import Decoder, compile_decoders
+from ajson.field_classes import get_slots
+from ajson.instrumentation import ClassStats, Instrumentation, PostHook, PreHook
+from ajson.json_stream import JsonSource, iter_json_array
+from ajson.references import ID_KEY, REF_KEY, REFERENCES_IDS, REFERENCES_MEMO, REFERENCES_MODES, \
+    REFERENCES_OFF, ReferenceMemo, add_reference_ids, memoize
+from ajson.throughput import Throughput
+from ajson.validators import VALIDATION_FULL, VALIDATION_MODES, VALIDATION_SAMPLED
+from ajson.json_type_reports import AJsonUnknownKeyError, AJsonUnknownReferenceError, CONSTRUCT_INIT, CONSTRUCT_NEW, \
+    ISO_FORMAT, JsonTypeReports, UNKNOWN_KEYS_ATTRIBUTE, UNKNOWN_KEYS_COLLECT, UNKNOWN_KEYS_ERROR, \
+    UNKNOWN_KEYS_IGNORE, UNKNOWN_KEYS_POLICIES, _AttrReport, _TypeReport, _is_datetime_hint
 
-Groups = NewType('Groups', Optional[List[str]])
+Groups = NewType('Groups', Optional[FrozenSet[str]])
 Handler = NewType('Handler', Callable[[Any, Groups, _AttrReport], Any])
 
 
+_json_encoder = json.JSONEncoder()
+# default of the attributes that may not be set, like the empty slots
+_missing = object()
+_iso_format_regex = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)Z\Z', re.ASCII)
+
+
+def _encode_key(key: Any) -> str:
+    # same conversion json.dumps applies to the keys of a dict
+    if isinstance(key, str):
+        pass
+    elif isinstance(key, float):
+        key = _json_encoder.encode(key)
+    elif key is True:
+        key = 'true'
+    elif key is False:
+        key = 'false'
+    elif key is None:
+        key = 'null'
+    elif isinstance(key, int):
+        key = int.__repr__(key)
+    else:
+        raise TypeError('keys must be str, int, float, bool or None, not {}'.format(key.__class__.__name__))
+    return _json_encoder.encode(key)
+
+
+def _freeze_groups(groups: Optional[List[str]]) -> Groups:
+    # groups are resolved once per call so they can be used as key for the cached serialization plans
+    return None if groups is None else frozenset(groups)
+
+
+def _iter_list_tokens(value: Union[list, tuple]) -> Iterator[Tuple[str, Any]]:
+    return ((', ' if index else '', item) for index, item in enumerate(value))
+
+
+def _iter_dict_tokens(value: dict) -> Iterator[Tuple[str, Any]]:
+    return (((', ' if index else '') + _encode_key(key) + ': ', item)
+            for index, (key, item) in enumerate(value.items()))
+
+
+def _dumps_iterative(document: Any) -> str:
+    """
+    Same as json.dumps, but without recursion, for the documents nested deeper than the recursion limit
+    """
+    parts = []
+    # iterators of the (separator and key, value) pairs of the open containers with their closing character
+    stack = [(iter((('', document),)), '')]
+    while stack:
+        tokens, closing = stack[-1]
+        for prefix, value in tokens:
+            parts.append(prefix)
+            if isinstance(value, dict):
+                parts.append('{')
+                stack.append((_iter_dict_tokens(value), '}'))
+                break
+            elif isinstance(value, (list, tuple)):
+                parts.append('[')
+                stack.append((_iter_list_tokens(value), ']'))
+                break
+            parts.append(_json_encoder.encode(value))
+        else:
+            parts.append(closing)
+            stack.pop()
+    return ''.join(parts)
+
+
+def _get_instance_attributes(obj: object) -> Dict[str, Any]:
+    """
+    Returns the attributes of the objects of the classes without report, from their __dict__ and their slots
+    """
+    instance_dict = getattr(obj, '__dict__', None)
+    attributes = {} if instance_dict is None else {key: value for key, value in instance_dict.items()
+                                                   if not callable(value)}
+    for slot in get_slots(type(obj)):
+        value = getattr(obj, slot, _missing)
+        if value is not _missing and not callable(value):
+            attributes[slot] = value
+    return attributes
+
+
+# engines that convert the objects into serializable dicts
+ENGINE_RECURSIVE = 'recursive'
+ENGINE_ITERATIVE = 'iterative'  # explicit stack, max_depth is not limited by the recursion limit
+ENGINES = (ENGINE_RECURSIVE, ENGINE_ITERATIVE)
+
+# kinds of values of the iterative engine
+_LEAF = 0
+_PRIMITIVE = 1
+_LIST = 2
+_DICT = 3
+_OBJECT = 4
+
+
 class ASerializer:
     """
     Serialize and unserialize objects
@@ -24,11 +135,132 @@ class ASerializer:
     "{"d1": {"d2": "..." }}"
     """
 
-    def __init__(self, max_depth=15, default_datetime_format=ISO_FORMAT):
+    unknown_keys: str
+    """
+    Defines what to do with the json keys that do not match any attribute when unserializing a type with a report.
+
+    - UNKNOWN_KEYS_IGNORE (default): the keys are skipped
+    - UNKNOWN_KEYS_COLLECT: the keys and their raw values are stored in the dict `UNKNOWN_KEYS_ATTRIBUTE` of the object,
+      also in frozen dataclasses and attrs classes. Objects without __dict__ only collect them if their class has a
+      slot named `UNKNOWN_KEYS_ATTRIBUTE`, they are dropped for NamedTuples and the other __slots__ classes
+    - UNKNOWN_KEYS_ERROR: an AJsonUnknownKeyError is raised
+
+    >>> serializer = ASerializer(unknown_keys=UNKNOWN_KEYS_COLLECT)
+    >>> car = serializer.from_dict({'max_speed': 100, 'wings': 2}, Car)
+    >>> getattr(car, UNKNOWN_KEYS_ATTRIBUTE)
+    {'wings': 2}
+    """
+
+    detect_datetimes: bool
+    """
+    If True, every string that matches the datetime format is unserialized as a datetime,
+    otherwise only the attributes with a datetime hint (or with a datetime format) are parsed.
+
+    >>> ASerializer(detect_datetimes=True).unserialize('{"date": "2013-12-31T10:20:34Z"}')
+    {'date': datetime.datetime(2013, 12, 31, 10, 20, 34)}
+    >>> ASerializer().unserialize('{"date": "2013-12-31T10:20:34Z"}')
+    {'date': '2013-12-31T10:20:34Z'}
+    """
+
+    datetime_cache_size: int
+    """
+    Number of formatted datetimes cached per datetime format, useful when the same timestamps are serialized
+    many times. Disabled (0) by default.
+    """
+
+    validation: str
+    """
+    Defines how the unserialized objects are validated against their type hints.
+
+    - VALIDATION_FULL (default): every object and every item of its containers
+    - VALIDATION_SHALLOW: only the top level objects, the items of the containers are not checked
+    - VALIDATION_SAMPLED: the top level objects, but only one every `validation_sample_step` items of the containers
+      (including the nested objects in them) are checked
+    - VALIDATION_OFF: nothing is validated, not even the required attributes. Only for trusted input
+
+    >>> serializer = ASerializer(validation=VALIDATION_SAMPLED, validation_sample_step=100)
+    """
+
+    references: str
+    """
+    Defines what to do with the objects found more than once while serializing (lists, dicts and values with a
+    custom handler are not tracked).
+
+    - REFERENCES_OFF (default): the objects are serialized every time and cycles are cut by max_depth
+    - REFERENCES_MEMO: the serialized dict of an object is built once and reused for the next occurrences,
+      the objects found inside themselves (cycles) are replaced by "..."
+    - REFERENCES_IDS: the serialized objects get an "$id" key and the next occurrences are written as
+      {"$ref": id}. The objects are rebuilt with the same references by from_dict and the unserialize methods
+
+    >>> serializer = ASerializer(references=REFERENCES_IDS)
+    >>> shared = Address()
+    >>> serializer.serialize([shared, shared])
+    '[{"$id": 1, "street": "Broadway"}, {"$ref": 1}]'
+    """
+
+    engine: str
+    """
+    Defines how the objects are converted into dicts and lists before encoding them.
+
+    - ENGINE_RECURSIVE (default): every nested value is converted by a nested call, so `max_depth` has to stay
+      below the recursion limit of the interpreter
+    - ENGINE_ITERATIVE: the lists, dicts and objects are filled from an explicit stack, for documents nested
+      thousands of levels deep. The values with custom handlers and the objects serialized with instrumentation
+      or references are still converted by the recursive engine. serialize_iter and serialize_to always use
+      the recursive engine
+
+    >>> serializer = ASerializer(max_depth=100000, engine=ENGINE_ITERATIVE)
+    """
+
+    backend: JsonBackend
+    """
+    Library used to encode and decode the json documents: 'json' (stdlib), 'orjson', 'ujson', 'rapidjson',
+    'auto' (the fastest one installed) or a JsonBackend instance. By default the one set with
+    ajson.set_default_backend, 'json' if it was not changed. The incremental methods (serialize_iter,
+    serialize_to and unserialize_iter) always use the stdlib json module.
+
+    >>> ASerializer(backend='orjson').serialize({"a": [1, 2]})
+    '{"a":[1,2]}'
+    """
+
+    def __init__(self, max_depth=15, default_datetime_format=ISO_FORMAT, unknown_keys=UNKNOWN_KEYS_IGNORE,
+                 detect_datetimes=False, datetime_cache_size=0, validation=VALIDATION_FULL,
+                 validation_sample_step=10, backend=None, instrumentation=False, references=REFERENCES_OFF,
+                 engine=ENGINE_RECURSIVE):
+        if unknown_keys not in UNKNOWN_KEYS_POLICIES:
+            raise ValueError('unknown_keys has to be one of {}'.format(UNKNOWN_KEYS_POLICIES))
+        if validation not in VALIDATION_MODES:
+            raise ValueError('validation has to be one of {}'.format(VALIDATION_MODES))
+        if references not in REFERENCES_MODES:
+            raise ValueError('references has to be one of {}'.format(REFERENCES_MODES))
+        if engine not in ENGINES:
+            raise ValueError('engine has to be one of {}'.format(ENGINES))
         self.max_depth: int = max_depth
         self.default_datetime_format: str = default_datetime_format
+        self.unknown_keys: str = unknown_keys
+        self.detect_datetimes: bool = detect_datetimes
+        self.datetime_cache_size: int = datetime_cache_size
+        self.validation: str = validation
+        self.validation_sample_step: int = validation_sample_step
+        self.backend: JsonBackend = get_backend(backend)
+        self.references: str = references
+        self._references = ReferenceMemo()
+        self.engine: str = engine
+        self.last_throughput: Optional[Throughput] = None
+        """ counters of the last serialize_many or unserialize_many batch """
         self._serialize_handlers: Dict[Type, Handler] = {}
         self._unserialize_handlers: Dict[Type, Handler] = {}
+        # handler resolved for every concrete type found while serializing
+        self._serialize_dispatch: Dict[Type, Callable[[Any, Groups, int, Optional[_AttrReport]], Any]] = {}
+        self._stream_dispatch: Dict[Type, Callable[[Any, Groups, int, Optional[_AttrReport]], Iterator[str]]] = {}
+        self._iterative_dispatch: Dict[Type, Tuple[int, Callable[[Any, Groups, int, Optional[_AttrReport]], Any]]] = {}
+        self._datetime_formatters: Dict[str, DatetimeFormatter] = {}
+        # list and dict decoders compiled for every hint found while unserializing
+        self._decoders: Dict[Any, Tuple[Optional[Decoder], Optional[Decoder]]] = {}
+        # reports of the top level containers by hint, their items are validated with them like attribute items
+        self._container_reports: Dict[Any, _AttrReport] = {}
+        self._instrumentation: Optional[Instrumentation] = Instrumentation() if instrumentation else None
+        self._disabled_instrumentation: Optional[Instrumentation] = None
 
     def add_serialize_handler(self, _type: Type, handler: Handler):
         """
@@ -42,6 +274,60 @@ class ASerializer:
         '0'
         """
         self._serialize_handlers[_type] = handler
+        self._serialize_dispatch.clear()
+        self._stream_dispatch.clear()
+        self._iterative_dispatch.clear()
+
+    def enable_instrumentation(self, enabled: bool = True):
+        """
+        Starts (or stops) recording the stats of the serialized objects, see `stats`.
+        The stats and hooks are kept while it is disabled.
+        """
+        if enabled and self._instrumentation is None:
+            self._instrumentation = self._disabled_instrumentation or Instrumentation()
+        elif not enabled and self._instrumentation is not None:
+            self._disabled_instrumentation = self._instrumentation
+            self._instrumentation = None
+        self._serialize_dispatch.clear()
+        self._stream_dispatch.clear()
+        self._iterative_dispatch.clear()
+
+    def stats(self) -> Dict[Tuple[Type, Groups], ClassStats]:
+        """
+        Returns a copy of the stats of the objects serialized since the instrumentation was enabled (or reset),
+        by class and group set. Only available with `instrumentation=True`, it is empty otherwise.
+        Objects serialized by the workers of serialize_parallel are not counted.
+
+        >>> serializer = ASerializer(instrumentation=True)
+        >>> serializer.serialize(Car(140, 'ford'), groups=['basic'])
+        >>> serializer.stats()
+        {(<class 'Car'>, frozenset({'basic'})): <ClassStats calls=1 seconds=0.000012 attributes=1 ...>}
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.snapshot()
+
+    def reset_stats(self):
+        if self._instrumentation is not None:
+            self._instrumentation.stats.clear()
+
+    def add_hooks(self, pre: Optional[PreHook] = None, post: Optional[PostHook] = None):
+        """
+        Adds functions called before and after serializing every object of a class (with or without report) or
+        every value with a custom handler. It enables the instrumentation.
+
+        :param pre: called with (obj, groups, depth)
+        :param post: called with (obj, groups, depth, serialized value, seconds)
+
+        >>> serializer = ASerializer()
+        >>> serializer.add_hooks(post=lambda obj, groups, depth, value, seconds: metrics.timing(
+        ...     type(obj).__name__, seconds))
+        """
+        self.enable_instrumentation()
+        if pre is not None:
+            self._instrumentation.pre_hooks.append(pre)
+        if post is not None:
+            self._instrumentation.post_hooks.append(post)
 
     def add_unserialize_handler(self, _type: Type, handler: Handler):
         """
@@ -79,7 +365,12 @@ class ASerializer:
         '{"room_num": 3, "square_meters": 100}'
 
         """
-        return json.dumps(self._to_dict_recursive(obj, groups, 0))
+        document = self._with_references(self._to_dict, obj, _freeze_groups(groups), 0)
+        try:
+            return self.backend.dumps(document)
+        except RecursionError:
+            # only reachable with the iterative engine, the recursive one can't build documents this deep
+            return _dumps_iterative(document)
 
     def to_dict(self, obj, groups: Optional[List[str]] = None) -> Union[Dict[str, Any], List]:
         """
@@ -104,72 +395,430 @@ class ASerializer:
         {"max_speed": 140, "brand": 7}
 
         """
-        return self._to_dict_recursive(obj, groups, 0)
+        return self._with_references(self._to_dict, obj, _freeze_groups(groups), 0)
+
+    def serialize_iter(self, obj, groups: Optional[List[str]] = None, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Same as serialize, but the json string is generated incrementally in chunks of around `chunk_size` characters.
+        Lists, tuples, sets and generators are consumed lazily, so the whole serialized structure never exists in memory
+
+        :param obj: Object to be serialize
+        :param groups: list of groups that determines what attributes should be serialize
+        :param chunk_size: minimum size of the yielded chunks (except the last one)
+
+        >>> serializer = ASerializer()
+        >>> ''.join(serializer.serialize_iter({"numbers": (i for i in range(3))}))
+        '{"numbers": [0, 1, 2]}'
+        """
+        previous_objects = self._references.objects
+        self._references.objects = {}
+        try:
+            buffer = []
+            buffer_size = 0
+            for token in self._iter_encode(obj, _freeze_groups(groups), 0):
+                buffer.append(token)
+                buffer_size += len(token)
+                if buffer_size >= chunk_size:
+                    yield ''.join(buffer)
+                    buffer = []
+                    buffer_size = 0
+            if buffer:
+                yield ''.join(buffer)
+        finally:
+            self._references.objects = previous_objects
+
+    def serialize_to(self, obj, fp: IO, groups: Optional[List[str]] = None, chunk_size: int = 65536):
+        """
+        Serializes the obj incrementally into the text or binary stream `fp`
+
+        :param obj: Object to be serialize
+        :param fp: text or binary file-like object to write in. Binary streams get utf-8 encoded json
+        :param groups: list of groups that determines what attributes should be serialize
+        :param chunk_size: minimum size of the chunks written into `fp`
+
+        >>> serializer = ASerializer()
+        >>> with open('numbers.json', 'w') as fp:
+        ...    serializer.serialize_to(range(10), fp)
+        """
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', '')
+        for chunk in self.serialize_iter(obj, groups, chunk_size):
+            fp.write(chunk.encode('utf-8') if binary else chunk)
+
+    def _to_dict(self, obj, groups: Groups = None, depth=0):
+        if self.engine == ENGINE_ITERATIVE:
+            return self._to_dict_iterative(obj, groups, depth)
+        return self._to_dict_recursive(obj, groups, depth)
+
+    def _to_dict_iterative(self, obj, groups: Groups = None, depth=0, attr_report: _AttrReport = None):
+        """
+        Same result as `_to_dict_recursive`, but the lists, dicts and objects are filled from a stack of frames
+        instead of nested calls. Every container is added to its parent before its items, to keep the order of keys
+        """
+        dispatch = self._iterative_dispatch
+        max_depth = self.max_depth
+        root = []
+        # frames: (container being filled, iterator of its (key, value, attr_report) items, depth of the items)
+        stack = [(root, iter(((None, obj, attr_report),)), depth + 1)]
+        while stack:
+            container, items, item_depth = stack[-1]
+            for key, value, value_report in items:
+                if item_depth > max_depth:
+                    if self._instrumentation is not None:
+                        self._instrumentation.truncated(type(value), groups)
+                    serialized = '...'
+                    child_items = None
+                else:
+                    value_type = type(value)
+                    entry = dispatch.get(value_type)
+                    if entry is None:
+                        entry = self._resolve_iterative_kind(value_type)
+                    kind, handler = entry
+                    child_items = None
+                    if kind == _PRIMITIVE:
+                        serialized = value
+                    elif kind == _LEAF:
+                        serialized = handler(value, groups, item_depth, value_report)
+                    elif kind == _LIST:
+                        serialized = []
+                        child_items = ((None, item, None) for item in value)
+                    elif kind == _DICT:
+                        serialized = {}
+                        child_items = ((item_key, item, None) for item_key, item in value.items()
+                                       if not str(item_key).startswith('_'))
+                    else:
+                        serialized = {}
+                        child_items = iter(self.__get_object_items(value, groups))
+                # dicts can have a None key, so the lists are recognized by their type
+                if container.__class__ is list:
+                    container.append(serialized)
+                else:
+                    container[key] = serialized
+                if child_items is not None:
+                    stack.append((serialized, child_items, item_depth + 1))
+                    break
+            else:
+                stack.pop()
+        return root[0]
 
-    def _to_dict_recursive(self, obj, groups: Optional[List[str]] = None, depth=0, attr_report: _AttrReport = None):
+    def _resolve_iterative_kind(self, obj_type: Type) -> Tuple[int, Callable[[Any, Groups, int,
+                                                                              Optional[_AttrReport]], Any]]:
+        handler = self._serialize_dispatch.get(obj_type)
+        if handler is None:
+            handler = self._resolve_serialize_handler(obj_type)
+
+        if handler == self.__primitive_handler:
+            kind = _PRIMITIVE
+        elif handler == self.__list_handler:
+            kind = _LIST
+        elif handler == self.__dict_handler:
+            kind = _DICT
+        elif handler == self.__object_handler:
+            kind = _OBJECT
+        else:
+            # datetimes, custom handlers and the wrapped object handlers
+            kind = _LEAF
+        self._iterative_dispatch[obj_type] = (kind, handler)
+        return kind, handler
+
+    def _to_dict_recursive(self, obj, groups: Groups = None, depth=0, attr_report: _AttrReport = None):
         depth += 1
         if depth > self.max_depth:
+            if self._instrumentation is not None:
+                self._instrumentation.truncated(type(obj), groups)
             return '...'
-        for class_ in self._serialize_handlers:
-            if isinstance(obj, class_):
-                return self._serialize_handlers[class_](obj, groups, attr_report)
-        if obj is None:
-            return None
-        elif isinstance(obj, (int, str, float)):
-            return obj
-        elif isinstance(obj, datetime):
-            return self.__datetime_handler(obj, attr_report)
-        elif isinstance(obj, (list, tuple, set)):
-            return self.__list_handler(obj, groups, depth)
-        elif isinstance(obj, dict):
-            return self.__dict_handler(obj, groups, depth)
+        obj_type = type(obj)
+        handler = self._serialize_dispatch.get(obj_type)
+        if handler is None:
+            handler = self._resolve_serialize_handler(obj_type)
+        return handler(obj, groups, depth, attr_report)
+
+    def _resolve_serialize_handler(self, obj_type: Type) -> Callable[[Any, Groups, int, Optional[_AttrReport]], Any]:
+        custom_handler = self._find_custom_serialize_handler(obj_type)
+        if custom_handler is not None:
+            def handler(obj, groups, depth, attr_report):
+                return custom_handler(obj, groups, attr_report)
+
+            if self._instrumentation is not None:
+                handler = self._instrumentation.wrap(obj_type, handler, custom=True)
+        elif obj_type is type(None) or issubclass(obj_type, (int, str, float)):
+            handler = self.__primitive_handler
+        elif issubclass(obj_type, datetime):
+            handler = self.__datetime_handler
+        elif issubclass(obj_type, (list, tuple, set, frozenset, GeneratorType)) and not (
+                # the registered named tuples are serialized as objects
+                issubclass(obj_type, tuple) and JsonTypeReports().get(obj_type) is not None):
+            handler = self.__list_handler
+        elif issubclass(obj_type, dict):
+            handler = self.__dict_handler
         else:
-            return self.__object_handler(obj, groups, depth)
+            # the stream encoder doesn't recognize the wrapped handlers, so these objects are not streamed
+            handler = self.__object_handler
+            if self._instrumentation is not None:
+                handler = self._instrumentation.wrap(obj_type, handler, custom=False)
+            if self.references == REFERENCES_MEMO:
+                handler = memoize(handler, self._references, self.__cycle_handler)
+            elif self.references == REFERENCES_IDS:
+                handler = add_reference_ids(handler, self._references)
+        self._serialize_dispatch[obj_type] = handler
+        return handler
 
-    def __list_handler(self, obj: list, groups: Optional[List[str]], depth: int):
-        serialized_list = []
-        obj = list(obj)
-        for item in obj:
-            serialized_list.append(self._to_dict_recursive(item, groups=groups, depth=depth))
-        return serialized_list
-
-    def __dict_handler(self,
-                       obj: dict,
-                       groups: Optional[List[str]],
-                       depth,
-                       class_report: Optional[_TypeReport] = None
-                       ):
+    def _find_custom_serialize_handler(self, obj_type: Type) -> Optional[Handler]:
+        # the most specific class in the MRO wins
+        for class_ in obj_type.__mro__:
+            if class_ in self._serialize_handlers:
+                return self._serialize_handlers[class_]
+        # handlers for abstract classes can match types that don't have them in the MRO
+        for class_, handler in self._serialize_handlers.items():
+            if issubclass(obj_type, class_):
+                return handler
+        return None
+
+    def __primitive_handler(self, obj: Union[int, str, float, None], groups: Groups, depth: int,
+                            attr_report: Optional[_AttrReport] = None):
+        return obj
+
+    def __list_handler(self, obj: list, groups: Groups, depth: int, attr_report: Optional[_AttrReport] = None):
+        return [self._to_dict_recursive(item, groups, depth) for item in obj]
+
+    def __dict_handler(self, obj: dict, groups: Groups, depth, attr_report: Optional[_AttrReport] = None):
         serialized_dict = {}
         for key, value in obj.items():
             # we don't want to serialize private attributes if we don't have a class report
-            if class_report is not None or not str(key).startswith('_'):
-                if class_report is None:
-                    attr_report = None
-                else:
-                    attr_report = class_report.get(key)
-                    key = attr_report.name
-                serialized_dict[key] = self._to_dict_recursive(value, groups, depth, attr_report)
+            if not str(key).startswith('_'):
+                serialized_dict[key] = self._to_dict_recursive(value, groups, depth)
         return serialized_dict
 
-    def __datetime_handler(self, obj: datetime, attr_report: Optional[_AttrReport] = None) -> str:
+    def __datetime_handler(self, obj: datetime, groups: Groups, depth: int,
+                           attr_report: Optional[_AttrReport] = None) -> str:
         datetime_format = self.get_date_time_format(attr_report)
+        formatter = self._datetime_formatters.get(datetime_format)
+        if formatter is None:
+            formatter = compile_datetime_format(datetime_format, self.datetime_cache_size)
+            self._datetime_formatters[datetime_format] = formatter
+        return formatter(obj)
 
-        return obj.strftime(datetime_format)
-
-    def __object_handler(self, obj: object, groups: Optional[List[str]], depth):
-        class_report = JsonTypeReports().reports.get(obj.__class__, None)
+    def __get_object_items(self, obj: object, groups: Groups) -> List[Tuple[str, Any, Optional[_AttrReport]]]:
+        """
+        Returns the (serialized name, value, attribute report) of the attributes of `obj` serialized with `groups`,
+        shared by the recursive, streaming and iterative engines
+        """
+        class_report = JsonTypeReports().get(obj.__class__)
         if class_report is None:
-            attributes = {key: value for key, value in obj.__dict__.items()
-                          if not isinstance(value, collections.Callable) and
-                          not 'key'.startswith('_')}
-            return self.__dict_handler(attributes, groups, depth)
-        attributes_to_serialize = class_report.get_attribute_names(groups)
-        if attributes_to_serialize is None:
-            attributes_to_serialize = (k for k in (*obj.__dict__.keys(), *obj.__class__.__dict__.keys()) if
-                                       not k.startswith('_'))
-
-        attributes = {key: getattr(obj, key) for key in attributes_to_serialize}
-        return self.__dict_handler(attributes, groups, depth, class_report)
+            # we don't want to serialize private attributes if we don't have a class report
+            return [(key, value, None) for key, value in _get_instance_attributes(obj).items()
+                    if not str(key).startswith('_')]
+
+        if groups is None and class_report.scan_instance_dict:
+            # instance attributes can't be part of the plan, they are discovered in every object
+            instance_dict = obj.__dict__
+            items = []
+            for key, value in instance_dict.items():
+                if not key.startswith('_'):
+                    attr_report = class_report.get(key)
+                    items.append((attr_report.name, value, attr_report))
+            for key, getter, attr_report in class_report.get_serialization_plan(None):
+                if key not in instance_dict:
+                    items.append((attr_report.name, getter(obj), attr_report))
+            return items
+        return [(attr_report.name, getter(obj), attr_report)
+                for _, getter, attr_report in class_report.get_serialization_plan(groups)]
+
+    def __object_handler(self, obj: object, groups: Groups, depth, attr_report: Optional[_AttrReport] = None):
+        serialized_dict = {}
+        for name, value, attr_report in self.__get_object_items(obj, groups):
+            serialized_dict[name] = self._to_dict_recursive(value, groups, depth, attr_report)
+        return serialized_dict
+
+    def serialize_many(self, objs: Iterable, fp: IO, groups: Optional[List[str]] = None) -> Throughput:
+        """
+        Serializes every object of `objs` as a line of json (JSON Lines) into the text or binary stream `fp`
+
+        :param objs: iterable with the objects to be serialize, it is consumed lazily
+        :param fp: text or binary file-like object to write in
+        :param groups: list of groups that determines what attributes should be serialize
+        :return: the throughput counters of the batch, also available in `last_throughput`
+
+        >>> serializer = ASerializer()
+        >>> with open('numbers.jsonl', 'w') as fp:
+        ...    serializer.serialize_many([{"a": 1}, {"a": 2}], fp)
+        <Throughput records=2 bytes=18 ...>
+        """
+        frozen_groups = _freeze_groups(groups)
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', '')
+        self.last_throughput = throughput = Throughput()
+        start = perf_counter()
+        records = 0
+        size = 0
+        # the binary streams get the bytes of the backend without decoding them
+        dump = self.backend.dumpb if binary else self.backend.dumps
+        new_line = b'\n' if binary else '\n'
+        for obj in objs:
+            line = dump(self._with_references(self._to_dict, obj, frozen_groups, 0)) + new_line
+            fp.write(line)
+            records += 1
+            size += len(line)
+        throughput.add(records, size, start)
+        return throughput
+
+    def serialize_parallel(self, objs: Sequence, groups: Optional[List[str]] = None, workers: Optional[int] = None,
+                           chunk_size: Optional[int] = None, lines: bool = False,
+                           parallel_threshold: int = 10000) -> str:
+        """
+        Same as serialize for a list, but the objects are serialized in chunks by a pool of processes.
+        The serializer (including its handlers) and the registered reports are sent once to every worker,
+        so they must be picklable.
+
+        :param objs: sequence of objects to be serialize
+        :param groups: list of groups that determines what attributes should be serialize
+        :param workers: number of processes, os.cpu_count() by default
+        :param chunk_size: number of objects serialized per task, by default 4 tasks per worker are created
+        :param lines: if True, the result is JSON Lines (one json per object) instead of a json array
+        :param parallel_threshold: below this number of objects everything is done in the current process
+
+        >>> serializer = ASerializer()
+        >>> serializer.serialize_parallel(list(range(100000)), workers=8)[:16]
+        '[0, 1, 2, 3, 4, '
+        """
+        if len(objs) < parallel_threshold or workers == 1 or self.references == REFERENCES_IDS:
+            if lines:
+                return ''.join(self.serialize(obj, groups) + '\n' for obj in objs)
+            return self.serialize(list(objs), groups)
+        return parallel.serialize_parallel(self, objs, _freeze_groups(groups), workers, chunk_size, lines)
+
+    def unserialize_parallel(self, json_source: Union[str, os.PathLike], _type: Optional[Type] = None,
+                             workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                             parallel_threshold: int = 1 << 20) -> List:
+        """
+        Same as unserialize for a json array, but the array is split in chunks of elements that are unserialized and
+        validated by a pool of processes. The objects are returned in order.
+        The serializer (including its handlers) and the registered reports are sent once to every worker,
+        so they must be picklable.
+
+        :param json_source: json text with an array, or the path (os.PathLike like pathlib.Path) of a file with it.
+                            str values are always json text
+        :param _type: type of the resulting list (List[T]) or of its items (T)
+        :param workers: number of processes, os.cpu_count() by default
+        :param chunk_size: characters of json per task, by default 4 tasks per worker are created
+        :param parallel_threshold: below this number of characters everything is done in the current process
+
+        >>> serializer = ASerializer()
+        >>> customers = serializer.unserialize_parallel(Path('customers.json'), List[Customer], workers=8)
+        """
+        if isinstance(json_source, os.PathLike):
+            with open(json_source) as fp:
+                json_source = fp.read()
+        if getattr(_type, '__origin__', None) in (list, List):
+            _type = _type.__args__[0] if getattr(_type, '__args__', None) else None
+        if len(json_source) < parallel_threshold or workers == 1 or self.references == REFERENCES_IDS:
+            # the references can point to items of other chunks, so they are unserialized in the same process
+            items = self.backend.loads(json_source)
+            if not isinstance(items, list):
+                raise json.JSONDecodeError("Expecting '['", json_source, len(json_source) - len(json_source.lstrip()))
+            # the items are validated like the items of a top level list
+            return self._with_references(self._from_dict_recursive, items, None if _type is None else List[_type])
+        return parallel.unserialize_parallel(self, json_source, _type, workers, chunk_size)
+
+    def __getstate__(self):
+        # the resolved handlers are bound methods and closures, they are resolved again after unpickling
+        state = self.__dict__.copy()
+        state['_serialize_dispatch'] = {}
+        state['_stream_dispatch'] = {}
+        state['_iterative_dispatch'] = {}
+        state['_datetime_formatters'] = {}
+        state['_decoders'] = {}
+        state['_container_reports'] = {}
+        state['last_throughput'] = None
+        # the hooks don't need to be picklable, the workers run without instrumentation
+        state['_instrumentation'] = None
+        state['_disabled_instrumentation'] = None
+        del state['_references']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._references = ReferenceMemo()
+
+    def _with_references(self, function: Callable, *args, **kwargs):
+        """
+        Calls `function` with a new memo of the objects found, if references are tracked
+        """
+        if self.references == REFERENCES_OFF:
+            return function(*args, **kwargs)
+        previous_objects = self._references.objects
+        self._references.objects = {}
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._references.objects = previous_objects
+
+    def __cycle_handler(self, obj: object, groups: Groups) -> str:
+        if self._instrumentation is not None:
+            self._instrumentation.truncated(type(obj), groups)
+        return '...'
+
+    def _iter_encode(self, obj, groups: Groups = None, depth=0, attr_report: _AttrReport = None) -> Iterator[str]:
+        depth += 1
+        if depth > self.max_depth:
+            if self._instrumentation is not None:
+                self._instrumentation.truncated(type(obj), groups)
+            return iter(('"..."',))
+        obj_type = type(obj)
+        encoder = self._stream_dispatch.get(obj_type)
+        if encoder is None:
+            encoder = self._resolve_stream_encoder(obj_type)
+        return encoder(obj, groups, depth, attr_report)
+
+    def _resolve_stream_encoder(self, obj_type: Type) -> Callable[[Any, Groups, int, Optional[_AttrReport]],
+                                                                  Iterator[str]]:
+        handler = self._serialize_dispatch.get(obj_type)
+        if handler is None:
+            handler = self._resolve_serialize_handler(obj_type)
+
+        if handler == self.__list_handler:
+            encoder = self.__iter_list
+        elif handler == self.__dict_handler:
+            encoder = self.__iter_dict
+        elif handler == self.__object_handler:
+            encoder = self.__iter_object
+        else:
+            def encoder(obj, groups, depth, attr_report):
+                return iter((_json_encoder.encode(handler(obj, groups, depth, attr_report)),))
+        self._stream_dispatch[obj_type] = encoder
+        return encoder
+
+    def __iter_list(self, obj: Iterable, groups: Groups, depth: int,
+                    attr_report: Optional[_AttrReport] = None) -> Iterator[str]:
+        separator = '['
+        for item in obj:
+            yield separator
+            yield from self._iter_encode(item, groups, depth)
+            separator = ', '
+        yield '[]' if separator == '[' else ']'
+
+    def __iter_dict(self, obj: dict, groups: Groups, depth: int,
+                    attr_report: Optional[_AttrReport] = None) -> Iterator[str]:
+        separator = '{'
+        for key, value in obj.items():
+            if not str(key).startswith('_'):
+                yield separator
+                yield _encode_key(key)
+                yield ': '
+                yield from self._iter_encode(value, groups, depth)
+                separator = ', '
+        yield '{}' if separator == '{' else '}'
+
+    def __iter_object(self, obj: object, groups: Groups, depth: int,
+                      attr_report: Optional[_AttrReport] = None) -> Iterator[str]:
+        # the attributes are collected first so repeated serialized names behave like in `to_dict`
+        attributes = {name: (value, attr_report) for name, value, attr_report in self.__get_object_items(obj, groups)}
+        separator = '{'
+        for name, (value, attr_report) in attributes.items():
+            yield separator
+            yield _encode_key(name)
+            yield ': '
+            yield from self._iter_encode(value, groups, depth, attr_report)
+            separator = ', '
+        yield '{}' if separator == '{' else '}'
 
     def unserialize(self, json_str: str, _type: Optional[Type] = None, *init_args_array, **init_kargs) -> Any:
         """
@@ -194,7 +843,76 @@ class ASerializer:
         >>> house.square_meters
         50
         """
-        return self.from_dict(json.loads(json_str), _type, *init_args_array, **init_kargs)
+        return self.from_dict(self.backend.loads(json_str), _type, *init_args_array, **init_kargs)
+
+    def unserialize_iter(self, json_source: JsonSource, _type: Optional[Type] = None, *init_args_array,
+                         **init_kargs) -> Iterator[Any]:
+        """
+        Same as unserialize for a json array, but the array is parsed incrementally and its items are
+        yielded one at a time as objects of type `_type`
+
+        :param json_source: json text, text or binary file-like object or iterable of text chunks with a json array
+        :param _type: Resulting type of every item of the array
+        :param init_args_array: construct args list to initialize the objects with type `_type`
+        :param init_kargs: construct args to initialize the objects with type `_type`
+
+        >>> from ajson import AJson
+        >>> serializer = ASerializer()
+        >>> @AJson()
+        ... class House:
+        ...    rooms_num: int  # @aj()
+
+        >>> with open('houses.json') as fp:
+        ...    for house in serializer.unserialize_iter(fp, House):
+        ...        print(house.rooms_num)
+        """
+        # the items of the array share the memo of references
+        previous_objects = self._references.objects
+        self._references.objects = {}
+        try:
+            for item in iter_json_array(json_source):
+                yield self._from_dict_recursive(item, _type, None, *init_args_array, **init_kargs)
+        finally:
+            self._references.objects = previous_objects
+
+    def unserialize_many(self, json_lines: Iterable[AnyStr], _type: Optional[Type] = None, *init_args_array,
+                         **init_kargs) -> Iterator[Any]:
+        """
+        Creates an object with the type `_type` from every line of json (JSON Lines), blank lines are skipped.
+        The throughput counters of the batch are available in `last_throughput`
+
+        :param json_lines: text or binary file-like object or any iterable of json lines
+        :param _type: Resulting type of the objects to construct
+        :param init_args_array: construct args list to initialize the objects with type `_type`
+        :param init_kargs: construct args to initialize the objects with type `_type`
+
+        >>> from ajson import AJson
+        >>> serializer = ASerializer()
+        >>> @AJson()
+        ... class House:
+        ...    rooms_num: int  # @aj()
+
+        >>> houses = list(serializer.unserialize_many(['{"rooms_num": 1}', '{"rooms_num": 2}'], House))
+        >>> serializer.last_throughput.records
+        2
+        """
+        self.last_throughput = throughput = Throughput()
+        # the report is resolved once for the whole batch if the records can't be changed by a handler
+        type_report = JsonTypeReports().get(_type)
+        if any(issubclass(dict, class_) for class_ in self._unserialize_handlers) or self.references == REFERENCES_IDS:
+            type_report = None
+        for line in json_lines:
+            if not line.strip():
+                continue
+            start = perf_counter()
+            record = self.backend.loads(line)
+            if type_report is not None and type(record) is dict:
+                obj = self._unserialize_obj(_type, record, init_args_array, init_kargs, type_report)
+            else:
+                obj = self._with_references(self._from_dict_recursive, record, _type, None, *init_args_array,
+                                            **init_kargs)
+            throughput.add(1, len(line), start)
+            yield obj
 
     def from_dict(self, dict_obj: Any, _type: Optional[Type] = None, *init_args_array, **init_kargs) -> Any:
         """
@@ -220,7 +938,7 @@ class ASerializer:
         'Jeep'
         """
 
-        return self._from_dict_recursive(dict_obj, _type, *init_args_array, **init_kargs)
+        return self._with_references(self._from_dict_recursive, dict_obj, _type, None, *init_args_array, **init_kargs)
 
     def _from_dict_recursive(self, dict_obj: Any, _type: Optional[Type] = None, attr_report: _AttrReport = None,
                              *init_args_array, **init_kargs) -> Any:
@@ -229,36 +947,152 @@ class ASerializer:
             if isinstance(dict_obj, class_):
                 return self._unserialize_handlers[class_](dict_obj, attr_report)
         if isinstance(dict_obj, (list, tuple, set)):
-            return self._unserialize_list(_type, dict_obj, init_args_array, init_kargs)
+            return self._unserialize_list(_type, dict_obj, init_args_array, init_kargs, attr_report)
         elif isinstance(dict_obj, dict):
-            return self._unserialize_obj(_type, dict_obj, init_args_array, init_kargs)
+            return self._unserialize_obj(_type, dict_obj, init_args_array, init_kargs, attr_report=attr_report)
         elif isinstance(dict_obj, str):
-            return self._unserialize_str_or_date(attr_report, dict_obj)
+            return self._unserialize_str_or_date(attr_report, dict_obj, _type)
 
         return dict_obj
 
-    def _unserialize_obj(self, _type: Optional[Type], dict_obj: Any, init_args_array, init_kargs):
-        type_report = JsonTypeReports().reports.get(_type, None)
+    def _unserialize_obj(self, _type: Optional[Type], dict_obj: Any, init_args_array, init_kargs,
+                         type_report: Optional[_TypeReport] = None, attr_report: Optional[_AttrReport] = None):
+        if _type is not None:
+            dict_decoder = self._get_decoders(_type)[1]
+            if dict_decoder is not None:
+                if attr_report is None:
+                    return self._unserialize_container(dict_decoder, _type, dict_obj, init_args_array, init_kargs)
+                return dict_decoder(dict_obj, attr_report, init_args_array, init_kargs)
+        # attr_report is only None for the top level objects, the nested ones (also the items of the top level
+        # containers) are validated with their parent
+        validate = self.validation == VALIDATION_FULL or attr_report is None
+        reference_id = None
+        if self.references == REFERENCES_IDS:
+            if REF_KEY in dict_obj:
+                return self.__get_reference(dict_obj[REF_KEY])
+            if ID_KEY in dict_obj:
+                reference_id = dict_obj[ID_KEY]
+                dict_obj = {key: value for key, value in dict_obj.items() if key != ID_KEY}
+        if type_report is None:
+            type_report = JsonTypeReports().get(_type)
         if type_report is None or _type is None:
-            return {k: self._from_dict_recursive(v) for k, v in dict_obj.items()}
-        result_obj = _type(*init_args_array, **init_kargs)
-        for key, value in dict_obj.items():
-            try:
-                attr_report = type_report.get_by_serialize_name_or_default(key)
-            except StopIteration:
-                # do nothing if report is not found
-                continue
-            result_dict = self._from_dict_recursive(value, _type=attr_report.hint, attr_report=attr_report)
-            if hasattr(result_obj, attr_report.attribute_name) or attr_report.hint is not None:
-                setattr(result_obj, attr_report.attribute_name, result_dict)
+            if reference_id is None:
+                return {k: self._from_dict_recursive(v) for k, v in dict_obj.items()}
+            result_dict = self._references.objects[reference_id] = {}
+            result_dict.update((k, self._from_dict_recursive(v)) for k, v in dict_obj.items())
+            return result_dict
+        unknown_keys = None if self.unknown_keys == UNKNOWN_KEYS_IGNORE else {}
+        if type_report.construct == CONSTRUCT_INIT:
+            result_obj = _type(*init_args_array, **init_kargs)
+            if reference_id is not None:
+                # registered before its attributes, so they can reference it
+                self._references.objects[reference_id] = result_obj
+            for key, value in dict_obj.items():
+                attr_report = type_report.get_by_serialize_name(key)
+                if attr_report is None:
+                    # keys of attributes serialized with another name are unknown too
+                    if key in type_report.report_map or not hasattr(result_obj, key):
+                        if unknown_keys is not None:
+                            unknown_keys[key] = value
+                        continue
+                    # the entity got that attr dynamically
+                    attr_report = type_report.get(key)
+                result_dict = self._from_dict_recursive(value, _type=attr_report.hint, attr_report=attr_report)
+                if hasattr(result_obj, attr_report.attribute_name) or attr_report.hint is not None or \
+                        attr_report.attribute_name in type_report.slots:
+                    setattr(result_obj, attr_report.attribute_name, result_dict)
+        else:
+            result_obj = self._construct_obj(_type, type_report, dict_obj, init_args_array, init_kargs, reference_id,
+                                             unknown_keys)
+
+        if unknown_keys is not None:
+            self._handle_unknown_keys(result_obj, unknown_keys)
+        if validate:
+            type_report.validate_instance(result_obj, self.validation, self.validation_sample_step)
+        return result_obj
 
-        type_report.validate_instance(result_obj)
+    def _construct_obj(self, _type: Type, type_report: _TypeReport, dict_obj: Dict[str, Any], init_args_array,
+                       init_kargs, reference_id: Any, unknown_keys: Optional[Dict[str, Any]]) -> Any:
+        """
+        Creates the objects of the types with the "new" and "kwargs" construct strategies, all the attributes are
+        unserialized before adding them to the object
+        """
+        result_obj = None
+        if type_report.construct == CONSTRUCT_NEW:
+            result_obj = _type.__new__(_type)
+            if reference_id is not None:
+                self._references.objects[reference_id] = result_obj
+        attributes = {}
+        for key, value in dict_obj.items():
+            attr_report = type_report.get_by_serialize_name(key)
+            if attr_report is None:
+                # there is no object to get the attributes added by __init__ from, only the class ones and the
+                # arguments of __init__ are known
+                if key in type_report.report_map or not (hasattr(_type, key) or key in (type_report.init_names or ())):
+                    if unknown_keys is not None:
+                        unknown_keys[key] = value
+                    continue
+                attr_report = type_report.get(key)
+            attributes[attr_report.attribute_name] = self._from_dict_recursive(value, _type=attr_report.hint,
+                                                                              attr_report=attr_report)
+        if result_obj is None:
+            init_names = type_report.init_names
+            if init_names is None:
+                # the construct args are added to (and win over) the unserialized attributes
+                result_obj = _type(*init_args_array, **{**attributes, **init_kargs})
+            else:
+                kwargs = {init_names[name]: value for name, value in attributes.items() if name in init_names}
+                result_obj = _type(*init_args_array, **{**kwargs, **init_kargs})
+            # the attributes are unserialized before the object exists, so only the objects after it can reference it
+            if reference_id is not None:
+                self._references.objects[reference_id] = result_obj
+            if init_names is not None:
+                for name, value in attributes.items():
+                    if name not in init_names and name not in type_report.read_only_names:
+                        # attributes that are not arguments of __init__, the frozen classes don't allow setattr
+                        object.__setattr__(result_obj, name, value)
+            return result_obj
+        if type_report.descriptor_names.isdisjoint(attributes):
+            result_obj.__dict__.update(attributes)
+        else:
+            # the slots and properties are set one by one, the objects with only slots don't have a __dict__
+            for name, value in attributes.items():
+                if name in type_report.descriptor_names:
+                    setattr(result_obj, name, value)
+                else:
+                    result_obj.__dict__[name] = value
         return result_obj
 
-    def _unserialize_str_or_date(self, attr_report: _AttrReport, dict_obj: Any) -> Any:
-        # check if it is a date time
+    def __get_reference(self, reference_id: Any) -> Any:
+        try:
+            return self._references.objects[reference_id]
+        except KeyError:
+            raise AJsonUnknownReferenceError('unknown reference "{}"'.format(reference_id))
+
+    def _handle_unknown_keys(self, result_obj: Any, unknown_keys: Dict[str, Any]):
+        if self.unknown_keys == UNKNOWN_KEYS_COLLECT:
+            try:
+                # object.__setattr__ skips the __setattr__ of the frozen classes
+                object.__setattr__(result_obj, UNKNOWN_KEYS_ATTRIBUTE, unknown_keys)
+            except AttributeError:
+                # objects without __dict__ (NamedTuples and __slots__ classes) without a slot for the unknown keys
+                pass
+        elif self.unknown_keys == UNKNOWN_KEYS_ERROR and unknown_keys:
+            error_text = 'unknown keys for type "{0}": {1}'
+            raise AJsonUnknownKeyError(error_text.format(type(result_obj).__name__, ', '.join(map(str, unknown_keys))))
+
+    def _unserialize_str_or_date(self, attr_report: _AttrReport, dict_obj: Any, _type: Optional[Type] = None) -> Any:
+        # the datetimes are parsed for the attributes hinted as datetime, and for the values with a datetime hint, like
+        # the top level ones or the items of the containers
+        if (attr_report is None or not attr_report.parse_datetime) and not self.detect_datetimes and \
+                (_type is None or _type is str or not _is_datetime_hint(_type)):
+            return dict_obj
         datetime_format = self.get_date_time_format(attr_report)
         try:
+            if datetime_format == ISO_FORMAT:
+                matches = _iso_format_regex.match(dict_obj)
+                if matches is not None:
+                    return datetime(*map(int, matches.groups()))
             return datetime.strptime(dict_obj, datetime_format)
         except ValueError:
             return dict_obj
@@ -272,18 +1106,49 @@ class ASerializer:
             datetime_format = self.default_datetime_format
         return datetime_format
 
-    def _unserialize_list(self, _type: Optional[Type], dict_obj: Any, init_args_array, init_kargs) -> Any:
-        if _type is None:
-            return [self._from_dict_recursive(item, _type, *init_args_array, **init_kargs) for item in dict_obj]
-        list_type = None
-        if _type is not None and getattr(_type, '__args__', None) is not None and len(_type.__args__) > 0:
-            list_type = _type.__args__[0]
-
-        if issubclass(_type, List):
-            return [self._from_dict_recursive(item, list_type, *init_args_array, **init_kargs) for item in dict_obj]
-        elif issubclass(_type, Set):
-            return {self._from_dict_recursive(item, list_type, *init_args_array, **init_kargs) for item in dict_obj}
-        elif issubclass(_type, Tuple):
-            return (self._from_dict_recursive(item, list_type, *init_args_array, **init_kargs) for item in dict_obj)
-        else:
-            return [self._from_dict_recursive(item, _type, *init_args_array, **init_kargs) for item in dict_obj]
+    def _unserialize_list(self, _type: Optional[Type], dict_obj: Any, init_args_array, init_kargs,
+                          attr_report: Optional[_AttrReport] = None) -> Any:
+        if _type is not None:
+            list_decoder = self._get_decoders(_type)[0]
+            if list_decoder is not None:
+                if attr_report is None:
+                    return self._unserialize_container(list_decoder, _type, dict_obj, init_args_array, init_kargs)
+                return list_decoder(dict_obj, attr_report, init_args_array, init_kargs)
+            if attr_report is None and isinstance(_type, type):
+                # a top level list of objects, like with List[_type]
+                return self._unserialize_list(List[_type], dict_obj, init_args_array, init_kargs)
+        # no hint or a class hint, the items are unserialized with it
+        return [self._from_dict_recursive(item, _type, attr_report, *init_args_array, **init_kargs)
+                for item in dict_obj]
+
+    def _unserialize_container(self, decoder: Decoder, _type: Type, dict_obj: Any, init_args_array,
+                               init_kargs) -> Any:
+        # the items of the top level containers are decoded like the items of an attribute hinted with _type, so
+        # they are only validated when they are created with the full validation
+        container_report = self._container_reports.get(_type)
+        if container_report is None:
+            container_report = self._container_reports[_type] = _AttrReport('', hint=_type)
+        result = decoder(dict_obj, container_report, init_args_array, init_kargs)
+        if self.validation == VALIDATION_SAMPLED:
+            self._validate_sampled_items(result)
+        return result
+
+    def _validate_sampled_items(self, container: Any):
+        # one every validation_sample_step items of the container and of its nested containers
+        step = self.validation_sample_step
+        for item in islice(container.values() if isinstance(container, dict) else container, 0, None, step):
+            type_report = JsonTypeReports().get(type(item))
+            if type_report is not None:
+                type_report.validate_instance(item, VALIDATION_SAMPLED, step)
+            elif isinstance(item, (list, tuple, set, frozenset, dict)):
+                self._validate_sampled_items(item)
+
+    def _get_decoders(self, _type: Type) -> Tuple[Optional[Decoder], Optional[Decoder]]:
+        decoders = self._decoders.get(_type)
+        if decoders is None:
+            decoders = self._decoders[_type] = compile_decoders(_type, self._decode)
+        return decoders
+
+    def _decode(self, dict_obj: Any, _type: Optional[Type], attr_report: Optional[_AttrReport], init_args_array,
+                init_kargs) -> Any:
+        return self._from_dict_recursive(dict_obj, _type, attr_report, *init_args_array, **init_kargs)
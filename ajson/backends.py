@@ -0,0 +1,159 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+Default = Optional[Callable[[Any], Any]]
+
+# backend of the serializers created without one
+_default_backend = 'json'
+
+
+class JsonBackend(object):
+    """
+    Encodes and decodes json documents with the stdlib json module, the other backends override it.
+
+    The backends only differ in the whitespaces and escaped characters of their output, so their documents are
+    always decoded to the same values. `default` is called with the objects the backend can't encode
+    and has to return an encodable value or raise a TypeError, like in json.dumps.
+    """
+    name = 'json'
+    # separator of the items of the arrays in the output of dumps, used to join the arrays encoded in parts
+    item_separator = ', '
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        return json.dumps(obj, default=default)
+
+    def dumpb(self, obj: Any, default: Default = None) -> bytes:
+        """
+        Same as dumps, but returns the utf-8 encoded document
+        """
+        return self.dumps(obj, default).encode('utf-8')
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        return json.loads(document)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self.name)
+
+
+class OrjsonBackend(JsonBackend):
+    name = 'orjson'
+    item_separator = ','
+
+    @staticmethod
+    def is_available() -> bool:
+        return orjson is not None
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        return self.dumpb(obj, default).decode('utf-8')
+
+    def dumpb(self, obj: Any, default: Default = None) -> bytes:
+        try:
+            # the keys that are not strings are converted like in json.dumps
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson only supports 64 bits integers
+            return json.dumps(obj, default=default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        return orjson.loads(document)
+
+
+class UjsonBackend(JsonBackend):
+    name = 'ujson'
+    item_separator = ','
+
+    @staticmethod
+    def is_available() -> bool:
+        return ujson is not None
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        if default is None:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, default=default)
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        return ujson.loads(document)
+
+
+class RapidjsonBackend(JsonBackend):
+    name = 'rapidjson'
+    item_separator = ','
+
+    @staticmethod
+    def is_available() -> bool:
+        return rapidjson is not None
+
+    def dumps(self, obj: Any, default: Default = None) -> str:
+        return rapidjson.dumps(obj, default=default, ensure_ascii=False,
+                               mapping_mode=rapidjson.MM_COERCE_KEYS_TO_STRINGS)
+
+    def loads(self, document: Union[str, bytes]) -> Any:
+        return rapidjson.loads(document)
+
+
+# ordered from the fastest to the slowest, 'auto' uses the first one installed
+BACKENDS: Dict[str, Type[JsonBackend]] = {
+    'orjson': OrjsonBackend,
+    'rapidjson': RapidjsonBackend,
+    'ujson': UjsonBackend,
+    'json': JsonBackend,
+}
+
+
+def available_backends() -> List[str]:
+    """
+    Returns the names of the backends that can be used, the ones whose library is installed
+    """
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def set_default_backend(backend: str):
+    """
+    Sets the backend of the serializers created without one, 'json' (stdlib) until it is changed
+
+    >>> set_default_backend('auto')
+    """
+    global _default_backend
+    get_backend(backend)
+    _default_backend = backend
+
+
+def get_backend(backend: Union[str, JsonBackend, None] = None) -> JsonBackend:
+    """
+    Returns the backend with the name `backend`: 'json' (stdlib), 'orjson', 'ujson', 'rapidjson'
+    or 'auto', the fastest one installed. With None, the default backend is returned (see set_default_backend)
+    and JsonBackend instances are returned as they are.
+
+    >>> get_backend('auto')
+    <OrjsonBackend orjson>
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+    if backend is None:
+        backend = _default_backend
+    if backend == 'auto':
+        backend = available_backends()[0]
+    if backend not in BACKENDS:
+        raise ValueError('backend has to be one of {} or auto'.format(tuple(BACKENDS)))
+    if not BACKENDS[backend].is_available():
+        raise ImportError('the {} backend requires the {} package'.format(backend, backend))
+    return BACKENDS[backend]()
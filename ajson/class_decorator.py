@@ -1,11 +1,78 @@
-from ajson.json_type_reports import JsonTypeReports
+from types import ModuleType
+from typing import Optional, Union
+
+from ajson.json_type_reports import CONSTRUCT_STRATEGIES, JsonTypeReports
 from ajson.type_inspector import TypeInspector
 
 
-def AJson():
+def AJson(lazy: bool = False, construct: Optional[str] = None):
+    """
+    Registers the class in the serializer, reading the @aj annotations of its source. The dataclasses, attrs
+    classes and NamedTuples are registered from their fields instead, with the @aj options in the "aj" key of the
+    field metadata (or in a `__aj__` dict of the class by field name), so their source is not needed.
+
+    >>> @AJson()
+    ... @dataclass
+    ... class Customer:
+    ...     name: str = field(metadata={'aj': {'name': 'firstName', 'groups': ['public']}})
+    ...     email: str = field(default=None, metadata={'aj': '@aj(groups=["admin"])'})
+
+    :param lazy: if True, the class is inspected the first time it is serialized or unserialized
+        instead of when it is defined, see `warm_up` to inspect it before that
+    :param construct: how the objects are created when they are unserialized
+
+        - "init" (default for most classes): the class is called with the construct args and the attributes are
+          set one by one
+        - "new": __init__ is not called, the attributes are added to the __dict__ of the object at once (the
+          properties and slots are still set one by one). Only the attributes in the report (annotated, hinted
+          or defined in the class) are unserialized, and the missing ones fall back to the class attributes
+        - "kwargs" (default for the dataclasses, attrs classes and NamedTuples): the class is called with the
+          unserialized attributes as keyword arguments, named like the attributes (or like the fields in the
+          constructor) and not like their serialized names. The objects can't be referenced by their own attributes
+          with ASerializer(references=REFERENCES_IDS)
+
+    >>> @AJson(construct='kwargs')
+    ... class Point:
+    ...     x: int
+    ...     y: int
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    """
+    if construct is not None and construct not in CONSTRUCT_STRATEGIES:
+        raise ValueError('construct has to be one of {}'.format(CONSTRUCT_STRATEGIES))
+
     def wrapper(cls: type):
-        report = TypeInspector().inspect_type(cls)
-        JsonTypeReports().add(cls, report)
+        if lazy:
+            JsonTypeReports().add_lazy(cls, lambda: TypeInspector().inspect_type(cls), construct)
+        else:
+            report = TypeInspector().inspect_type(cls)
+            JsonTypeReports().add(cls, report, construct)
         return cls
 
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def _is_in_module(_type: type, module: ModuleType) -> bool:
+    return _type.__module__ == module.__name__ or _type.__module__.startswith(module.__name__ + '.')
+
+
+def warm_up(*classes_or_modules: Union[type, ModuleType]):
+    """
+    Inspects the lazy @AJson classes right away, so prefork servers can do it before forking and share the
+    reports with the workers. The modules (or packages) warm up all their lazy classes, and calling it without
+    arguments warms up every lazy class registered so far.
+
+    >>> import ajson, models
+    >>> ajson.warm_up(models)
+    """
+    if not classes_or_modules:
+        JsonTypeReports().resolve_pending()
+        return
+    types = []
+    modules = []
+    for class_or_module in classes_or_modules:
+        (modules if isinstance(class_or_module, ModuleType) else types).append(class_or_module)
+    if modules:
+        pending = list(JsonTypeReports().pending)
+        types.extend(_type for _type in pending if any(_is_in_module(_type, module) for module in modules))
+    JsonTypeReports().resolve_pending(types)
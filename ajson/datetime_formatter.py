@@ -0,0 +1,93 @@
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, Optional
+
+from ajson.json_type_reports import ISO_FORMAT
+
+DatetimeFormatter = Callable[[datetime], str]
+
+# directives that only depend on a numeric attribute of the datetime
+_directives: Dict[str, tuple] = {
+    'Y': ('%d', 'year'),
+    'm': ('%02d', 'month'),
+    'd': ('%02d', 'day'),
+    'H': ('%02d', 'hour'),
+    'M': ('%02d', 'minute'),
+    'S': ('%02d', 'second'),
+    'f': ('%06d', 'microsecond'),
+}
+
+
+def _format_iso(value: datetime) -> str:
+    if value.year < 1000:
+        return value.strftime(ISO_FORMAT)
+    return '%d-%02d-%02dT%02d:%02d:%02dZ' % (value.year, value.month, value.day,
+                                              value.hour, value.minute, value.second)
+
+
+def _compile_template(datetime_format: str) -> Optional[DatetimeFormatter]:
+    template = []
+    attributes = []
+    pos = 0
+    while pos < len(datetime_format):
+        char = datetime_format[pos]
+        if char != '%':
+            template.append(char)
+            pos += 1
+            continue
+        directive = datetime_format[pos + 1: pos + 2]
+        if directive == '%':
+            template.append('%%')
+        elif directive in _directives:
+            template.append(_directives[directive][0])
+            attributes.append(_directives[directive][1])
+        else:
+            # locale, timezone or platform dependent directives are left to strftime
+            return None
+        pos += 2
+
+    if not attributes:
+        return None
+    template = ''.join(template)
+    if len(attributes) > 1:
+        getter = attrgetter(*attributes)
+    else:
+        attribute_getter = attrgetter(attributes[0])
+
+        def getter(value: datetime) -> tuple:
+            return attribute_getter(value),
+
+    if 'year' not in attributes:
+        return lambda value: template % getter(value)
+
+    def formatter(value: datetime) -> str:
+        # strftime doesn't pad years before 1000 the same way in every platform
+        if value.year < 1000:
+            return value.strftime(datetime_format)
+        return template % getter(value)
+
+    return formatter
+
+
+def compile_datetime_format(datetime_format: str, cache_size: int = 0) -> DatetimeFormatter:
+    """
+    Returns a function that formats datetimes exactly like `datetime.strftime(datetime_format)`, but faster
+    for the formats made of %Y, %m, %d, %H, %M, %S and %f directives
+
+    :param datetime_format: strftime format
+    :param cache_size: if greater than 0, the last `cache_size` formatted datetimes are cached
+    """
+    if datetime_format == ISO_FORMAT:
+        formatter = _format_iso
+    else:
+        formatter = _compile_template(datetime_format)
+        if formatter is None:
+            def formatter(value: datetime) -> str:
+                return value.strftime(datetime_format)
+
+    if cache_size > 0:
+        # equal aware datetimes can have different fields, so the tzinfo is part of the key
+        cached_formatter = lru_cache(maxsize=cache_size)(lambda value, tzinfo: formatter(value))
+        return lambda value: cached_formatter(value, value.tzinfo)
+    return formatter
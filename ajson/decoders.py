@@ -0,0 +1,93 @@
+from inspect import isclass
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
+
+# decodes a json list or dict with the attr_report of the attribute and the construct args of the items
+Decoder = Callable[[Any, Any, tuple, dict], Any]
+# the serializer function that decodes any json value with a hint: (value, hint, attr_report, args, kwargs)
+Decode = Callable[[Any, Optional[Type], Any, tuple, dict], Any]
+
+_bool_keys = {'true': True, 'false': False}
+
+
+def _compile_key_decoder(hint: Optional[Type]) -> Optional[Callable[[str], Any]]:
+    # json keys are always strings, dumps converts the int, float and bool keys into their json literal
+    if hint is bool:
+        return lambda key: _bool_keys.get(key, key)
+    if hint in (int, float):
+        def key_decoder(key: str) -> Any:
+            try:
+                return hint(key)
+            except ValueError:
+                return key
+
+        return key_decoder
+    return None
+
+
+def _compile_sequence(container: type, args: Tuple, decode: Decode) -> Decoder:
+    if container is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        if args == ((),):
+            args = ()
+        if args:
+            # fixed size tuples, the extra items are decoded without hint and rejected by the validation
+            hints = args
+
+            def tuple_decoder(value, attr_report, init_args_array, init_kargs):
+                return tuple(decode(item, hints[index] if index < len(hints) else None, attr_report,
+                                    init_args_array, init_kargs) for index, item in enumerate(value))
+
+            return tuple_decoder
+
+    item_hint = args[0] if args else None
+    if container is list:
+        return lambda value, attr_report, init_args_array, init_kargs: [
+            decode(item, item_hint, attr_report, init_args_array, init_kargs) for item in value]
+    return lambda value, attr_report, init_args_array, init_kargs: container(
+        decode(item, item_hint, attr_report, init_args_array, init_kargs) for item in value)
+
+
+def _compile_mapping(args: Tuple, decode: Decode) -> Decoder:
+    key_decoder = _compile_key_decoder(args[0]) if args else None
+    value_hint = args[1] if len(args) > 1 else None
+    if key_decoder is None:
+        return lambda value, attr_report, init_args_array, init_kargs: {
+            key: decode(item, value_hint, attr_report, init_args_array, init_kargs) for key, item in value.items()}
+    return lambda value, attr_report, init_args_array, init_kargs: {
+        key_decoder(key): decode(item, value_hint, attr_report, init_args_array, init_kargs)
+        for key, item in value.items()}
+
+
+def compile_decoders(hint: Optional[Type], decode: Decode) -> Tuple[Optional[Decoder], Optional[Decoder]]:
+    """
+    Compiles a type hint into the functions that decode the json lists and the json dicts with that hint, so the
+    hint is only inspected once. None means the hint doesn't apply to that kind of value and it is decoded as
+    usual, like the lists with a class hint (a list of objects) or the dicts with a class hint (an object)
+
+    :param hint: type hint of the decoded value
+    :param decode: function that decodes the items with their own hint
+    :return: the decoder of the lists and the decoder of the dicts
+    """
+    origin = getattr(hint, '__origin__', None)
+    args = tuple(arg for arg in getattr(hint, '__args__', None) or () if not isinstance(arg, TypeVar))
+    if origin is Union:
+        hints = [arg for arg in args if arg is not type(None)]
+        if len(hints) != 1:
+            return None, None
+        # Optional[X] values are decoded as X
+        optional_hint = hints[0]
+
+        def optional_decoder(value, attr_report, init_args_array, init_kargs):
+            return decode(value, optional_hint, attr_report, init_args_array, init_kargs)
+
+        return optional_decoder, optional_decoder
+
+    # python 3.6 generics keep the builtin type in __extra__
+    container = getattr(hint, '__extra__', None) or origin or hint
+    if not isclass(container):
+        return None, None
+    if issubclass(container, dict):
+        return None, _compile_mapping(args, decode)
+    for sequence_type in (list, frozenset, set, tuple):
+        if issubclass(container, sequence_type):
+            return _compile_sequence(sequence_type, args, decode), None
+    return None, None
@@ -0,0 +1,94 @@
+"""
+Classes that describe their own fields (dataclasses, attrs classes and NamedTuples), their reports are built from
+the fields instead of parsing their source. Also the slots of the classes with __slots__.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, get_type_hints
+
+try:
+    import dataclasses
+except ImportError:  # python 3.6
+    dataclasses = None
+
+# key of the field metadata with the @aj options, like field(metadata={'aj': {'name': 'firstName'}})
+AJ_METADATA_KEY = 'aj'
+# class attribute with the @aj options of every field, for the NamedTuples that have no field metadata
+AJ_CLASS_METADATA = '__aj__'
+
+Field = NamedTuple('Field', [
+    ('name', str),
+    ('hint', Any),
+    ('metadata', Any),  # the @aj options, a dict or an "@aj(...)" string
+    ('init_name', Optional[str]),  # keyword of the field in the constructor, None if it is not a constructor arg
+])
+
+
+def is_named_tuple(_type: Type) -> bool:
+    return isinstance(_type, type) and issubclass(_type, tuple) and hasattr(_type, '_fields')
+
+
+def _get_type_hints(_type: Type) -> Dict[str, Any]:
+    # the annotations are strings with "from __future__ import annotations" or when they are quoted
+    try:
+        return get_type_hints(_type)
+    except NameError:
+        # a name that can't be resolved, the fields keep their raw type
+        return {}
+
+
+def _get_dataclass_fields(_type: Type, class_metadata: dict) -> List[Field]:
+    hints = _get_type_hints(_type)
+    return [Field(field.name, hints.get(field.name, field.type),
+                  field.metadata.get(AJ_METADATA_KEY, class_metadata.get(field.name)),
+                  field.name if field.init else None)
+            for field in dataclasses.fields(_type)]
+
+
+def _get_attrs_fields(_type: Type, class_metadata: dict) -> List[Field]:
+    hints = _get_type_hints(_type)
+    fields = []
+    for attribute in _type.__attrs_attrs__:
+        # attrs removes the leading underscores of the private attributes in the constructor
+        init_name = getattr(attribute, 'alias', None) or attribute.name.lstrip('_')
+        fields.append(Field(attribute.name, hints.get(attribute.name, attribute.type),
+                            attribute.metadata.get(AJ_METADATA_KEY, class_metadata.get(attribute.name)),
+                            init_name if attribute.init else None))
+    return fields
+
+
+def _get_named_tuple_fields(_type: Type, class_metadata: dict) -> List[Field]:
+    annotations = getattr(_type, '__annotations__', {})
+    return [Field(name, annotations.get(name), class_metadata.get(name), name) for name in _type._fields]
+
+
+def get_fields(_type: Type) -> Optional[List[Field]]:
+    """
+    Returns the fields of the dataclasses, attrs classes and NamedTuples, None for any other class
+    """
+    class_metadata = vars(_type).get(AJ_CLASS_METADATA) or {}
+    if dataclasses is not None and dataclasses.is_dataclass(_type):
+        return _get_dataclass_fields(_type, class_metadata)
+    if getattr(_type, '__attrs_attrs__', None) is not None:
+        return _get_attrs_fields(_type, class_metadata)
+    if is_named_tuple(_type):
+        return _get_named_tuple_fields(_type, class_metadata)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_slots(_type: Type) -> Tuple[str, ...]:
+    """
+    Returns the slots of `_type` and its parents (parents first), without __dict__ and __weakref__
+    """
+    slots = []
+    for class_ in reversed(_type.__mro__):
+        class_slots = vars(class_).get('__slots__', ())
+        if isinstance(class_slots, str):
+            class_slots = (class_slots,)
+        for name in class_slots:
+            if name.startswith('__') and not name.endswith('__'):
+                # private names are mangled with the name of the class
+                name = '_{}{}'.format(class_.__name__.lstrip('_'), name)
+            if name not in ('__dict__', '__weakref__') and name not in slots:
+                slots.append(name)
+    return tuple(slots)
@@ -0,0 +1,83 @@
+from copy import copy
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+PreHook = Callable[[Any, Optional[FrozenSet[str]], int], None]
+PostHook = Callable[[Any, Optional[FrozenSet[str]], int, Any, float], None]
+SerializeHandler = Callable[[Any, Optional[FrozenSet[str]], int, Any], Any]
+
+
+class ClassStats(object):
+    """
+    Counters of the objects of a class serialized with a group set
+    """
+
+    def __init__(self):
+        self.calls: int = 0
+        """ number of serialized objects """
+        self.seconds: float = 0.0
+        """ cumulative time serializing the objects, including their nested objects """
+        self.attributes: int = 0
+        """ number of serialized attributes """
+        self.handler_hits: int = 0
+        """ objects serialized by a custom handler (added with add_serialize_handler) """
+        self.max_depth: int = 0
+        """ deepest level where an object of the class was found """
+        self.truncations: int = 0
+        """ objects replaced by "..." because they were deeper than max_depth """
+
+    def __repr__(self):
+        return '<ClassStats calls={} seconds={:.6f} attributes={} handler_hits={} max_depth={} truncations={}>'.format(
+            self.calls, self.seconds, self.attributes, self.handler_hits, self.max_depth, self.truncations)
+
+
+class Instrumentation(object):
+    """
+    Collects the ClassStats of a serializer and calls its hooks. The serializer only wraps its handlers with it
+    while the instrumentation is enabled, so it costs nothing when it is disabled
+    """
+
+    def __init__(self):
+        self.stats: Dict[Tuple[Type, Optional[FrozenSet[str]]], ClassStats] = {}
+        self.pre_hooks: List[PreHook] = []
+        self.post_hooks: List[PostHook] = []
+
+    def get_stats(self, _type: Type, groups: Optional[FrozenSet[str]]) -> ClassStats:
+        class_stats = self.stats.get((_type, groups))
+        if class_stats is None:
+            class_stats = self.stats[(_type, groups)] = ClassStats()
+        return class_stats
+
+    def snapshot(self) -> Dict[Tuple[Type, Optional[FrozenSet[str]]], ClassStats]:
+        return {key: copy(class_stats) for key, class_stats in self.stats.items()}
+
+    def truncated(self, _type: Type, groups: Optional[FrozenSet[str]]):
+        self.get_stats(_type, groups).truncations += 1
+
+    def wrap(self, _type: Type, handler: SerializeHandler, custom: bool) -> SerializeHandler:
+        """
+        Returns `handler` recording the stats of `_type` and calling the hooks around it
+        """
+        pre_hooks = self.pre_hooks
+        post_hooks = self.post_hooks
+
+        def instrumented_handler(obj, groups, depth, attr_report):
+            for hook in pre_hooks:
+                hook(obj, groups, depth)
+            start = perf_counter()
+            result = handler(obj, groups, depth, attr_report)
+            seconds = perf_counter() - start
+            class_stats = self.get_stats(_type, groups)
+            class_stats.calls += 1
+            class_stats.seconds += seconds
+            if custom:
+                class_stats.handler_hits += 1
+            if isinstance(result, dict):
+                class_stats.attributes += len(result)
+            if depth > class_stats.max_depth:
+                class_stats.max_depth = depth
+            for hook in post_hooks:
+                hook(obj, groups, depth, result, seconds)
+            return result
+
+        return instrumented_handler
@@ -0,0 +1,140 @@
+import codecs
+import json
+import re
+from json.decoder import WHITESPACE
+from typing import IO, Any, AnyStr, Iterable, Iterator, List, Union
+
+JsonSource = Union[AnyStr, IO, Iterable[AnyStr]]
+
+# strings are matched whole so the brackets and commas inside them are skipped
+_array_structure_regex = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{},]', re.DOTALL)
+
+
+def _iter_text_chunks(source: JsonSource, chunk_size: int) -> Iterator[str]:
+    if isinstance(source, (str, bytes)):
+        chunks = (source,)
+    elif hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    # bytes are decoded incrementally so multi-byte characters can be split between chunks
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = utf8_decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    chunk = utf8_decoder.decode(b'', final=True)
+    if chunk:
+        yield chunk
+
+
+class _JsonArrayReader(object):
+    def __init__(self, source: JsonSource, chunk_size: int):
+        self.chunks = _iter_text_chunks(source, chunk_size)
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def read_more(self) -> bool:
+        # at least doubles the pending text, so huge elements are not decoded over and over
+        pending = self.buffer[self.pos:]
+        new_chunks = []
+        new_size = 0
+        while not self.eof and new_size <= len(pending):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.eof = True
+            else:
+                new_chunks.append(chunk)
+                new_size += len(chunk)
+        self.buffer = pending + ''.join(new_chunks)
+        self.pos = 0
+        return new_size > 0
+
+    def next_char(self) -> str:
+        """
+        Skips the whitespaces and returns the next character without consuming it, '' at the end of the input
+        """
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.read_more():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str, what: str) -> str:
+        char = self.next_char()
+        if char == '' or char not in chars:
+            raise json.JSONDecodeError('Expecting {}'.format(what), self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def decode_value(self) -> Any:
+        self.next_char()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.read_more():
+                    continue
+                raise
+            # a value followed by the end of the buffer could be truncated (numbers, literals)
+            if self.eof or WHITESPACE.match(self.buffer, end).end() < len(self.buffer):
+                self.pos = end
+                return value
+            self.read_more()
+
+
+def iter_json_array(source: JsonSource, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Decodes a top-level json array incrementally, yielding its elements one at a time
+
+    :param source: json text, a text or binary file-like object or an iterable of str/bytes chunks
+    :param chunk_size: number of characters (or bytes) read from file-like objects at once
+    """
+    reader = _JsonArrayReader(source, chunk_size)
+    reader.expect('[', "'['")
+    if reader.next_char() == ']':
+        reader.pos += 1
+    else:
+        while True:
+            yield reader.decode_value()
+            if reader.expect(',]', "',' delimiter") == ']':
+                break
+    if reader.next_char() != '':
+        raise json.JSONDecodeError('Extra data', reader.buffer, reader.pos)
+
+
+def split_json_array(text: str, chunk_size: int) -> List[str]:
+    """
+    Splits the text of a top-level json array in chunks of consecutive elements of around `chunk_size` characters.
+    Every chunk is a valid json array once it is wrapped in brackets. The elements themselves are not validated
+
+    :param text: json text with an array
+    :param chunk_size: minimum number of characters of every chunk (except the last one)
+    """
+    start = WHITESPACE.match(text, 0).end()
+    if text[start:start + 1] != '[':
+        raise json.JSONDecodeError("Expecting '['", text, start)
+    chunks = []
+    chunk_start = start + 1
+    depth = 0
+    for match in _array_structure_regex.finditer(text, start):
+        pos = match.start()
+        char = text[pos]
+        if char == '[' or char == '{':
+            depth += 1
+        elif char == ']' or char == '}':
+            depth -= 1
+            if depth == 0:
+                if text[chunk_start:pos].strip():
+                    chunks.append(text[chunk_start:pos])
+                end = WHITESPACE.match(text, pos + 1).end()
+                if end != len(text):
+                    raise json.JSONDecodeError('Extra data', text, end)
+                return chunks
+        elif char == ',' and depth == 1 and pos - chunk_start >= chunk_size:
+            chunks.append(text[chunk_start:pos])
+            chunk_start = pos + 1
+    raise json.JSONDecodeError('Unterminated array', text, start)
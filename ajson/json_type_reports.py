@@ -1,13 +1,30 @@
 import json
-from inspect import isfunction
-from typing import Dict, List, Optional, Set, Type
-
-from typeguard import check_type
+import threading
+from datetime import datetime
+from inspect import Parameter, isclass, isfunction, signature
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
 
+from ajson.field_classes import Field, get_fields, get_slots, is_named_tuple
 from ajson.singleton import Singleton
+from ajson.validators import VALIDATION_FULL, VALIDATION_OFF, VALIDATION_SAMPLED, Validator, compile_validator
 
 ISO_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
+# policies for json keys that do not match any attribute of the type being unserialized
+UNKNOWN_KEYS_IGNORE = 'ignore'
+UNKNOWN_KEYS_COLLECT = 'collect'
+UNKNOWN_KEYS_ERROR = 'error'
+UNKNOWN_KEYS_POLICIES = (UNKNOWN_KEYS_IGNORE, UNKNOWN_KEYS_COLLECT, UNKNOWN_KEYS_ERROR)
+# attribute where the unknown keys are stored with the UNKNOWN_KEYS_COLLECT policy
+UNKNOWN_KEYS_ATTRIBUTE = '_ajson_unknown_keys'
+
+# how the objects of a type are created when they are unserialized
+CONSTRUCT_INIT = 'init'  # calls the class with the construct args and sets the attributes one by one
+CONSTRUCT_NEW = 'new'  # skips __init__, the attributes are added to the __dict__ of the object in bulk
+CONSTRUCT_KWARGS = 'kwargs'  # calls the class with the attributes as keyword arguments
+CONSTRUCT_STRATEGIES = (CONSTRUCT_INIT, CONSTRUCT_NEW, CONSTRUCT_KWARGS)
+
 
 class AJsonAnnotationParseError(Exception):
     pass
@@ -21,63 +38,241 @@ class AJsonEmptyRequiredAttributeError(AJsonValidationError):
     pass
 
 
+class AJsonUnknownKeyError(AJsonValidationError):
+    pass
+
+
+class AJsonUnknownReferenceError(AJsonValidationError):
+    pass
+
+
+def _get_init_names(_type: Type) -> Optional[Dict[str, str]]:
+    # keyword arguments of the constructor of the classes without fields, None if it accepts any keyword
+    if _type.__init__ is object.__init__:
+        return {}
+    try:
+        parameters = signature(_type).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(parameter.kind == Parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return {parameter.name: parameter.name for parameter in parameters
+            if parameter.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)}
+
+
+def _is_datetime_hint(hint: Optional[Type]) -> bool:
+    # Optional[datetime], List[datetime]...
+    if getattr(hint, '__args__', None):
+        return any(_is_datetime_hint(arg) for arg in hint.__args__)
+    return isclass(hint) and issubclass(hint, datetime)
+
+
 class _AttrReport(object):
+    """
+    Immutable report of an attribute, use `replace` to get a modified copy
+    """
+    __slots__ = ('groups', 'name', 'datetime_format', 'attribute_name', 'required', 'hint', 'parse_datetime',
+                 '_validators')
+
     def __init__(self, attribute_name: str, hint: Optional[Type], **kwargs):
-        self.groups: Optional[Set[str]] = kwargs.get('groups', None)
-        self.name: str = kwargs.get('name', attribute_name)
-        self.datetime_format: str = kwargs.get('d_format', None)  # iso format
-        self.attribute_name: str = attribute_name
-        self.required: str = kwargs.get('required', 'false')
-
-        self.hint: Type = hint
-
-        if self.groups is not None:
-            self.groups = set(json.loads(self.groups))
-            for group in self.groups:
-                if not isinstance(group, (str, int)):
+        groups = kwargs.get('groups', None)
+        required = kwargs.get('required', False)
+        if groups is not None:
+            if isinstance(groups, str):
+                try:
+                    groups = json.loads(groups)
+                except ValueError:
                     raise AJsonAnnotationParseError('unable to parse groups for attribute "{}"'.format(attribute_name))
-        self.required = self.required.lower() != 'false'
+            if not isinstance(groups, (list, set, frozenset)) or \
+                    not all(isinstance(group, (str, int)) for group in groups):
+                raise AJsonAnnotationParseError('unable to parse groups for attribute "{}"'.format(attribute_name))
+            groups = frozenset(groups)
+        if isinstance(required, str):
+            required = required.lower() != 'false'
+
+        _set = object.__setattr__
+        _set(self, 'groups', groups)  # type: Optional[FrozenSet[str]]
+        _set(self, 'name', kwargs.get('name', attribute_name))  # type: str
+        _set(self, 'datetime_format', kwargs.get('d_format', None))  # type: Optional[str]
+        _set(self, 'attribute_name', attribute_name)  # type: str
+        _set(self, 'required', required)  # type: bool
+        _set(self, 'hint', hint)  # type: Optional[Type]
+        _set(self, 'parse_datetime', self.is_datetime())  # type: bool
+        # the only mutable part, a cache of the compiled validators
+        _set(self, '_validators', {})  # type: Dict[Tuple[str, int], Validator]
+
+    def __setattr__(self, key, value):
+        raise AttributeError('attribute reports are immutable, use replace to modify "{}"'.format(key))
+
+    def replace(self, **changes) -> '_AttrReport':
+        """
+        Returns a copy of the report with the `changes` (attribute_name, hint, groups, name, d_format, required)
+        """
+        kwargs = {'groups': self.groups, 'name': self.name, 'd_format': self.datetime_format,
+                  'required': self.required, **changes}
+        return _AttrReport(kwargs.pop('attribute_name', self.attribute_name), kwargs.pop('hint', self.hint), **kwargs)
+
+    def is_datetime(self) -> bool:
+        """
+        Whether the strings of this attribute have to be parsed as datetimes:
+        it has a datetime format or it is hinted as datetime (or Optional[datetime])
+        """
+        return self.datetime_format is not None or _is_datetime_hint(self.hint)
+
+    def __getstate__(self):
+        # compiled validators are closures, they are compiled again after unpickling
+        state = {key: getattr(self, key) for key in self.__slots__}
+        state['_validators'] = {}
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+    def __repr__(self):
+        return '<_AttrReport {} name={} hint={} groups={}>'.format(self.attribute_name, self.name, self.hint,
+                                                                  self.groups)
+
+    def get_validator(self, validation: str = VALIDATION_FULL, sample_step: int = 1) -> Validator:
+        """
+        Returns the validator of the hint for the validation mode, it is compiled only once
+        """
+        validator = self._validators.get((validation, sample_step))
+        if validator is None:
+            object_validator = None
+            if validation == VALIDATION_SAMPLED:
+                # nested objects are not validated when they are created, only the sampled ones are validated here
+                def object_validator(value):
+                    type_report = JsonTypeReports().get(type(value))
+                    if type_report is not None:
+                        type_report.validate_instance(value, validation, sample_step)
+                    return True
+            validator = compile_validator(self.hint, validation, sample_step, object_validator)
+            self._validators[(validation, sample_step)] = validator
+        return validator
+
+
+# reports of the attributes without annotations or hints, shared by all the types
+_default_reports: Dict[str, _AttrReport] = {}
+
+
+def _get_default_report(attribute_name: str) -> _AttrReport:
+    report = _default_reports.get(attribute_name)
+    if report is None:
+        report = _default_reports.setdefault(attribute_name, _AttrReport(attribute_name, None))
+    return report
+
+
+PlanEntry = Tuple[str, Callable[[object], object], _AttrReport]
 
 
 class _TypeReport(object):
-    def __init__(self, attr_reports: Dict[str, _AttrReport], hint: Type):
+    def __init__(self, attr_reports: Dict[str, _AttrReport], hint: Type, construct: str = CONSTRUCT_INIT,
+                 fields: Optional[List[Field]] = None, slots: Tuple[str, ...] = ()):
         self.report_map: Dict[str, _AttrReport] = attr_reports
         self.hint = hint
+        self.construct: str = construct
+        # fields of the dataclasses, attrs classes and NamedTuples, their objects are serialized from them
+        self.fields: Optional[Tuple[str, ...]] = None if fields is None else tuple(field.name for field in fields)
+        # the private fields are only serialized without groups if they have @aj options
+        self._public_fields: Tuple[str, ...] = tuple(
+            field.name for field in fields or () if not field.name.startswith('_') or field.metadata is not None)
+        # slots of the class and its parents, the objects without __dict__ are serialized from the plan only
+        self.slots: FrozenSet[str] = frozenset(slots)
+        self._slot_names: Tuple[str, ...] = slots
+        self.scan_instance_dict: bool = fields is None and hint.__dictoffset__ != 0
+        # constructor keyword of the fields that are arguments of __init__, for the other classes constructed with
+        # keyword arguments the parameters of __init__. None if every attribute is passed to __init__
+        self.init_names: Optional[Dict[str, str]] = None
+        if fields is not None:
+            self.init_names = {field.name: field.init_name for field in fields if field.init_name is not None}
+        elif construct == CONSTRUCT_KWARGS:
+            self.init_names = _get_init_names(hint)
+        # properties without setter, they can't be set after the object is constructed
+        self.read_only_names: FrozenSet[str] = frozenset(
+            key for class_ in hint.__mro__ for key, value in vars(class_).items()
+            if isinstance(value, property) and value.fset is None)
+        # attributes that can't be added to the __dict__ of the objects, like properties or slots
+        self.descriptor_names: FrozenSet[str] = frozenset(
+            key for class_ in hint.__mro__ for key, value in vars(class_).items() if hasattr(type(value), '__set__'))
+        self._serialization_plans: Dict[Optional[FrozenSet[str]], Tuple[PlanEntry, ...]] = {}
+        self._serialized_name_map: Dict[str, _AttrReport] = {}
+        for report in attr_reports.values():
+            # the first attribute with a serialized name wins
+            self._serialized_name_map.setdefault(report.name, report)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_serialization_plans'] = {}
+        return state
 
     def get(self, attr_name: str) -> _AttrReport:
-        return self.report_map.get(attr_name, _AttrReport(attr_name, None))
+        report = self.report_map.get(attr_name)
+        if report is None:
+            return _get_default_report(attr_name)
+        return report
 
     def get_attribute_names(self, groups: Optional[List[str]] = None) -> Optional[List[str]]:
         if groups is None:
             return None
         return [
             key for key, report in self.report_map.items()
-            if report.groups is not None and
-               len(report.groups.intersection(groups)) > 0
+            if report.groups is not None and not report.groups.isdisjoint(groups)
         ]
 
-    def get_by_serialize_name_or_default(self, name: str) -> Optional[_AttrReport]:
-        try:
-            return next(x for x in self.report_map.values() if x.name == name)
-        except StopIteration as e:
-            if name in self.report_map:
-                # if there is a report for that variable but not with that name, ignore it
-                raise e
-            # if there is no conflict, create a new basic __AttrReport in case the entity got that attr dynamically
-            return _AttrReport(name, hint=None)
+    def get_serialization_plan(self, groups: Optional[FrozenSet[str]] = None) -> Tuple[PlanEntry, ...]:
+        """
+        Returns the (attribute name, getter, attribute report) entries to serialize for `groups`.
+        Plans are computed once per group set and cached in the report.
+
+        If `groups` is None, the plan only covers the public class attributes,
+        the instance attributes have to be discovered per object (unless the class has fields).
+        """
+        plan = self._serialization_plans.get(groups)
+        if plan is None:
+            if groups is None and self.fields is not None:
+                attribute_names = list(self._public_fields)
+                attribute_names.extend(key for key, value in vars(self.hint).items()
+                                       if isinstance(value, property) and not key.startswith('_'))
+            elif groups is None:
+                attribute_names = [key for key in vars(self.hint) if not key.startswith('_')]
+                attribute_names.extend(key for key in self._slot_names
+                                       if not key.startswith('_') and key not in attribute_names)
+            else:
+                attribute_names = self.get_attribute_names(groups)
+            plan = tuple((key, self._get_getter(key), self.get(key)) for key in attribute_names)
+            self._serialization_plans[groups] = plan
+        return plan
+
+    def _get_getter(self, attribute_name: str) -> Callable[[object], object]:
+        # the fields of the named tuples are read by index
+        if self.fields is not None and attribute_name in self.fields and is_named_tuple(self.hint):
+            return itemgetter(self.fields.index(attribute_name))
+        if attribute_name in self.slots:
+            # the slots can be empty, like the attributes that were never set
+            def slot_getter(obj):
+                return getattr(obj, attribute_name, None)
+
+            return slot_getter
+        return attrgetter(attribute_name)
+
+    def get_by_serialize_name(self, name: str) -> Optional[_AttrReport]:
+        """
+        Returns the report of the attribute serialized as `name` or None if there is no such attribute
+        """
+        return self._serialized_name_map.get(name)
 
     # todo move this function to the serializer, it doesn't make sense to have this in a report
-    def validate_instance(self, instance):
-        for key, report in self.report_map.items():
-            if hasattr(instance, report.attribute_name) and getattr(instance, report.attribute_name) is not None:
-                value = getattr(instance, report.attribute_name)
-                if report.hint is not None:
-                    try:
-                        check_type(report.attribute_name, value, report.hint)
-                    except TypeError:
-                        error_text = 'attribute: "{0}.{1}" do not have type: {2}'
-                        error_text_params = self.hint.__name__, report.attribute_name, report.hint
-                        raise AJsonValidationError(error_text.format(*error_text_params))
+    def validate_instance(self, instance, validation: str = VALIDATION_FULL, sample_step: int = 1):
+        if validation == VALIDATION_OFF:
+            return
+        for report in self.report_map.values():
+            value = getattr(instance, report.attribute_name, None)
+            if value is not None:
+                if report.hint is not None and not report.get_validator(validation, sample_step)(value):
+                    error_text = 'attribute: "{0}.{1}" do not have type: {2}'
+                    error_text_params = self.hint.__name__, report.attribute_name, report.hint
+                    raise AJsonValidationError(error_text.format(*error_text_params))
 
             elif report.required:
                 error_text = 'required attribute: "{0}.{1}" is empty'
@@ -87,36 +282,97 @@ class _TypeReport(object):
 class JsonTypeReports(object, metaclass=Singleton):
     def __init__(self):
         self.reports: Dict[type, _TypeReport] = {}
+        # lazy classes that are not inspected yet, with the function that returns their report dict and their
+        # construct strategy
+        self.pending: Dict[type, Tuple[Callable[[], Dict], Optional[str]]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, _type: Type) -> Optional[_TypeReport]:
+        """
+        Returns the report of `_type`, building it first if the class was registered lazily
+        """
+        report = self.reports.get(_type)
+        if report is None and _type in self.pending:
+            report = self._resolve(_type)
+        return report
 
-    def add(self, _type: Type, type_report_dict: Dict):
+    def _resolve(self, _type: Type) -> Optional[_TypeReport]:
+        with self._lock:
+            # another thread could have resolved it while waiting for the lock
+            if _type not in self.pending:
+                return self.reports.get(_type)
+            inspector, construct = self.pending[_type]
+            self.add(_type, inspector(), construct)
+            del self.pending[_type]
+            return self.reports[_type]
+
+    def add_lazy(self, _type: Type, inspector: Callable[[], Dict], construct: Optional[str] = None):
+        """
+        Registers `_type` without inspecting it, `inspector` is called the first time its report is needed
+        """
+        with self._lock:
+            self.pending[_type] = (inspector, construct)
+
+    def resolve_pending(self, types: Optional[Iterable[Type]] = None):
+        """
+        Builds the reports of the lazy classes in `types`, or of all of them if `types` is None
+        """
+        for _type in list(self.pending if types is None else types):
+            self.get(_type)
+
+    def add(self, _type: Type, type_report_dict: Dict, construct: Optional[str] = None):
+        """
+        Registers the report of `_type`. By default the dataclasses, attrs classes and NamedTuples are constructed
+        with their fields as keyword arguments and the other classes calling __init__ without arguments
+        """
+        fields = get_fields(_type)
+        slots = get_slots(_type)
+        if construct is None:
+            construct = CONSTRUCT_INIT if fields is None else CONSTRUCT_KWARGS
         type_report = {}
         for key, attribute_report in type_report_dict.items():
             type_report[key] = _AttrReport(key, hint=None, **attribute_report)
 
         # merge parent report with the new one
         for parent_class in _type.__bases__:
-            if parent_class in self.reports:
-                type_report = {**self.reports[parent_class].report_map, **type_report}
+            parent_report = self.get(parent_class)
+            if parent_report is not None:
+                type_report = {**parent_report.report_map, **type_report}
+
+        # the reports are immutable, so the hints are set in copies (the parent reports are not modified)
+        def set_hint(attribute_name: str, hint: Optional[Type]):
+            report = type_report.get(attribute_name)
+            if report is None:
+                type_report[attribute_name] = _AttrReport(attribute_name, hint=hint)
+            elif report.hint is not hint:
+                type_report[attribute_name] = report.replace(hint=hint)
 
         # adding extra reports for the attributes that have a type but not a @aj annotation
-        if hasattr(_type, '__annotations__'):
-            for key, attr_hint in _type.__annotations__.items():
-                type_report[key] = type_report.get(key, _AttrReport(key, hint=None))
-                type_report[key].hint = attr_hint
+        annotations = getattr(_type, '__annotations__', {})
+        for key, attr_hint in annotations.items():
+            set_hint(key, attr_hint)
+        # the inherited slots of the parents without report
+        for slot in slots:
+            if slot not in type_report:
+                set_hint(slot, None)
 
         # adding extra reports for the for the properties that don't have @aj annotation
         for key, value in vars(_type).items():
             if key.startswith('_'):
                 continue
             if isinstance(value, property):
-                type_report[key] = type_report.get(key, _AttrReport(key, hint=None))
-                if hasattr(value.fget, '__annotations__'):
-                    type_report[key].hint = value.fget.__annotations__
+                set_hint(key, getattr(value.fget, '__annotations__', None))
             elif not isfunction(value):
-                type_report[key] = type_report.get(key, _AttrReport(key, hint=None))
-                if hasattr(_type, '__annotations__') and _type.__annotations__.get(key, False):
-                    type_report[key].hint = _type.__annotations__[key]
-        self.reports[_type] = _TypeReport(type_report, _type)
+                if annotations.get(key, False):
+                    set_hint(key, annotations[key])
+                elif key not in type_report:
+                    type_report[key] = _AttrReport(key, hint=None)
+        # the hints of the fields win over the annotations, they are resolved when the annotations are strings and
+        # they include the attrs fields with a type argument
+        for field in fields or ():
+            set_hint(field.name, field.hint)
+        self.reports[_type] = _TypeReport(type_report, _type, construct, fields, slots)
 
     def clear(self):
         self.reports = {}
+        self.pending = {}
@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Type
+
+from ajson.json_stream import split_json_array
+from ajson.json_type_reports import JsonTypeReports, _TypeReport
+
+# serializer of the worker process, set once by the pool initializer
+_worker_serializer = None
+
+
+def _init_worker(serializer, reports: Dict[Type, _TypeReport]):
+    global _worker_serializer
+    JsonTypeReports().reports.update(reports)
+    _worker_serializer = serializer
+
+
+def _serialize_chunk(items: Sequence, groups, depth: int, separator: str) -> str:
+    to_dict = _worker_serializer._to_dict
+    with_references = _worker_serializer._with_references
+    dumps = _worker_serializer.backend.dumps
+    return separator.join(dumps(with_references(to_dict, item, groups, depth)) for item in items)
+
+
+def _unserialize_chunk(chunk: str, _type: Optional[Type]) -> List:
+    items = _worker_serializer.backend.loads('[' + chunk + ']')
+    # every chunk is validated like a top level list, the sampled validation starts again in each chunk
+    return _worker_serializer.from_dict(items, None if _type is None else List[_type])
+
+
+def split_in_chunks(items: Sequence, workers: int, chunk_size: Optional[int]) -> List[Sequence]:
+    if chunk_size is None:
+        # a few chunks per worker keep all of them busy until the end
+        chunk_size = max(1, -(-len(items) // (workers * 4)))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def create_executor(serializer, workers: Optional[int]) -> ProcessPoolExecutor:
+    """
+    Creates a pool of `workers` processes, the serializer and the class registry are sent once per process
+    """
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                               initargs=(serializer, dict(JsonTypeReports().reports)))
+
+
+def serialize_parallel(serializer, items: Sequence, groups, workers: Optional[int], chunk_size: Optional[int],
+                       lines: bool) -> str:
+    workers = workers or os.cpu_count()
+    # items of a json array are one level deeper than the items of json lines
+    depth, separator = (0, '\n') if lines else (1, serializer.backend.item_separator)
+    chunks = split_in_chunks(items, workers, chunk_size)
+    with create_executor(serializer, workers) as executor:
+        serialize_chunk = partial(_serialize_chunk, groups=groups, depth=depth, separator=separator)
+        encoded_chunks = list(executor.map(serialize_chunk, chunks))
+    if lines:
+        return ''.join(chunk + '\n' for chunk in encoded_chunks)
+    return '[' + separator.join(encoded_chunks) + ']'
+
+
+def unserialize_parallel(serializer, json_str: str, _type: Optional[Type], workers: Optional[int],
+                         chunk_size: Optional[int]) -> List:
+    workers = workers or os.cpu_count()
+    if chunk_size is None:
+        chunk_size = max(1, len(json_str) // (workers * 4))
+    chunks = split_json_array(json_str, chunk_size)
+    with create_executor(serializer, workers) as executor:
+        return [obj for objs in executor.map(partial(_unserialize_chunk, _type=_type), chunks) for obj in objs]
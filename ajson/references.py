@@ -0,0 +1,64 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# how the serializer handles the objects found more than once in the same call
+REFERENCES_OFF = 'off'  # every occurrence is serialized again and cycles are cut by max_depth
+REFERENCES_MEMO = 'memo'  # the subtree of an object is built once and reused, cycles are replaced by "..."
+REFERENCES_IDS = 'ids'  # objects get an "$id" and their next occurrences are written as {"$ref": id}
+REFERENCES_MODES = (REFERENCES_OFF, REFERENCES_MEMO, REFERENCES_IDS)
+
+ID_KEY = '$id'
+REF_KEY = '$ref'
+
+SerializeHandler = Callable[[Any, Any, int, Any], Any]
+
+# placeholder of the objects whose serialization has not finished, found again only in cycles
+_in_progress = object()
+
+
+class ReferenceMemo(threading.local):
+    """
+    Objects found in the current serialize (or unserialize) call of every thread. The serialized objects are kept
+    with their id, so their ids can't be reused by other objects during the call.
+    """
+
+    def __init__(self):
+        self.objects: Optional[Dict[Any, Any]] = None
+
+
+def memoize(handler: SerializeHandler, memo: ReferenceMemo, on_cycle: Callable[[Any, Any], Any]) -> SerializeHandler:
+    """
+    Returns `handler` reusing the result of the objects already serialized in the call,
+    `on_cycle` gives the result of the objects found inside themselves
+    """
+    def memo_handler(obj, groups, depth, attr_report):
+        objects = memo.objects
+        entry = objects.get(id(obj))
+        if entry is not None:
+            if entry[1] is _in_progress:
+                return on_cycle(obj, groups)
+            return entry[1]
+        objects[id(obj)] = (obj, _in_progress)
+        result = handler(obj, groups, depth, attr_report)
+        objects[id(obj)] = (obj, result)
+        return result
+
+    return memo_handler
+
+
+def add_reference_ids(handler: SerializeHandler, memo: ReferenceMemo) -> SerializeHandler:
+    """
+    Returns `handler` adding an "$id" to the serialized objects and replacing the objects
+    already serialized in the call by a {"$ref": id}
+    """
+    def reference_handler(obj, groups, depth, attr_report):
+        objects = memo.objects
+        entry = objects.get(id(obj))
+        if entry is not None:
+            return {REF_KEY: entry[1]}
+        reference_id = len(objects) + 1
+        objects[id(obj)] = (obj, reference_id)
+        result = handler(obj, groups, depth, attr_report)
+        return {ID_KEY: reference_id, **result}
+
+    return reference_handler
@@ -1,4 +1,3 @@
 import re
 
 as_comment_regex = re.compile("@aj\([\s\S]*?\)")  # type: Pattern
-find_attribute_regex = re.compile("(self\.\w*)|(^(?!(def ))\w+)")  # type: Pattern
\ No newline at end of file
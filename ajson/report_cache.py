@@ -0,0 +1,71 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import Dict, Optional, Type
+
+from ajson.singleton import Singleton
+
+# bump it when the format of the inspection reports changes
+_CACHE_FORMAT = 3
+_unsafe_file_name_chars_regex = re.compile(r'[^\w.-]')
+
+
+class ReportCache(object, metaclass=Singleton):
+    """
+    Stores in disk the reports generated by the TypeInspector, so the classes don't need to be parsed again.
+    It is disabled until a directory is set, by default it uses the environment variable AJSON_REPORT_CACHE_DIR.
+    """
+
+    def __init__(self):
+        self.directory: Optional[str] = os.environ.get('AJSON_REPORT_CACHE_DIR') or None
+
+    def _get_path(self, _type: Type) -> str:
+        file_name = '{}.{}.json'.format(_type.__module__, _type.__qualname__)
+        return os.path.join(self.directory, _unsafe_file_name_chars_regex.sub('_', file_name))
+
+    @staticmethod
+    def _get_hash(source: str) -> str:
+        return hashlib.sha256('{}:{}'.format(_CACHE_FORMAT, source).encode('utf-8')).hexdigest()
+
+    def get(self, _type: Type, source: str) -> Optional[Dict[str, Dict]]:
+        """
+        Returns the cached report of `_type` if it was generated from the same `source`
+        """
+        if self.directory is None:
+            return None
+        try:
+            with open(self._get_path(_type), encoding='utf-8') as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('source_hash') != self._get_hash(source):
+            return None
+        return entry.get('report')
+
+    def set(self, _type: Type, source: str, report: Dict[str, Dict]):
+        if self.directory is None:
+            return
+        entry = {'source_hash': self._get_hash(source), 'report': report}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # written in a temporal file first so other processes never read half written entries
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                json.dump(entry, fp)
+            os.replace(temp_path, self._get_path(_type))
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning('Unable to cache the report of {}: {}'.format(_type.__qualname__, e))
+
+
+def enable_report_cache(directory: Optional[str]):
+    """
+    Enables the persistent cache of class reports in `directory` (disabled with None).
+    It has to be called before importing the @AJson classes.
+
+    >>> import ajson
+    >>> ajson.enable_report_cache('/tmp/ajson_cache')
+    """
+    ReportCache().directory = directory
@@ -0,0 +1,35 @@
+from time import perf_counter
+
+
+class Throughput(object):
+    """
+    Counters of a batch of records processed by the serializer
+    """
+
+    def __init__(self):
+        self.records: int = 0
+        """ number of records processed """
+        self.bytes: int = 0
+        """ size of the processed json lines (characters for str lines, which are bytes for ascii json) """
+        self.seconds: float = 0.0
+        """ time spent serializing or unserializing the records """
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, records: int, size: int, start: float):
+        """
+        Adds `records` records of `size` bytes processed since `start` (a time.perf_counter value)
+        """
+        self.records += records
+        self.bytes += size
+        self.seconds += perf_counter() - start
+
+    def __repr__(self):
+        return '<Throughput records={} bytes={} seconds={:.3f} records/s={:.1f} bytes/s={:.1f}>'.format(
+            self.records, self.bytes, self.seconds, self.records_per_second, self.bytes_per_second)
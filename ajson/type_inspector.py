@@ -1,42 +1,58 @@
 import inspect
 import logging
-import os
-from typing import AnyStr, Dict, Match, Optional, Type
+from typing import Any, AnyStr, Dict, List, Match, Optional, Type
 
-from bs4 import BeautifulSoup
-
-from ajson.comment_handler import CommentHandler
-from ajson.regex import as_comment_regex, find_attribute_regex
+from ajson.annotation_extractor import extract_aj_annotations
+from ajson.annotation_parser import parse_aj_annotation
+from ajson.field_classes import Field, get_fields
+from ajson.regex import as_comment_regex
+from ajson.report_cache import ReportCache
 from ajson.singleton import Singleton
 
 
 class TypeInspector(object, metaclass=Singleton):
 
     def inspect_type(self, _type: Type) -> Dict[str, Dict]:
+        fields = get_fields(_type)
+        if fields is not None:
+            # the fields already describe the class, its source is not needed
+            return {
+                **self._get_fields_report(fields),
+                **self._get_properties_report(_type)
+            }
         source = inspect.getsource(_type)
-        clean_source = CommentHandler().format_class_source(source)
-
-        return {
-            **self._get_aj_annotation_reports(clean_source),
+        report = ReportCache().get(_type, source)
+        if report is not None:
+            return report
+        report = {
+            **self._get_aj_annotation_reports(source),
             **self._get_properties_report(_type)
         }
+        ReportCache().set(_type, source, report)
+        return report
 
-    def _get_aj_annotation_reports(self, source) -> Dict[str, Dict]:
+    def _get_aj_annotation_reports(self, source: str) -> Dict[str, Dict]:
         report = {}
-
-        while True:
-            matches = as_comment_regex.search(source)
-            if matches is None:
-                break
+        for attribute, aj_str in extract_aj_annotations(source).items():
             try:
-                aj_dict = self.aj_str_to_aj_dict(matches)
-                attribute = self._find_attribute(source, matches.start())
-                if attribute is not None:
-                    report[attribute] = aj_dict
+                report[attribute] = parse_aj_annotation(aj_str)
             except Exception as e:
-                logging.warning("Unable to parse @aj {}".format(matches[0]))
-            source = source[matches.end():]
+                logging.warning("Unable to parse @aj {}".format(aj_str))
+        return report
 
+    def _get_fields_report(self, fields: List[Field]) -> Dict[str, Dict]:
+        report = {}
+        for field in fields:
+            if field.metadata is None:
+                continue
+            if isinstance(field.metadata, str):
+                aj_str = field.metadata if field.metadata.startswith('@aj') else '@aj({})'.format(field.metadata)
+                try:
+                    report[field.name] = parse_aj_annotation(aj_str)
+                except Exception as e:
+                    logging.warning("Unable to parse @aj {}".format(aj_str))
+            else:
+                report[field.name] = dict(field.metadata)
         return report
 
     def _get_properties_report(self, _type: Type) -> Dict[str, Dict]:
@@ -52,21 +68,5 @@ class TypeInspector(object, metaclass=Singleton):
             report[name] = aj_dict
         return report
 
-    def _find_attribute(self, source, as_position) -> Optional[str]:
-        source_to_as = source[:as_position]
-        line: str = source_to_as[source_to_as.rfind("\n"):].strip()
-        attributes_found = find_attribute_regex.findall(line)
-        if len(attributes_found) >= 1:
-            if attributes_found[0][1] == '':
-                return attributes_found[0][0][5:]
-            else:
-                return attributes_found[0][1]
-
-        return None
-
-    def aj_str_to_aj_dict(self, matches: Match[AnyStr]) -> Optional[Dict]:
-        # getting the aj string and removing the # in case the json is multi line
-        aj_str = matches.string[matches.start(): matches.end()].replace("#", "")
-        xml_aj_str = "<tag {} ></tag>".format(aj_str[4:-1].replace(os.linesep, ''))
-        aj_params_dict = BeautifulSoup(xml_aj_str, features="html.parser").find('tag').attrs
-        return {k: v.replace("'", '"') for k, v in aj_params_dict.items()}
+    def aj_str_to_aj_dict(self, matches: Match[AnyStr]) -> Optional[Dict[str, Any]]:
+        return parse_aj_annotation(matches.group())
@@ -0,0 +1,111 @@
+from inspect import isclass
+from itertools import islice
+from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
+
+from typeguard import check_type
+
+# validation modes of the unserialized objects
+VALIDATION_FULL = 'full'
+VALIDATION_SHALLOW = 'shallow'  # only the top level objects, without checking the items of the containers
+VALIDATION_SAMPLED = 'sampled'  # like full, but only every Nth item of the containers (and its attributes) is checked
+VALIDATION_OFF = 'off'
+VALIDATION_MODES = (VALIDATION_FULL, VALIDATION_SHALLOW, VALIDATION_SAMPLED, VALIDATION_OFF)
+
+Validator = Callable[[Any], bool]
+
+_container_types = (list, set, frozenset, dict, tuple)
+
+
+def _always_valid(value: Any) -> bool:
+    return True
+
+
+def _items(value, sample_step: int):
+    return value if sample_step == 1 else islice(value, 0, None, sample_step)
+
+
+def _compile_class(hint: type, object_validator: Optional[Validator]) -> Validator:
+    # typeguard accepts ints for floats and ints and floats for complex
+    if hint is float:
+        accepted = (float, int)
+    elif hint is complex:
+        accepted = (complex, float, int)
+    else:
+        accepted = hint
+    if object_validator is not None:
+        return lambda value: isinstance(value, accepted) and object_validator(value)
+    return lambda value: isinstance(value, accepted)
+
+
+def _compile_union(args: Tuple, mode: str, sample_step: int, object_validator: Optional[Validator]) -> Validator:
+    validators = [compile_validator(arg, mode, sample_step, object_validator) for arg in args]
+    if _always_valid in validators:
+        return _always_valid
+    return lambda value: any(validator(value) for validator in validators)
+
+
+def _compile_container(origin: type, args: Tuple, mode: str, sample_step: int,
+                       object_validator: Optional[Validator]) -> Validator:
+    if mode == VALIDATION_SHALLOW or not args:
+        return lambda value: isinstance(value, origin)
+
+    if origin is dict:
+        key_validator = compile_validator(args[0], mode, sample_step, object_validator)
+        value_validator = compile_validator(args[1], mode, sample_step, object_validator)
+        return lambda value: isinstance(value, dict) and all(
+            key_validator(key) and value_validator(item) for key, item in _items(value.items(), sample_step))
+
+    if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        if args == ((),):
+            args = ()
+        validators = [compile_validator(arg, mode, sample_step, object_validator) for arg in args]
+        return lambda value: isinstance(value, tuple) and len(value) == len(validators) and all(
+            validator(item) for validator, item in zip(validators, value))
+
+    item_validator = compile_validator(args[0], mode, sample_step, object_validator)
+    if item_validator is _always_valid:
+        return lambda value: isinstance(value, origin)
+    return lambda value: isinstance(value, origin) and all(
+        item_validator(item) for item in _items(value, sample_step))
+
+
+def _compile_fallback(hint: Type) -> Validator:
+    def validator(value: Any) -> bool:
+        try:
+            check_type('value', value, hint)
+        except TypeError:
+            return False
+        return True
+
+    return validator
+
+
+def compile_validator(hint: Optional[Type], mode: str = VALIDATION_FULL, sample_step: int = 1,
+                      object_validator: Optional[Validator] = None) -> Validator:
+    """
+    Compiles a type hint into a function that returns whether a value matches it, the same way typeguard's
+    check_type does. The hints that can't be compiled are checked with check_type
+
+    :param hint: type hint to validate
+    :param mode: VALIDATION_FULL, VALIDATION_SHALLOW or VALIDATION_SAMPLED
+    :param sample_step: with VALIDATION_SAMPLED, only one every `sample_step` items of the containers are validated
+    :param object_validator: extra validation for the values that match a class hint (like their attributes)
+    """
+    if mode != VALIDATION_SAMPLED:
+        sample_step = 1
+    if hint is None or hint is Any:
+        return _always_valid
+    if hint is type(None):
+        return lambda value: value is None
+
+    origin = getattr(hint, '__origin__', None)
+    args = tuple(arg for arg in getattr(hint, '__args__', None) or () if not isinstance(arg, TypeVar))
+    if origin is Union:
+        return _compile_union(args, mode, sample_step, object_validator)
+    # python 3.6 generics keep the builtin type in __extra__
+    container = getattr(hint, '__extra__', None) or origin
+    if container in _container_types:
+        return _compile_container(container, args, mode, sample_step, object_validator)
+    if origin is None and isclass(hint) and hint.__module__ != 'typing':
+        return _compile_class(hint, object_validator)
+    return _compile_fallback(hint)
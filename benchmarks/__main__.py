@@ -0,0 +1,50 @@
+"""
+Benchmark suite of the serializer
+
+python -m benchmarks run --output results.json
+python -m benchmarks run serialize_large_list unserialize_large_list --min-time 2
+python -m benchmarks compare baseline.json results.json --threshold 0.05
+python -m benchmarks list
+"""
+import argparse
+import sys
+
+from benchmarks import runner
+from benchmarks.workloads import WORKLOADS
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command')
+
+    run_parser = commands.add_parser('run', help='runs the workloads')
+    run_parser.add_argument('workloads', nargs='*', help='workloads to run, all of them by default')
+    run_parser.add_argument('--output', '-o', help='json file where the results are saved')
+    run_parser.add_argument('--min-time', type=float, default=1.0, help='seconds measured per workload')
+
+    compare_parser = commands.add_parser('compare', help='flags the regressions between two results')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=runner.DEFAULT_THRESHOLD,
+                                help='slowdown flagged as regression, 0.1 = 10%% fewer ops/s')
+
+    commands.add_parser('list', help='lists the workloads')
+
+    args = parser.parse_args(argv)
+    if args.command == 'list':
+        print('\n'.join(WORKLOADS))
+    elif args.command == 'compare':
+        comparison = runner.compare(runner.load(args.baseline), runner.load(args.current), args.threshold)
+        runner.print_comparison(comparison)
+        # a failing exit code lets CI stop on regressions
+        return 1 if any(row['regression'] for row in comparison) else 0
+    else:
+        results = runner.run(getattr(args, 'workloads', None) or None, getattr(args, 'min_time', 1.0))
+        if getattr(args, 'output', None):
+            runner.save(results, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+Compares the @aj annotation parser with the BeautifulSoup based parser used before it (if bs4 is installed)
+
+python -m benchmarks.annotation_parser
+"""
+import os
+from timeit import timeit
+
+from ajson.annotation_parser import parse_aj_annotation
+
+ANNOTATIONS = [
+    '@aj(groups=["admin"] name=annotation)',
+    '@aj(name=firstName, groups=["public"])',
+    '@aj(d_format="%Y/%m/%d" required)',
+    '@aj(\n    groups="[\n        \'admin\',\n        \'public\'\n    ]"\n    name=annotation\n    d_format=Y-M-D\n)',
+]
+
+
+def parse_with_beautiful_soup(aj_str: str):
+    from bs4 import BeautifulSoup
+    aj_str = aj_str.replace("#", "")
+    xml_aj_str = "<tag {} ></tag>".format(aj_str[4:-1].replace(os.linesep, ''))
+    aj_params_dict = BeautifulSoup(xml_aj_str, features="html.parser").find('tag').attrs
+    return {k: v.replace("'", '"') for k, v in aj_params_dict.items()}
+
+
+def main(number: int = 20000):
+    parsers = [('parse_aj_annotation', parse_aj_annotation)]
+    try:
+        import bs4  # noqa: F401
+        parsers.append(('beautifulsoup', parse_with_beautiful_soup))
+    except ImportError:
+        print('bs4 is not installed, only the current parser is measured')
+
+    print('{:<24} {:>16} {:>14}'.format('parser', 'annotations/s', 'us/annotation'))
+    for name, parse in parsers:
+        seconds = timeit(lambda: [parse(annotation) for annotation in ANNOTATIONS], number=number // len(ANNOTATIONS))
+        print('{:<24} {:>16.0f} {:>14.2f}'.format(name, number / seconds, seconds * 1e6 / number))
+
+
+if __name__ == '__main__':
+    main()
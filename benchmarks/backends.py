@@ -0,0 +1,60 @@
+"""
+Compares the serialization and unserialization speed of every json backend installed
+
+python -m benchmarks.backends
+"""
+from timeit import timeit
+from typing import List
+
+from ajson import AJson, ASerializer
+from ajson.backends import available_backends
+
+
+@AJson()
+class Address:
+    street: str  # @aj(name=streetName)
+    number: int  # @aj()
+
+    def __init__(self, street: str = '', number: int = 0):
+        self.street = street
+        self.number = number
+
+
+@AJson()
+class Customer:
+    name: str  # @aj(name=fullName)
+    email: str  # @aj()
+    score: float  # @aj()
+    tags: List[str]  # @aj()
+    addresses: List[Address]  # @aj()
+
+    def __init__(self, name: str = '', email: str = '', score: float = 0, tags=None, addresses=None):
+        self.name = name
+        self.email = email
+        self.score = score
+        self.tags = tags or []
+        self.addresses = addresses or []
+
+
+def main(customers: int = 1000, number: int = 20):
+    objs = [Customer('customer {}'.format(i), 'customer{}@example.com'.format(i), i / 3, ['a', 'b'],
+                     [Address('street {}'.format(i), i)]) for i in range(customers)]
+    print('{:<12} {:>16} {:>18} {:>16} {:>18}'.format('backend', 'dumps objs/s', 'serialize objs/s',
+                                                      'loads objs/s', 'unserialize objs/s'))
+    for name in available_backends():
+        serializer = ASerializer(backend=name)
+        backend = serializer.backend
+        document = serializer.to_dict(objs)
+        json_str = serializer.serialize(objs)
+        results = [
+            timeit(lambda: backend.dumps(document), number=number),
+            timeit(lambda: serializer.serialize(objs), number=number),
+            timeit(lambda: backend.loads(json_str), number=number),
+            timeit(lambda: serializer.unserialize(json_str, List[Customer]), number=number),
+        ]
+        print('{:<12} {:>16.0f} {:>18.0f} {:>16.0f} {:>18.0f}'.format(
+            name, *(customers * number / seconds for seconds in results)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Runs the workloads of the benchmark suite and compares the results of two runs
+"""
+import gc
+import json
+import platform
+import sys
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import ajson
+from benchmarks.workloads import WORKLOADS
+
+DEFAULT_THRESHOLD = 0.1
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    # nearest rank, the samples are already sorted
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(operation, min_time: float = 1.0, min_iterations: int = 5, warm_up: int = 2) -> Dict[str, float]:
+    """
+    Calls `operation` until it runs for `min_time` seconds (and at least `min_iterations` times), returning the
+    operations per second and the latency percentiles in milliseconds
+    """
+    for _ in range(warm_up):
+        operation()
+    latencies = []
+    total = 0.0
+    # the collector runs at different moments in every run, so it is kept out of the measurements
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while total < min_time or len(latencies) < min_iterations:
+            start = perf_counter()
+            operation()
+            latency = perf_counter() - start
+            latencies.append(latency)
+            total += latency
+            gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    latencies.sort()
+    return {
+        'iterations': len(latencies),
+        'ops_per_second': len(latencies) / total,
+        'mean_ms': total * 1000 / len(latencies),
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p90_ms': _percentile(latencies, 90) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+    }
+
+
+def run(names: Optional[Iterable[str]] = None, min_time: float = 1.0, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Runs the workloads in `names` (all of them by default) and returns the results with the environment they ran in
+    """
+    names = list(WORKLOADS if names is None else names)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        raise ValueError('unknown workloads: {}'.format(', '.join(unknown)))
+    results = {
+        'environment': {
+            'ajson': ajson.__version__,
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'date': datetime.now().isoformat(timespec='seconds'),
+        },
+        'workloads': {},
+    }
+    for name in names:
+        result = measure(WORKLOADS[name](), min_time)
+        results['workloads'][name] = result
+        if verbose:
+            print('{:<32} {:>12.1f} ops/s   p50 {:>9.3f} ms   p99 {:>9.3f} ms'.format(
+                name, result['ops_per_second'], result['p50_ms'], result['p99_ms']))
+    return results
+
+
+def save(results: Dict[str, Any], path: str):
+    with open(path, 'w') as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compares the ops/s of the workloads of both results, the ones that are more than `threshold`
+    (0.1 = 10%) slower than in `baseline` are flagged as regressions
+    """
+    comparison = []
+    for name, result in current['workloads'].items():
+        if name not in baseline['workloads']:
+            continue
+        baseline_ops = baseline['workloads'][name]['ops_per_second']
+        change = result['ops_per_second'] / baseline_ops - 1
+        comparison.append({
+            'workload': name,
+            'baseline_ops_per_second': baseline_ops,
+            'ops_per_second': result['ops_per_second'],
+            'change': change,
+            'regression': change < -threshold,
+        })
+    return comparison
+
+
+def print_comparison(comparison: List[Dict[str, Any]]):
+    print('{:<32} {:>14} {:>14} {:>9}'.format('workload', 'baseline ops/s', 'ops/s', 'change'))
+    for row in comparison:
+        print('{:<32} {:>14.1f} {:>14.1f} {:>+8.1f}% {}'.format(
+            row['workload'], row['baseline_ops_per_second'], row['ops_per_second'], row['change'] * 100,
+            'REGRESSION' if row['regression'] else ''))
@@ -0,0 +1,243 @@
+"""
+Synthetic workloads of the benchmark suite, built on the types of tests/types_for_tests.
+
+Every workload is a function that prepares its data and returns the operation to measure, so the
+preparation is never part of the measurements.
+"""
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from ajson import AJson, ASerializer
+from ajson.aserializer import ENGINE_ITERATIVE
+from ajson.json_type_reports import JsonTypeReports
+from ajson.references import REFERENCES_MEMO
+from ajson.validators import VALIDATION_FULL
+from tests.types_for_tests.test_serializaer_with_annotations_types import SObjectWithGroupsAndNoGroups, \
+    SSimpleObjectAJsonNested2, SSimpleObjectWithDate, USConstructKwargsObject, USConstructNewObject, \
+    USNestedListObject, USNestedObject0, USSlotsObject, USWithDateHintsObject, USWithHintsObject, \
+    USWithOptionalHintsObject
+
+Operation = Callable[[], object]
+
+WORKLOADS: Dict[str, Callable[[], Operation]] = {}
+
+LIST_SIZE = 1000
+WIDE_ATTRIBUTES = 200
+DEEP_LEVELS = 12
+DECORATED_CLASSES = 50
+VERY_DEEP_LEVELS = 5000
+
+
+def workload(function: Callable[[], Operation]) -> Callable[[], Operation]:
+    WORKLOADS[function.__name__] = function
+    return function
+
+
+def _generate_module(name: str, classes: int, attributes: int, decorate: bool):
+    """
+    Writes and imports a module with `classes` classes of `attributes` annotated attributes,
+    the types of the tests are too small for some workloads
+    """
+    lines = ['from ajson import AJson', '']
+    for class_index in range(classes):
+        lines.extend(['', '@AJson()' if decorate else '', 'class Generated{}(object):'.format(class_index)])
+        for attribute in range(attributes):
+            lines.append('    attribute_{0}: int = {0}  # @aj(name=a{0} groups=["g{1}"])'.format(
+                attribute, attribute % 4))
+    directory = tempfile.mkdtemp(prefix='ajson_benchmarks_')
+    path = os.path.join(directory, '{}.py'.format(name))
+    with open(path, 'w') as fp:
+        fp.write('\n'.join(lines) + '\n')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # inspect needs the module registered to find the source of its classes
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@workload
+def serialize_wide_object() -> Operation:
+    wide = _generate_module('ajson_benchmark_wide', 1, WIDE_ATTRIBUTES, decorate=True).Generated0()
+    serializer = ASerializer()
+    return lambda: serializer.serialize(wide)
+
+
+@workload
+def unserialize_wide_object() -> Operation:
+    wide_type = _generate_module('ajson_benchmark_wide_unserialize', 1, WIDE_ATTRIBUTES, decorate=True).Generated0
+    serializer = ASerializer()
+    json_str = serializer.serialize(wide_type())
+    return lambda: serializer.unserialize(json_str, wide_type)
+
+
+@workload
+def serialize_deep_nesting() -> Operation:
+    deep = SSimpleObjectAJsonNested2()
+    for _ in range(DEEP_LEVELS):
+        deep = {'level': [deep, SSimpleObjectAJsonNested2()]}
+    serializer = ASerializer(max_depth=DEEP_LEVELS * 2 + 4)
+    return lambda: serializer.serialize(deep)
+
+
+@workload
+def unserialize_deep_nesting() -> Operation:
+    nested = USNestedObject0()
+    nested.date = datetime(2000, 1, 1)
+    serializer = ASerializer(max_depth=DEEP_LEVELS * 2 + 4)
+    deep = nested
+    for _ in range(DEEP_LEVELS):
+        deep = {'level': [deep, nested]}
+    json_str = serializer.serialize(deep)
+    return lambda: serializer.unserialize(json_str)
+
+
+@workload
+def serialize_deep_nesting_iterative() -> Operation:
+    deep = SSimpleObjectAJsonNested2()
+    for _ in range(DEEP_LEVELS):
+        deep = {'level': [deep, SSimpleObjectAJsonNested2()]}
+    serializer = ASerializer(max_depth=DEEP_LEVELS * 2 + 4, engine=ENGINE_ITERATIVE)
+    return lambda: serializer.serialize(deep)
+
+
+@workload
+def serialize_very_deep_iterative() -> Operation:
+    # deeper than the recursion limit, only the iterative engine can serialize it
+    deep = SSimpleObjectAJsonNested2()
+    for _ in range(VERY_DEEP_LEVELS):
+        deep = {'level': [deep]}
+    serializer = ASerializer(max_depth=VERY_DEEP_LEVELS * 2 + 4, engine=ENGINE_ITERATIVE)
+    return lambda: serializer.to_dict(deep)
+
+
+@workload
+def serialize_large_list_iterative() -> Operation:
+    objs = [SSimpleObjectAJsonNested2() for _ in range(LIST_SIZE)]
+    serializer = ASerializer(engine=ENGINE_ITERATIVE)
+    return lambda: serializer.serialize(objs)
+
+
+@workload
+def serialize_large_list() -> Operation:
+    objs = [SSimpleObjectAJsonNested2() for _ in range(LIST_SIZE)]
+    serializer = ASerializer()
+    return lambda: serializer.serialize(objs)
+
+
+@workload
+def unserialize_large_list() -> Operation:
+    serializer = ASerializer()
+    json_str = serializer.serialize([{'my_mane': i, 'date': '2000/01/01'} for i in range(LIST_SIZE)])
+    return lambda: serializer.unserialize(json_str, List[USNestedObject0])
+
+
+@workload
+def unserialize_construct_new() -> Operation:
+    serializer = ASerializer()
+    json_str = serializer.serialize([{'aa': i, 'b': str(i), 'nested': None} for i in range(LIST_SIZE)])
+    return lambda: serializer.unserialize(json_str, List[USConstructNewObject])
+
+
+@workload
+def unserialize_construct_kwargs() -> Operation:
+    serializer = ASerializer()
+    json_str = serializer.serialize([{'aa': i, 'nested': []} for i in range(LIST_SIZE)])
+    return lambda: serializer.unserialize(json_str, List[USConstructKwargsObject])
+
+
+@workload
+def unserialize_container_hints() -> Operation:
+    serializer = ASerializer()
+    json_str = serializer.serialize({str(i): [[{'my_mane': i, 'date': '2000/01/01'}, i]] for i in range(LIST_SIZE)})
+    return lambda: serializer.unserialize(json_str, Dict[str, List[Tuple[USNestedObject0, int]]])
+
+
+@workload
+def serialize_slots_objects() -> Operation:
+    objs = [USSlotsObject() for _ in range(LIST_SIZE)]
+    serializer = ASerializer()
+    return lambda: serializer.serialize(objs)
+
+
+@workload
+def unserialize_slots_objects() -> Operation:
+    serializer = ASerializer()
+    json_str = serializer.serialize([{'a': i, 'bb': str(i), 'nested': None} for i in range(LIST_SIZE)])
+    return lambda: serializer.unserialize(json_str, List[USSlotsObject])
+
+
+@workload
+def serialize_with_groups() -> Operation:
+    objs = [SObjectWithGroupsAndNoGroups() for _ in range(LIST_SIZE)]
+    serializer = ASerializer()
+    return lambda: serializer.serialize(objs, groups=['admin'])
+
+
+@workload
+def serialize_nested_with_groups() -> Operation:
+    objs = [SSimpleObjectAJsonNested2() for _ in range(LIST_SIZE)]
+    serializer = ASerializer()
+    return lambda: serializer.serialize(objs, groups=['public'])
+
+
+@workload
+def serialize_shared_references() -> Operation:
+    # every item references the same nested object, built only once with the memo
+    shared = SSimpleObjectAJsonNested2()
+    objs = [{'item': i, 'shared': shared} for i in range(LIST_SIZE)]
+    serializer = ASerializer(references=REFERENCES_MEMO)
+    return lambda: serializer.serialize(objs)
+
+
+@workload
+def serialize_datetimes() -> Operation:
+    objs = [SSimpleObjectWithDate() for _ in range(LIST_SIZE)]
+    serializer = ASerializer()
+    return lambda: serializer.serialize(objs)
+
+
+@workload
+def unserialize_datetimes() -> Operation:
+    random.seed(0)
+    start = datetime(2000, 1, 1)
+    records = [{'a': start + timedelta(seconds=random.randrange(10 ** 9)),
+                'b': None if i % 2 else start, 'c': str(i)} for i in range(LIST_SIZE)]
+    serializer = ASerializer()
+    json_str = serializer.serialize(records)
+    return lambda: serializer.unserialize(json_str, List[USWithDateHintsObject])
+
+
+@workload
+def decorate_classes() -> Operation:
+    classes = [cls for name, cls in vars(_generate_module('ajson_benchmark_decorator', DECORATED_CLASSES, 20,
+                                                           decorate=False)).items() if name.startswith('Generated')]
+
+    def decorate():
+        for cls in classes:
+            AJson()(cls)
+        for cls in classes:
+            JsonTypeReports().reports.pop(cls)
+
+    return decorate
+
+
+@workload
+def unserialize_with_validation() -> Operation:
+    serializer = ASerializer(validation=VALIDATION_FULL)
+    hints = serializer.serialize([{'a': i, 'b': str(i)} for i in range(LIST_SIZE)])
+    optional_hints = serializer.serialize([{'a': None if i % 3 else i, 'b': str(i)} for i in range(LIST_SIZE)])
+    nested_list = serializer.serialize({'nested_list': [{'my_mane': i, 'date': '2000/01/01'}
+                                                        for i in range(LIST_SIZE)]})
+
+    def unserialize():
+        serializer.unserialize(hints, List[USWithHintsObject])
+        serializer.unserialize(optional_hints, List[USWithOptionalHintsObject])
+        serializer.unserialize(nested_list, USNestedListObject)
+
+    return unserialize
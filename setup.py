@@ -53,10 +53,14 @@ setup(
         'Programming Language :: Python :: 3.6',
     ],
     keywords='json serializer annotation validation',
-    packages=find_packages(exclude="_static"),
+    packages=find_packages(exclude=["_static", "benchmarks", "benchmarks.*"]),
     install_requires=[
-        'beautifulsoup4',
         'typeguard >= 2.2.0, <2.3.0'
     ],
+    extras_require={
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
+        'rapidjson': ['python-rapidjson'],
+    },
     test_suite="tests",
 )
\ No newline at end of file
@@ -0,0 +1,15 @@
+from tests import test_serializer, test_serializer_with_annotations
+
+SERIALIZER_TEST_CASES = (test_serializer.TestSerialization,
+                         test_serializer_with_annotations.TestSerializationWithAnnotations)
+
+
+def add_conformance_test_cases(namespace: dict, mixin: type, suffix: str, **attributes):
+    """
+    Adds to `namespace` a copy of every serializer test case that runs with `mixin` first in its bases, named with
+    `suffix`. The copies are created here so the loop variables never end up in the globals of the test module,
+    where unittest would collect them as test cases too
+    """
+    for test_case in SERIALIZER_TEST_CASES:
+        name = '{}_{}'.format(test_case.__name__, suffix)
+        namespace[name] = type(name, (mixin, test_case), attributes)
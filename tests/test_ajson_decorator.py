@@ -1,16 +1,23 @@
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
-from ajson.class_decorator import AJson
+from ajson.aserializer import ASerializer
+from ajson.class_decorator import AJson, warm_up
 from ajson.json_type_reports import JsonTypeReports, ISO_FORMAT
+from ajson.type_inspector import TypeInspector
 
 
 class TestAJsonDecorator(unittest.TestCase):
     def setUp(self):
         self.old_reports = JsonTypeReports().reports
+        self.old_pending = JsonTypeReports().pending
         JsonTypeReports().clear()
 
     def tearDown(self):
         JsonTypeReports().reports = self.old_reports
+        JsonTypeReports().pending = self.old_pending
 
     def test_annotation_class_creates_report_with_group(self):
         @AJson()
@@ -95,3 +102,90 @@ class TestAJsonDecorator(unittest.TestCase):
         self.assertEqual(reports[AIWP1].get("a").name, 'aa')
         self.assertEqual(reports[AIWP2].get("a").name, 'aaa')
         self.assertEqual(reports[AIWP2].get("d").name, 'dd')
+
+    def test_construct_strategy_is_stored_in_the_report(self):
+        @AJson(construct='new')
+        class AJCN:
+            a: int = 1
+
+        @AJson(lazy=True, construct='kwargs')
+        class AJCK:
+            a: int = 1
+
+        self.assertEqual(JsonTypeReports().get(AJCN).construct, 'new')
+        self.assertEqual(JsonTypeReports().get(AJCK).construct, 'kwargs')
+
+    def test_unknown_construct_strategy_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            AJson(construct='magic')
+
+    def test_lazy_class_is_inspected_when_used(self):
+        @AJson(lazy=True)
+        class AJLA:
+            def __init__(self):
+                self.a = 10  # @aj(name=aa)
+
+        self.assertNotIn(AJLA, JsonTypeReports().reports)
+        self.assertIn(AJLA, JsonTypeReports().pending)
+
+        self.assertEqual(ASerializer().serialize(AJLA()), '{"aa": 10}')
+        self.assertNotIn(AJLA, JsonTypeReports().pending)
+        self.assertEqual(JsonTypeReports().reports[AJLA].get("a").name, 'aa')
+
+    def test_lazy_class_is_inspected_when_unserialized(self):
+        @AJson(lazy=True)
+        class AJLB:
+            a: int = 10  # @aj(name=aa)
+
+        self.assertEqual(ASerializer().unserialize('{"aa": 20}', AJLB).a, 20)
+
+    def test_lazy_parent_is_inspected_before_its_child(self):
+        @AJson(lazy=True)
+        class AJLC1:
+            a: int = 10  # @aj(name=aa)
+
+        @AJson()
+        class AJLC2(AJLC1):
+            b: int = 20  # @aj(name=bb)
+
+        self.assertNotIn(AJLC1, JsonTypeReports().pending)
+        self.assertEqual(JsonTypeReports().reports[AJLC2].get("a").name, 'aa')
+        self.assertEqual(JsonTypeReports().reports[AJLC2].get("b").name, 'bb')
+
+    def test_lazy_class_is_inspected_once_by_concurrent_threads(self):
+        @AJson(lazy=True)
+        class AJLD:
+            a: int = 10  # @aj(name=aa)
+
+        inspect_type = TypeInspector().inspect_type
+        with patch.object(TypeInspector, 'inspect_type', side_effect=inspect_type) as inspect_mock:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                reports = list(executor.map(lambda _: JsonTypeReports().get(AJLD), range(32)))
+        self.assertEqual(inspect_mock.call_count, 1)
+        self.assertTrue(all(report is reports[0] for report in reports))
+
+    def test_warm_up_classes_and_modules(self):
+        @AJson(lazy=True)
+        class AJLE1:
+            a: int = 10  # @aj(name=aa)
+
+        @AJson(lazy=True)
+        class AJLE2:
+            a: int = 10  # @aj(name=aa)
+
+        warm_up(AJLE1)
+        self.assertIn(AJLE1, JsonTypeReports().reports)
+        self.assertIn(AJLE2, JsonTypeReports().pending)
+
+        warm_up(sys.modules['tests'])
+        self.assertIn(AJLE2, JsonTypeReports().reports)
+        self.assertEqual(JsonTypeReports().pending, {})
+
+    def test_warm_up_without_arguments_inspects_every_lazy_class(self):
+        @AJson(lazy=True)
+        class AJLF:
+            a: int = 10  # @aj(name=aa)
+
+        warm_up()
+        self.assertIn(AJLF, JsonTypeReports().reports)
+        self.assertEqual(JsonTypeReports().pending, {})
@@ -0,0 +1,85 @@
+import inspect
+import unittest
+
+from ajson.annotation_extractor import extract_aj_annotations
+
+
+class TestAnnotationExtractor(unittest.TestCase):
+    def test_inline_comments_of_class_and_instance_attributes(self):
+        class AEA:
+            a = 1  # @aj(name=first)
+            b: int  # @aj(required)
+            c: str = ''  # @aj()
+
+            def __init__(self):
+                self.d = 2  # other comment @aj(groups=["admin"])
+                self.e += 1  # @aj(name=e)
+
+        self.assertDictEqual(extract_aj_annotations(inspect.getsource(AEA)), {
+            'a': '@aj(name=first)',
+            'b': '@aj(required)',
+            'c': '@aj()',
+            'd': '@aj(groups=["admin"])',
+            'e': '@aj(name=e)',
+        })
+
+    def test_annotation_split_in_several_comment_lines(self):
+        class AEB:
+            def __init__(self):
+                self.a = 1  # @aj(
+                #     name=first_a
+                # )
+                self.b = 2  # @aj(name=b)
+
+        self.assertDictEqual(extract_aj_annotations(inspect.getsource(AEB)), {
+            'a': '@aj(\n#     name=first_a\n# )',
+            'b': '@aj(name=b)',
+        })
+
+    def test_docstrings_belong_to_the_previous_statement(self):
+        class AEC:
+            """ @aj(name=class_docstring) """
+
+            def __init__(self):
+                """ @aj(name=method_docstring) """
+                self.a = [
+                    1,
+                    2,
+                ]
+                '''
+                    @aj(name=a)
+                '''
+                self.b = 2  # @aj(name=b)
+                """ @aj(name=new_b) """
+
+        self.assertDictEqual(extract_aj_annotations(inspect.getsource(AEC)), {
+            'a': '@aj(name=a)',
+            'b': '@aj(name=new_b)',
+        })
+
+    def test_comments_inside_multi_line_statements_belong_to_the_statement(self):
+        class AED:
+            def __init__(self):
+                self.a = dict(
+                    b=1,  # @aj(name=first_a)
+                )
+
+        self.assertDictEqual(extract_aj_annotations(inspect.getsource(AED)), {'a': '@aj(name=first_a)'})
+
+    def test_statements_that_are_not_assignments_are_ignored(self):
+        class AEE:
+            def __init__(self):
+                self.a = "@aj(name=in_a_string)"
+                print(self.a)  # @aj(name=print)
+                if self.a == 1:  # @aj(name=comparison)
+                    return  # @aj(name=return)
+
+        self.assertDictEqual(extract_aj_annotations(inspect.getsource(AEE)), {})
+
+    def test_large_classes(self):
+        source = 'class AEF:\n    def __init__(self):\n' + ''.join(
+            '        self.a{0} = {0}  # @aj(name=b{0})\n        """ docstring {0} """\n'.format(i)
+            for i in range(5000))
+        annotations = extract_aj_annotations(source)
+        self.assertEqual(len(annotations), 5000)
+        self.assertEqual(annotations['a4999'], '@aj(name=b4999)')
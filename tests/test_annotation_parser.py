@@ -0,0 +1,50 @@
+import unittest
+
+from ajson.annotation_parser import parse_aj_annotation
+from ajson.json_type_reports import AJsonAnnotationParseError, _AttrReport
+
+
+class TestAnnotationParser(unittest.TestCase):
+    def test_annotation_styles_used_in_the_project(self):
+        annotations = {
+            '@aj()': {},
+            '@aj(groups=["admin"])': {'groups': ['admin']},
+            '@aj(groups=["admin"] name=annotation)': {'groups': ['admin'], 'name': 'annotation'},
+            '@aj(groups=["test"] required)': {'groups': ['test'], 'required': True},
+            "@aj(groups='[\"public\", \"owner\"]')": {'groups': ['public', 'owner']},
+            '@aj(name="my_mane")': {'name': 'my_mane'},
+            '@aj(d_format="%Y/%m/%d")': {'d_format': '%Y/%m/%d'},
+            '@aj(d_format="%Y--%H%M")': {'d_format': '%Y--%H%M'},
+            '@aj(required)': {'required': True},
+            '@aj(name=new_b)': {'name': 'new_b'},
+            '@aj(group=2)': {'group': '2'},
+            '@aj(groups=["with_customers"] name=customers)': {'groups': ['with_customers'], 'name': 'customers'},
+            '@aj(groups=["public","admin"])': {'groups': ['public', 'admin']},
+        }
+        for annotation, expected in annotations.items():
+            self.assertEqual(parse_aj_annotation(annotation), expected, annotation)
+
+    def test_multi_line_annotations(self):
+        annotation = '''@aj(
+                    groups="[
+                        'admin',
+                        'public'
+                        ]"
+                    name=annotation
+                    d_format=Y-M-D
+                    )'''
+        self.assertEqual(parse_aj_annotation(annotation),
+                         {'groups': ['admin', 'public'], 'name': 'annotation', 'd_format': 'Y-M-D'})
+        self.assertEqual(parse_aj_annotation('@aj(\n# name=a\n# groups=[1, 2]\n# )'), {'name': 'a', 'groups': [1, 2]})
+
+    def test_parameters_separated_by_commas(self):
+        self.assertEqual(parse_aj_annotation('@aj(name=firstName, groups=["public", "admin"], required=false)'),
+                         {'name': 'firstName', 'groups': ['public', 'admin'], 'required': False})
+
+    def test_invalid_annotations(self):
+        with self.assertRaises(AJsonAnnotationParseError):
+            parse_aj_annotation('@aj(name="unterminated)')
+        with self.assertRaises(AJsonAnnotationParseError):
+            _AttrReport('a', None, **parse_aj_annotation('@aj(groups=[unknown])'))
+        with self.assertRaises(AJsonAnnotationParseError):
+            _AttrReport('a', None, **parse_aj_annotation('@aj(groups=[[1]])'))
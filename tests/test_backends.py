@@ -0,0 +1,94 @@
+import io
+import json
+import unittest
+
+from ajson import backends
+from ajson.aserializer import ASerializer
+from ajson.backends import JsonBackend, available_backends, get_backend, set_default_backend
+from tests.conformance import add_conformance_test_cases
+
+
+class TestBackends(unittest.TestCase):
+    def tearDown(self):
+        set_default_backend('json')
+
+    def test_stdlib_json_is_the_default(self):
+        self.assertIs(type(ASerializer().backend), JsonBackend)
+        self.assertIn('json', available_backends())
+
+    def test_default_backend_can_be_changed(self):
+        set_default_backend(available_backends()[0])
+        self.assertEqual(ASerializer().backend.name, available_backends()[0])
+
+    def test_auto_uses_the_first_available_backend(self):
+        self.assertEqual(get_backend('auto').name, available_backends()[0])
+
+    def test_unknown_backend_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ASerializer(backend='yaml')
+
+    def test_backend_instances_are_used_as_they_are(self):
+        backend = JsonBackend()
+        self.assertIs(ASerializer(backend=backend).backend, backend)
+
+    def test_missing_backend_raises_import_error(self):
+        missing = [name for name in backends.BACKENDS if name not in available_backends()]
+        if not missing:
+            self.skipTest('every backend is installed')
+        with self.assertRaises(ImportError):
+            get_backend(missing[0])
+
+    def test_every_backend_produces_the_same_documents(self):
+        document = {'a': [1, 2.5, None, True], 'b': {'c': 'ñ/"\n'}, 1: 'int key', 'big': 1 << 70}
+        expected = json.loads(json.dumps(document))
+        for name in available_backends():
+            backend = get_backend(name)
+            self.assertEqual(json.loads(backend.dumps(document)), expected, name)
+            self.assertEqual(json.loads(backend.dumpb(document).decode('utf-8')), expected, name)
+            self.assertEqual(backend.loads(json.dumps(document)), expected, name)
+            self.assertEqual(backend.loads(json.dumps(document).encode('utf-8')), expected, name)
+
+    def test_every_backend_calls_the_default_hook(self):
+        for name in available_backends():
+            backend = get_backend(name)
+            self.assertEqual(json.loads(backend.dumps({'a': {1, 2}}, default=sorted)), {'a': [1, 2]}, name)
+            with self.assertRaises(TypeError, msg=name):
+                backend.dumps({'a': {1, 2}})
+
+    def test_serialize_many_writes_the_bytes_of_the_backend_in_binary_streams(self):
+        for name in available_backends():
+            fp = io.BytesIO()
+            throughput = ASerializer(backend=name).serialize_many([{'a': 'ñ'}, {'a': 2}], fp)
+            self.assertEqual([json.loads(line) for line in fp.getvalue().splitlines()], [{'a': 'ñ'}, {'a': 2}])
+            self.assertEqual(throughput.bytes, len(fp.getvalue()))
+
+
+class _BackendConformance(object):
+    """
+    Runs the tests of the serializer with another backend, the json documents are compared once decoded
+    since the backends don't use the same whitespaces
+    """
+    backend = 'json'
+
+    def setUp(self):
+        set_default_backend(self.backend)
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        set_default_backend('json')
+
+    def assertEqual(self, first, second, msg=None):
+        if isinstance(first, (str, bytes)) and isinstance(second, (str, bytes)):
+            try:
+                # json documents or json lines
+                first, second = ([json.loads(line) for line in document.splitlines() if line.strip()]
+                                 for document in (first, second))
+            except ValueError:
+                pass
+        super().assertEqual(first, second, msg)
+
+
+for backend in available_backends():
+    if backend != 'json':
+        add_conformance_test_cases(globals(), _BackendConformance, backend.capitalize(), backend=backend)
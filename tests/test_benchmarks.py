@@ -0,0 +1,31 @@
+import unittest
+
+from benchmarks import runner
+from benchmarks.workloads import WORKLOADS
+
+
+def _results(**ops_per_second):
+    return {'workloads': {name: {'ops_per_second': ops} for name, ops in ops_per_second.items()}}
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_measure_returns_ops_and_percentiles(self):
+        result = runner.measure(lambda: sum(range(100)), min_time=0, min_iterations=20, warm_up=0)
+        self.assertEqual(result['iterations'], 20)
+        self.assertGreater(result['ops_per_second'], 0)
+        self.assertLessEqual(result['p50_ms'], result['p90_ms'])
+        self.assertLessEqual(result['p90_ms'], result['p99_ms'])
+
+    def test_every_workload_runs(self):
+        for name, workload in WORKLOADS.items():
+            workload()()
+
+    def test_compare_flags_the_workloads_slower_than_the_threshold(self):
+        comparison = runner.compare(_results(a=100, b=100, c=100), _results(a=95, b=80, c=150, d=10), threshold=0.1)
+        self.assertEqual({row['workload']: row['regression'] for row in comparison},
+                         {'a': False, 'b': True, 'c': False})
+        self.assertAlmostEqual(comparison[1]['change'], -0.2)
+
+    def test_unknown_workloads_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            runner.run(['not_a_workload'], verbose=False)
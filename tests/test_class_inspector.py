@@ -1,4 +1,3 @@
-import json
 import unittest
 
 from ajson.type_inspector import TypeInspector
@@ -14,7 +13,7 @@ class TestClassInspector(unittest.TestCase):
         report = TypeInspector().inspect_type(CIA)
         self.assertEqual(len(report.keys()), 1)
         self.assertDictEqual(report, {
-            'a': {'groups': '["test"]', 'required': ''}
+            'a': {'groups': ['test'], 'required': True}
         })
 
     def test_parse_report_with_as_in_multiline(self):
@@ -33,7 +32,7 @@ class TestClassInspector(unittest.TestCase):
 
         report = TypeInspector().inspect_type(CIB)
         self.assertEqual(len(report.keys()), 1)
-        self.assertEqual(json.loads(report['a']['groups']), [1, 2, 3])
+        self.assertEqual(report['a']['groups'], [1, 2, 3])
 
     def test_annotation_without_attribute_is_ignore(self):
         class CID:
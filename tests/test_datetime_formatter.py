@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from ajson.aserializer import ASerializer
+from ajson.datetime_formatter import compile_datetime_format
+from ajson.json_type_reports import ISO_FORMAT
+
+
+class TestDatetimeFormatter(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            datetime(2010, 5, 10, 2, 40, 3, 12),
+            datetime(1, 1, 1),
+            datetime(999, 12, 31, 23, 59, 59, 999999),
+            datetime(9999, 12, 31),
+            datetime(2020, 1, 1, 10, tzinfo=timezone(timedelta(hours=2))),
+        ]
+
+    def test_compiled_formats_are_identical_to_strftime(self):
+        formats = [ISO_FORMAT, '%Y/%m/%d', '%Y--%H%M', '%H', '%d %% %f é', 'plain', '%Y %b', '%z%Y']
+        for datetime_format in formats:
+            for cache_size in (0, 2):
+                formatter = compile_datetime_format(datetime_format, cache_size)
+                for date in self.dates:
+                    self.assertEqual(formatter(date), date.strftime(datetime_format), datetime_format)
+
+    def test_cached_formatter_distinguishes_equal_dates_in_different_timezones(self):
+        formatter = compile_datetime_format('%Y-%m-%d %H', cache_size=10)
+        date = datetime(2020, 1, 1, 10, tzinfo=timezone.utc)
+        same_instant = date.astimezone(timezone(timedelta(hours=2)))
+        self.assertEqual(formatter(date), '2020-01-01 10')
+        self.assertEqual(formatter(same_instant), '2020-01-01 12')
+
+    def test_serializer_uses_compiled_formats(self):
+        serializer = ASerializer(datetime_cache_size=10)
+        dates = self.dates * 2
+        self.assertEqual(serializer.to_dict(dates), [date.strftime(ISO_FORMAT) for date in dates])
@@ -0,0 +1,49 @@
+import unittest
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from unittest import mock
+
+from ajson import aserializer
+from ajson.aserializer import ASerializer
+from ajson.decoders import compile_decoders
+
+
+def _decode(value, hint, attr_report, init_args_array, init_kargs):
+    # tags the items with their hint to check which one every item gets
+    return value, hint
+
+
+class TestDecoders(unittest.TestCase):
+    def test_sequence_hints_return_their_container_type(self):
+        self.assertEqual(compile_decoders(List[int], _decode)[0]([1], None, (), {}), [(1, int)])
+        self.assertEqual(compile_decoders(Set[int], _decode)[0]([1], None, (), {}), {(1, int)})
+        self.assertEqual(compile_decoders(FrozenSet[int], _decode)[0]([1], None, (), {}), frozenset({(1, int)}))
+        self.assertEqual(compile_decoders(Tuple[int, ...], _decode)[0]([1, 2], None, (), {}), ((1, int), (2, int)))
+        self.assertEqual(compile_decoders(tuple, _decode)[0]([1], None, (), {}), ((1, None),))
+
+    def test_fixed_tuples_decode_every_item_with_its_hint(self):
+        decoder = compile_decoders(Tuple[int, str], _decode)[0]
+        self.assertEqual(decoder([1, 'a'], None, (), {}), ((1, int), ('a', str)))
+        self.assertEqual(decoder([1, 'a', 2], None, (), {}), ((1, int), ('a', str), (2, None)))
+
+    def test_dict_hints_decode_keys_and_values(self):
+        self.assertEqual(compile_decoders(Dict[str, int], _decode)[1]({'a': 1}, None, (), {}), {'a': (1, int)})
+        self.assertEqual(compile_decoders(Dict[int, str], _decode)[1]({'1': 'a', 'x': 'b'}, None, (), {}),
+                         {1: ('a', str), 'x': ('b', str)})
+
+    def test_hints_only_apply_to_their_kind_of_value(self):
+        self.assertIsNone(compile_decoders(List[int], _decode)[1])
+        self.assertIsNone(compile_decoders(Dict[str, int], _decode)[0])
+        self.assertEqual(compile_decoders(int, _decode), (None, None))
+        self.assertEqual(compile_decoders(Union[int, str], _decode), (None, None))
+
+    def test_optional_hints_decode_the_values_with_their_type(self):
+        list_decoder, dict_decoder = compile_decoders(Optional[List[int]], _decode)
+        self.assertEqual(list_decoder([1], None, (), {}), ([1], List[int]))
+        self.assertEqual(dict_decoder({}, None, (), {}), ({}, List[int]))
+
+    def test_serializer_compiles_every_hint_once(self):
+        serializer = ASerializer()
+        with mock.patch.object(aserializer, 'compile_decoders', wraps=compile_decoders) as compile_mock:
+            for _ in range(3):
+                serializer.from_dict([[{'1': [1]}] * 10] * 10, List[List[Dict[int, Set[int]]]])
+        self.assertEqual(compile_mock.call_count, 4)
@@ -0,0 +1,160 @@
+import dataclasses
+import unittest
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+import attr
+
+from ajson import AJson
+from ajson.aserializer import ASerializer, ENGINE_ITERATIVE
+from ajson.field_classes import get_fields
+from ajson.json_type_reports import CONSTRUCT_INIT, CONSTRUCT_KWARGS, JsonTypeReports, UNKNOWN_KEYS_ATTRIBUTE, \
+    UNKNOWN_KEYS_COLLECT
+from ajson.references import REFERENCES_IDS
+
+
+@AJson()
+@dataclasses.dataclass
+class FCAddress:
+    street: str = dataclasses.field(metadata={'aj': {'name': 'streetName', 'groups': ['public']}})
+    number: int = dataclasses.field(default=0, metadata={'aj': '@aj(groups=["admin"])'})
+    _secret: str = 'secret'
+    created: Optional[datetime] = dataclasses.field(default=None, metadata={'aj': 'd_format="%Y/%m/%d"'})
+    visits: int = dataclasses.field(default=0, init=False)
+
+
+@AJson()
+@dataclasses.dataclass(frozen=True)
+class FCFrozenPoint:
+    x: int
+    y: int
+
+
+@AJson()
+@attr.s
+class FCCustomer:
+    name = attr.ib(type=str, metadata={'aj': {'name': 'firstName'}})
+    _email = attr.ib(type=str, default=None, metadata={'aj': {'name': 'email'}})
+    addresses = attr.ib(type=List[FCAddress], factory=list)
+
+
+@AJson()
+class FCCoordinates(NamedTuple):
+    __aj__ = {'latitude': {'name': 'lat'}}
+    latitude: float
+    longitude: float = 0.0
+
+
+# the annotations are strings like with "from __future__ import annotations"
+@AJson()
+@dataclasses.dataclass
+class FCOffice:
+    address: 'FCAddress'
+    opened: 'Optional[datetime]' = None
+
+
+@AJson()
+@attr.s(auto_attribs=True)
+class FCCompany:
+    offices: 'List[FCOffice]'
+
+
+class TestFieldClasses(unittest.TestCase):
+    def setUp(self):
+        self.serializer = ASerializer()
+
+    def test_get_fields_only_returns_fields_for_field_classes(self):
+        self.assertEqual([field.name for field in get_fields(FCAddress)],
+                         ['street', 'number', '_secret', 'created', 'visits'])
+        self.assertEqual([field.init_name for field in get_fields(FCCustomer)], ['name', 'email', 'addresses'])
+        self.assertEqual([field.metadata for field in get_fields(FCCoordinates)], [{'name': 'lat'}, None])
+        self.assertIsNone(get_fields(ASerializer))
+
+    def test_reports_are_built_from_the_field_metadata(self):
+        report = JsonTypeReports().get(FCAddress)
+        self.assertEqual(report.get('street').name, 'streetName')
+        self.assertEqual(report.get('street').groups, frozenset(['public']))
+        self.assertEqual(report.get('number').groups, frozenset(['admin']))
+        self.assertEqual(report.get('created').datetime_format, '%Y/%m/%d')
+        self.assertEqual(report.construct, CONSTRUCT_KWARGS)
+        self.assertIs(JsonTypeReports().get(FCCustomer).get('addresses').hint, List[FCAddress])
+
+    def test_classes_without_source_can_be_registered(self):
+        point_type = dataclasses.make_dataclass(
+            'FCGeneratedPoint', [('x', int, dataclasses.field(metadata={'aj': {'name': 'xx'}}))])
+        AJson()(point_type)
+        try:
+            self.assertEqual(self.serializer.serialize(point_type(1)), '{"xx": 1}')
+            self.assertEqual(self.serializer.unserialize('{"xx": 2}', point_type), point_type(2))
+        finally:
+            JsonTypeReports().reports.pop(point_type)
+
+    def test_serialize_dataclass(self):
+        address = FCAddress('Broadway', 5, created=datetime(2000, 1, 2))
+        self.assertEqual(self.serializer.to_dict(address),
+                         {'streetName': 'Broadway', 'number': 5, 'created': '2000/01/02', 'visits': 0})
+        self.assertEqual(self.serializer.to_dict(address, groups=['public']), {'streetName': 'Broadway'})
+
+    def test_unserialize_dataclass(self):
+        address = self.serializer.unserialize('{"streetName": "Broadway", "created": "2000/01/02", "visits": 3}',
+                                              FCAddress)
+        expected = FCAddress('Broadway', created=datetime(2000, 1, 2))
+        expected.visits = 3
+        self.assertEqual(address, expected)
+        self.assertEqual(self.serializer.unserialize('{"x": 1, "y": 2}', FCFrozenPoint), FCFrozenPoint(1, 2))
+
+    def test_attrs_classes_round_trip(self):
+        customer = FCCustomer('John', 'john@something.com', [FCAddress('Broadway')])
+        json_str = self.serializer.serialize(customer)
+        self.assertEqual(self.serializer.to_dict(customer)['email'], 'john@something.com')
+        self.assertEqual(self.serializer.unserialize(json_str, FCCustomer), customer)
+
+    def test_named_tuples_are_serialized_as_objects(self):
+        coordinates = FCCoordinates(1.5, 2.5)
+        self.assertEqual(self.serializer.serialize(coordinates), '{"lat": 1.5, "longitude": 2.5}')
+        self.assertEqual(self.serializer.serialize([coordinates]), '[{"lat": 1.5, "longitude": 2.5}]')
+        self.assertEqual(''.join(self.serializer.serialize_iter(coordinates)), '{"lat": 1.5, "longitude": 2.5}')
+        self.assertEqual(ASerializer(engine=ENGINE_ITERATIVE).to_dict(coordinates), {'lat': 1.5, 'longitude': 2.5})
+        self.assertEqual(self.serializer.unserialize('{"lat": 1.5}', FCCoordinates), FCCoordinates(1.5))
+
+    def test_references_to_field_classes(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        points = serializer.unserialize('[{"$id": 1, "x": 3, "y": 4}, {"$ref": 1}]', List[FCFrozenPoint])
+        self.assertEqual(points[0], FCFrozenPoint(3, 4))
+        self.assertIs(points[0], points[1])
+        coordinates = FCCoordinates(1.5)
+        result = serializer.unserialize(serializer.serialize([coordinates, coordinates]), List[FCCoordinates])
+        self.assertIs(result[0], result[1])
+
+    def test_collect_unknown_keys(self):
+        serializer = ASerializer(unknown_keys=UNKNOWN_KEYS_COLLECT)
+        point = serializer.unserialize('{"x": 1, "y": 2, "z": 3}', FCFrozenPoint)
+        self.assertEqual(getattr(point, UNKNOWN_KEYS_ATTRIBUTE), {'z': 3})
+        customer = serializer.unserialize('{"firstName": "John", "age": 30}', FCCustomer)
+        self.assertEqual(getattr(customer, UNKNOWN_KEYS_ATTRIBUTE), {'age': 30})
+        # the named tuples can't have other attributes, the unknown keys are not kept
+        coordinates = serializer.unserialize('{"lat": 1.5, "altitude": 3}', FCCoordinates)
+        self.assertEqual(coordinates, FCCoordinates(1.5))
+        self.assertFalse(hasattr(coordinates, UNKNOWN_KEYS_ATTRIBUTE))
+
+    def test_string_annotations_are_resolved(self):
+        self.assertIs(JsonTypeReports().get(FCOffice).get('address').hint, FCAddress)
+        self.assertEqual(JsonTypeReports().get(FCCompany).get('offices').hint, List[FCOffice])
+        company = FCCompany([FCOffice(FCAddress('Broadway'), datetime(2000, 1, 2))])
+        self.assertEqual(self.serializer.unserialize(self.serializer.serialize(company), FCCompany), company)
+
+        @dataclasses.dataclass
+        class FCUnresolved:
+            a: 'int'
+            b: 'UnknownName'  # noqa: F821
+
+        self.assertEqual([field.hint for field in get_fields(FCUnresolved)], ['int', 'UnknownName'])
+
+    def test_construct_can_be_overridden(self):
+        @AJson(construct=CONSTRUCT_INIT)
+        @dataclasses.dataclass
+        class FCDefaults:
+            a: int = 1
+
+        self.assertEqual(JsonTypeReports().get(FCDefaults).construct, CONSTRUCT_INIT)
+        self.assertEqual(self.serializer.unserialize('{"a": 2}', FCDefaults).a, 2)
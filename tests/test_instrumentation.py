@@ -0,0 +1,107 @@
+import pickle
+import unittest
+
+from ajson.aserializer import ASerializer
+from tests.types_for_tests.test_serializaer_with_annotations_types import SSimpleObjectAJsonNested1, \
+    SSimpleObjectAJsonNested2
+
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_disabled_by_default(self):
+        serializer = ASerializer()
+        serializer.serialize(SSimpleObjectAJsonNested2())
+        self.assertEqual(serializer.stats(), {})
+
+    def test_disabled_instrumentation_uses_the_plain_handlers(self):
+        serializer = ASerializer()
+        serializer.serialize(SSimpleObjectAJsonNested2())
+        self.assertEqual(serializer._serialize_dispatch[SSimpleObjectAJsonNested2],
+                         serializer._ASerializer__object_handler)
+        serializer.enable_instrumentation()
+        serializer.serialize(SSimpleObjectAJsonNested2())
+        self.assertEqual(serializer._serialize_dispatch[SSimpleObjectAJsonNested2].__name__, 'instrumented_handler')
+
+    def test_stats_by_class_and_groups(self):
+        serializer = ASerializer(instrumentation=True)
+        serializer.serialize([SSimpleObjectAJsonNested2(), SSimpleObjectAJsonNested2()], groups=['admin'])
+        serializer.serialize(SSimpleObjectAJsonNested2())
+
+        stats = serializer.stats()
+        admin = stats[(SSimpleObjectAJsonNested2, frozenset(['admin']))]
+        self.assertEqual(admin.calls, 2)
+        self.assertEqual(admin.attributes, 2)
+        self.assertEqual(admin.max_depth, 2)
+        self.assertGreater(admin.seconds, 0)
+        self.assertEqual(stats[(SSimpleObjectAJsonNested1, frozenset(['admin']))].calls, 2)
+        self.assertEqual(stats[(SSimpleObjectAJsonNested2, None)].calls, 1)
+        self.assertEqual(stats[(SSimpleObjectAJsonNested1, None)].calls, 2)
+        self.assertEqual(stats[(SSimpleObjectAJsonNested1, None)].attributes, 4)
+
+    def test_objects_without_report_are_counted(self):
+        serializer = ASerializer(instrumentation=True)
+        self.assertEqual(serializer.to_dict(Point(1, 2)), {'x': 1, 'y': 2})
+        self.assertEqual(serializer.stats()[(Point, None)].attributes, 2)
+
+    def test_custom_handler_hits(self):
+        serializer = ASerializer(instrumentation=True)
+        serializer.add_serialize_handler(Point, lambda point, *args: [point.x, point.y])
+        self.assertEqual(serializer.serialize([Point(1, 2), Point(3, 4)]), '[[1, 2], [3, 4]]')
+        point_stats = serializer.stats()[(Point, None)]
+        self.assertEqual(point_stats.calls, 2)
+        self.assertEqual(point_stats.handler_hits, 2)
+
+    def test_truncations(self):
+        serializer = ASerializer(max_depth=2, instrumentation=True)
+        serializer.serialize([[Point(1, 2)], Point(3, 4)])
+        point_stats = serializer.stats()[(Point, None)]
+        self.assertEqual(point_stats.truncations, 1)
+        self.assertEqual(point_stats.calls, 1)
+
+    def test_stats_are_copies_and_can_be_reset(self):
+        serializer = ASerializer(instrumentation=True)
+        serializer.serialize(Point(1, 2))
+        stats = serializer.stats()
+        serializer.serialize(Point(1, 2))
+        self.assertEqual(stats[(Point, None)].calls, 1)
+        serializer.reset_stats()
+        self.assertEqual(serializer.stats(), {})
+
+    def test_enable_and_disable(self):
+        serializer = ASerializer()
+        serializer.serialize(Point(1, 2))
+        serializer.enable_instrumentation()
+        serializer.serialize(Point(1, 2))
+        serializer.enable_instrumentation(False)
+        serializer.serialize(Point(1, 2))
+        self.assertEqual(serializer.stats(), {})
+        serializer.enable_instrumentation()
+        self.assertEqual(serializer.stats()[(Point, None)].calls, 1)
+
+    def test_hooks(self):
+        calls = []
+        serializer = ASerializer()
+        serializer.add_hooks(pre=lambda obj, groups, depth: calls.append(('pre', type(obj), depth)),
+                             post=lambda obj, groups, depth, value, seconds: calls.append(('post', value)))
+        serializer.serialize({'point': Point(1, 2)})
+        self.assertEqual(calls, [('pre', Point, 2), ('post', {'x': 1, 'y': 2})])
+
+    def test_serializers_with_hooks_can_be_pickled(self):
+        serializer = ASerializer()
+        serializer.add_hooks(post=lambda obj, groups, depth, value, seconds: None)
+        for enabled in (True, False):
+            serializer.enable_instrumentation(enabled)
+            copy = pickle.loads(pickle.dumps(serializer))
+            self.assertEqual(copy.stats(), {})
+            self.assertEqual(copy.serialize(Point(1, 2)), serializer.serialize(Point(1, 2)))
+
+    def test_streamed_output_is_the_same(self):
+        serializer = ASerializer(instrumentation=True)
+        obj = [SSimpleObjectAJsonNested2(), Point(1, 2)]
+        self.assertEqual(''.join(serializer.serialize_iter(obj)), ASerializer().serialize(obj))
+        self.assertEqual(serializer.stats()[(Point, None)].calls, 1)
@@ -0,0 +1,95 @@
+import sys
+import unittest
+
+from ajson import AJson
+from ajson.aserializer import ASerializer, ENGINE_ITERATIVE, ENGINE_RECURSIVE, _dumps_iterative
+from ajson.json_type_reports import JsonTypeReports
+from tests.conformance import add_conformance_test_cases
+from tests.types_for_tests.test_serializaer_with_annotations_types import SObjectWithGroupsAndNoGroups, \
+    SSimpleObjectAJsonNested2
+
+
+class Chain(object):
+    def __init__(self, value, next_link=None):
+        self.value = value
+        self.next_link = next_link
+        self._private = 'hidden'
+
+
+class TestIterativeEngine(unittest.TestCase):
+    def setUp(self):
+        self.serializer = ASerializer(engine=ENGINE_ITERATIVE)
+
+    def test_unknown_engine_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ASerializer(engine='magic')
+
+    def test_recursive_engine_is_the_default(self):
+        self.assertEqual(ASerializer().engine, ENGINE_RECURSIVE)
+
+    def test_same_documents_as_the_recursive_engine(self):
+        objs = [
+            {'a': [1, (2, 3), {4, 5}], '_private': 1, None: 'none key', 'empty': [], 'nested': {}},
+            [SSimpleObjectAJsonNested2(), SObjectWithGroupsAndNoGroups()],
+            Chain(1, Chain(2, Chain(3))),
+            (i for i in range(3)),
+        ]
+        for obj in objs:
+            for groups in (None, ['public'], ['admin', 'basic']):
+                obj = list(obj) if hasattr(obj, '__next__') else obj
+                self.assertEqual(self.serializer.to_dict(obj, groups), ASerializer().to_dict(obj, groups))
+                self.assertEqual(self.serializer.serialize(obj, groups), ASerializer().serialize(obj, groups))
+
+    def test_max_depth_replaces_the_deeper_values(self):
+        nested = {'d1': {'d2': {'d3': 'value deep inside'}}}
+        for max_depth in range(5):
+            self.assertEqual(ASerializer(max_depth=max_depth, engine=ENGINE_ITERATIVE).serialize(nested),
+                             ASerializer(max_depth=max_depth).serialize(nested))
+
+    def test_structures_deeper_than_the_recursion_limit(self):
+        levels = sys.getrecursionlimit() * 3
+        chain = None
+        for value in range(levels):
+            chain = Chain(value, [chain])
+        serializer = ASerializer(max_depth=levels * 3, engine=ENGINE_ITERATIVE)
+        serialized = serializer.to_dict(chain)
+        for value in reversed(range(levels)):
+            self.assertEqual(serialized['value'], value)
+            serialized = serialized['next_link'][0]
+        self.assertIsNone(serialized)
+        json_str = serializer.serialize(chain)
+        self.assertTrue(json_str.startswith('{{"value": {}, "next_link": [{{"value": {}, '.format(levels - 1,
+                                                                                                   levels - 2)))
+        self.assertTrue(json_str.endswith(']}' * levels))
+
+    def test_dumps_iterative_matches_json_dumps(self):
+        document = {'a': [1, 2.5, None, True, 'ñ/"\n'], 1: {'b': []}, 'c': {}, 'd': [[[]]], 'e': (1, 2)}
+        self.assertEqual(_dumps_iterative(document), ASerializer().backend.dumps(document))
+        self.assertEqual(_dumps_iterative('value'), '"value"')
+
+    def test_custom_handlers_are_used(self):
+        self.serializer.add_serialize_handler(Chain, lambda obj, *args: obj.value)
+        self.assertEqual(self.serializer.to_dict({'a': [Chain(1)]}), {'a': [1]})
+
+    def test_lazy_classes_are_resolved(self):
+        @AJson(lazy=True)
+        class LazyChain(object):
+            value: int = 1  # @aj(name=v)
+
+        try:
+            self.assertEqual(self.serializer.to_dict([LazyChain()]), [{'v': 1}])
+        finally:
+            JsonTypeReports().reports.pop(LazyChain, None)
+
+
+class _IterativeConformance(object):
+    """
+    Runs the tests of the serializer with the iterative engine
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.serializer.engine = ENGINE_ITERATIVE
+
+
+add_conformance_test_cases(globals(), _IterativeConformance, 'Iterative')
@@ -0,0 +1,48 @@
+import io
+import json
+import unittest
+
+from ajson.json_stream import iter_json_array, split_json_array
+
+
+class TestJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.items = [1, 12345, "abcé" * 10, {"a": [1, 2, {"b": None}]}, True, None, -1.5e10, [], {}, "x"]
+
+    def test_array_is_decoded_from_text_with_any_chunk_size(self):
+        text = json.dumps(self.items)
+        for chunk_size in (1, 2, 7, 1000):
+            self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size)), self.items)
+
+    def test_array_is_decoded_from_binary_chunks_splitting_characters(self):
+        data = json.dumps(self.items, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(list(iter_json_array(io.BytesIO(data), chunk_size=3)), self.items)
+        self.assertEqual(list(iter_json_array([data[i:i + 3] for i in range(0, len(data), 3)])), self.items)
+
+    def test_items_are_yielded_before_reading_the_whole_input(self):
+        chunks = iter(['[{"a": 1}, ', '{"a": 2}', ', {"a"', ': 3}]'])
+        items = iter_json_array(chunks)
+        self.assertEqual(next(items), {"a": 1})
+        self.assertEqual(list(chunks), ['{"a": 2}', ', {"a"', ': 3}]'])
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array(' [ ] ')), [])
+
+    def test_invalid_json_raises_decode_error(self):
+        for invalid in ('', '1', '[1,]', '[1 2]', '[1', '["abc', '[1] 2'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_array(io.StringIO(invalid), chunk_size=1))
+
+    def test_split_array_in_chunks_of_whole_elements(self):
+        items = [1, 'a,]"[', {'x': [1, 2, {'y': '}'}]}, [], None, 'é']
+        text = json.dumps(items)
+        for chunk_size in (0, 5, 10, 1000):
+            chunks = split_json_array(text, chunk_size)
+            self.assertEqual([item for chunk in chunks for item in json.loads('[' + chunk + ']')], items)
+        self.assertEqual(len(split_json_array(text, 0)), len(items))
+        self.assertEqual(split_json_array(' [ ] ', 10), [])
+
+    def test_split_invalid_array_raises_decode_error(self):
+        for invalid in ('', '{}', '[1', '[1] 2'):
+            with self.assertRaises(json.JSONDecodeError):
+                split_json_array(invalid, 10)
@@ -0,0 +1,98 @@
+import pickle
+import tracemalloc
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import ajson.json_type_reports as json_type_reports
+from ajson.aserializer import ASerializer
+from ajson.class_decorator import AJson
+from ajson.json_type_reports import JsonTypeReports, _AttrReport
+from tests.types_for_tests.test_serializaer_with_annotations_types import SSimpleObjectAJson, \
+    SSimpleObjectAJsonNested2, USNestedObject0
+
+
+def _allocations_in_reports_module(function, times: int = 1000) -> int:
+    """
+    Number of memory blocks allocated by the code of json_type_reports that are still alive after
+    calling `function` `times` times, the results are kept alive so nothing allocated is released
+    """
+    function()
+    results = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(times):
+            results.append(function())
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    module_filter = [tracemalloc.Filter(True, json_type_reports.__file__)]
+    differences = after.filter_traces(module_filter).compare_to(before.filter_traces(module_filter), 'filename')
+    return sum(difference.count_diff for difference in differences)
+
+
+class TestAttrReport(unittest.TestCase):
+    def test_reports_are_immutable(self):
+        report = _AttrReport('a', int, groups=['admin'])
+        with self.assertRaises(AttributeError):
+            report.hint = str
+        with self.assertRaises(AttributeError):
+            report.other = 1
+        self.assertFalse(hasattr(report, '__dict__'))
+
+    def test_replace_returns_a_modified_copy(self):
+        report = _AttrReport('a', None, groups=['admin'], name='b', d_format='%Y')
+        copy = report.replace(hint=datetime)
+        self.assertIsNone(report.hint)
+        self.assertIs(copy.hint, datetime)
+        self.assertEqual((copy.attribute_name, copy.name, copy.groups, copy.datetime_format),
+                         ('a', 'b', frozenset(['admin']), '%Y'))
+        self.assertTrue(copy.parse_datetime)
+
+    def test_reports_can_be_pickled(self):
+        report = _AttrReport('a', int, groups=['admin'], required=True)
+        report.get_validator()
+        unpickled = pickle.loads(pickle.dumps(report))
+        self.assertEqual((unpickled.attribute_name, unpickled.hint, unpickled.groups, unpickled.required),
+                         ('a', int, frozenset(['admin']), True))
+        self.assertTrue(unpickled.get_validator()(1))
+
+
+class TestTypeReport(unittest.TestCase):
+    def test_attributes_without_report_share_the_default_report(self):
+        type_report = JsonTypeReports().get(SSimpleObjectAJson)
+        self.assertIs(type_report.get('b'), type_report.get('b'))
+        self.assertIs(type_report.get('b'), JsonTypeReports().get(USNestedObject0).get('b'))
+        self.assertEqual(type_report.get('b').name, 'b')
+
+    def test_child_hints_do_not_modify_the_parent_reports(self):
+        @AJson()
+        class TRParent:
+            a = None  # @aj(name=aa)
+
+        @AJson()
+        class TRChild(TRParent):
+            a: int = 1
+
+        self.assertIsNone(JsonTypeReports().get(TRParent).get('a').hint)
+        self.assertIs(JsonTypeReports().get(TRChild).get('a').hint, int)
+        self.assertEqual(JsonTypeReports().get(TRChild).get('a').name, 'aa')
+
+    def test_report_lookups_do_not_allocate(self):
+        type_report = JsonTypeReports().get(SSimpleObjectAJson)
+        self.assertEqual(_allocations_in_reports_module(lambda: type_report.get('b')), 0)
+        self.assertEqual(_allocations_in_reports_module(lambda: type_report.get_by_serialize_name('a')), 0)
+        self.assertEqual(_allocations_in_reports_module(lambda: type_report.get_serialization_plan(None)), 0)
+
+    def test_serialize_and_unserialize_do_not_allocate_reports(self):
+        serializer = ASerializer()
+        obj = SSimpleObjectAJsonNested2()
+        json_str = '{"my_mane": 1, "date": "2000/01/01", "unknown": 2}'
+        self.assertEqual(_allocations_in_reports_module(lambda: serializer.to_dict(obj)), 0)
+        self.assertEqual(_allocations_in_reports_module(lambda: serializer.unserialize(json_str, USNestedObject0)), 0)
+
+        with patch.object(_AttrReport, '__init__', side_effect=AssertionError('report created')):
+            serializer.serialize(obj)
+            serializer.serialize(SSimpleObjectAJson(), groups=['admin'])
+            serializer.unserialize(json_str, USNestedObject0)
@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from ajson.aserializer import ASerializer
+from ajson.backends import available_backends
+from tests.types_for_tests.test_serializaer_with_annotations_types import *
+
+
+class TestParallelSerialization(unittest.TestCase):
+    def setUp(self):
+        self.serializer = ASerializer()
+        self.objs = [SSimpleObjectAJsonNested2() for _ in range(50)] + [SSimpleObjectWithDate() for _ in range(50)]
+
+    def test_serialize_parallel_returns_the_same_json_array_as_serialize(self):
+        serialization = self.serializer.serialize_parallel(self.objs, ['admin'], workers=2, chunk_size=7,
+                                                           parallel_threshold=0)
+        self.assertEqual(serialization, self.serializer.serialize(self.objs, ['admin']))
+
+    def test_serialize_parallel_uses_the_separator_of_the_backend(self):
+        for backend in available_backends():
+            serializer = ASerializer(backend=backend)
+            serialization = serializer.serialize_parallel(self.objs, workers=2, chunk_size=7, parallel_threshold=0)
+            self.assertEqual(serialization, serializer.serialize(self.objs), backend)
+
+    def test_serialize_parallel_returns_json_lines_in_order(self):
+        serialization = self.serializer.serialize_parallel(self.objs, workers=2, lines=True, parallel_threshold=0)
+        self.assertEqual(serialization, ''.join(self.serializer.serialize(obj) + '\n' for obj in self.objs))
+
+    def test_serialize_parallel_below_threshold_runs_in_process(self):
+        self.serializer.add_serialize_handler(datetime, lambda d, g, a: d.year)  # lambdas can't be pickled
+        serialization = self.serializer.serialize_parallel(self.objs, workers=2)
+        self.assertEqual(serialization, self.serializer.serialize(self.objs))
+        self.assertEqual(self.serializer.serialize_parallel([], workers=2, parallel_threshold=0), '[]')
+
+
+class TestParallelUnserialization(unittest.TestCase):
+    def setUp(self):
+        self.serializer = ASerializer()
+        self.json_str = json.dumps([{'my_mane': i, 'date': '2000/0{}/01'.format(i % 9 + 1)} for i in range(100)])
+
+    def test_unserialize_parallel_returns_the_objects_in_order(self):
+        objs = self.serializer.unserialize_parallel(self.json_str, List[USNameAndDateObjectAJson2], workers=2,
+                                                    chunk_size=100, parallel_threshold=0)
+        self.assertEqual(len(objs), 100)
+        self.assertIsInstance(objs[10], USNameAndDateObjectAJson2)
+        self.assertEqual([obj.a for obj in objs], list(range(100)))
+        self.assertEqual(objs[10].date.month, 2)
+
+    def test_unserialize_parallel_reads_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, 'objects.json')
+            path.write_text(self.json_str)
+            objs = self.serializer.unserialize_parallel(path, USNameAndDateObjectAJson2, workers=2,
+                                                        parallel_threshold=0)
+        self.assertEqual([obj.a for obj in objs], list(range(100)))
+
+    def test_unserialize_parallel_only_reads_files_from_paths(self):
+        for parallel_threshold in (0, 1 << 20):
+            with self.assertRaises(json.JSONDecodeError):
+                self.serializer.unserialize_parallel(' {"my_mane": 1}', workers=2,
+                                                     parallel_threshold=parallel_threshold)
+            with self.assertRaises(json.JSONDecodeError):
+                self.serializer.unserialize_parallel('objects.json', workers=2, parallel_threshold=parallel_threshold)
+
+    def test_unserialize_parallel_below_threshold_runs_in_process(self):
+        objs = self.serializer.unserialize_parallel(self.json_str, List[USNameAndDateObjectAJson2], workers=2)
+        self.assertEqual([obj.a for obj in objs], list(range(100)))
@@ -0,0 +1,147 @@
+import io
+import json
+import unittest
+from typing import List, Optional
+
+from ajson.aserializer import ASerializer
+from ajson.class_decorator import AJson
+from ajson.json_type_reports import CONSTRUCT_KWARGS, AJsonUnknownReferenceError
+from ajson.references import REFERENCES_IDS, REFERENCES_MEMO
+
+
+@AJson()
+class RCountry(object):
+    code: str  # @aj(name=countryCode)
+
+    def __init__(self, code: str = ''):
+        self.code = code
+
+
+@AJson(lazy=True)
+class RCity(object):
+    name: str  # @aj()
+    country: RCountry  # @aj()
+    neighbours: list  # @aj()
+
+    def __init__(self, name: str = '', country: Optional[RCountry] = None):
+        self.name = name
+        self.country = country
+        self.neighbours = []
+
+
+# the hints with forward references are not resolved, it is set before the report is built
+RCity.__annotations__['neighbours'] = List[RCity]
+
+
+@AJson(construct=CONSTRUCT_KWARGS)
+class RPoint(object):
+    x: int
+    y: int
+
+    def __init__(self, x: int, y: int):
+        self.x, self.y = x, y
+
+
+class RNode(object):
+    def __init__(self, name):
+        self.name = name
+        self.children = []
+
+
+def _cities():
+    spain = RCountry('ES')
+    madrid = RCity('Madrid', spain)
+    toledo = RCity('Toledo', spain)
+    madrid.neighbours.append(toledo)
+    toledo.neighbours.append(madrid)
+    return madrid, toledo
+
+
+class TestReferencesMemo(unittest.TestCase):
+    def test_shared_objects_reuse_their_serialized_dict(self):
+        spain = RCountry('ES')
+        cities = [RCity('Madrid', spain), RCity('Toledo', spain)]
+        serialized = ASerializer(references=REFERENCES_MEMO).to_dict(cities)
+        self.assertIs(serialized[0]['country'], serialized[1]['country'])
+        self.assertEqual(serialized, ASerializer().to_dict(cities))
+
+    def test_cycles_are_replaced_without_reaching_max_depth(self):
+        node = RNode('root')
+        node.children.append(node)
+        self.assertEqual(ASerializer(references=REFERENCES_MEMO).to_dict(node),
+                         {'name': 'root', 'children': ['...']})
+
+    def test_memo_is_not_shared_between_calls(self):
+        serializer = ASerializer(references=REFERENCES_MEMO)
+        node = RNode('a')
+        first = serializer.to_dict([node])
+        node.name = 'b'
+        self.assertEqual(serializer.to_dict([node]), [{'name': 'b', 'children': []}])
+        self.assertEqual(first, [{'name': 'a', 'children': []}])
+
+    def test_streamed_output_is_the_same(self):
+        madrid, _ = _cities()
+        serializer = ASerializer(references=REFERENCES_MEMO)
+        self.assertEqual(''.join(serializer.serialize_iter(madrid)), serializer.serialize(madrid))
+
+
+class TestReferencesIds(unittest.TestCase):
+    def test_repeated_objects_are_written_as_references(self):
+        madrid, _ = _cities()
+        self.assertEqual(json.loads(ASerializer(references=REFERENCES_IDS).serialize(madrid)), {
+            '$id': 1, 'name': 'Madrid', 'country': {'$id': 2, 'countryCode': 'ES'}, 'neighbours': [
+                {'$id': 3, 'name': 'Toledo', 'country': {'$ref': 2}, 'neighbours': [{'$ref': 1}]}
+            ]
+        })
+
+    def test_unserialize_rebuilds_the_shared_graph(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        madrid = serializer.unserialize(serializer.serialize(_cities()[0]), RCity)
+        toledo = madrid.neighbours[0]
+        self.assertEqual((madrid.name, toledo.name), ('Madrid', 'Toledo'))
+        self.assertIs(toledo.neighbours[0], madrid)
+        self.assertIs(toledo.country, madrid.country)
+        self.assertEqual(madrid.country.code, 'ES')
+
+    def test_references_between_items_of_arrays(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        spain = RCountry('ES')
+        json_str = serializer.serialize([spain, spain, RCountry('FR')])
+        for countries in (serializer.unserialize(json_str, List[RCountry]),
+                          list(serializer.unserialize_iter(io.StringIO(json_str), RCountry)),
+                          serializer.unserialize_parallel(json_str, RCountry)):
+            self.assertIs(countries[0], countries[1])
+            self.assertEqual([country.code for country in countries], ['ES', 'ES', 'FR'])
+
+    def test_references_to_objects_created_with_kwargs(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        point = RPoint(1, 2)
+        points = serializer.unserialize(serializer.serialize([point, point]), List[RPoint])
+        self.assertIs(points[0], points[1])
+        self.assertEqual((points[0].x, points[0].y), (1, 2))
+
+    def test_json_lines_have_their_own_references(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        spain = RCountry('ES')
+        fp = io.StringIO()
+        serializer.serialize_many([spain, spain], fp)
+        self.assertEqual(fp.getvalue(), '{"$id": 1, "countryCode": "ES"}\n' * 2)
+        countries = list(serializer.unserialize_many(fp.getvalue().splitlines(), RCountry))
+        self.assertIsNot(countries[0], countries[1])
+
+    def test_objects_without_report(self):
+        serializer = ASerializer(references=REFERENCES_IDS)
+        node = RNode('root')
+        node.children.append(node)
+        json_str = serializer.serialize(node)
+        self.assertEqual(json.loads(json_str), {'$id': 1, 'name': 'root', 'children': [{'$ref': 1}]})
+        root = serializer.unserialize(json_str)
+        self.assertIs(root['children'][0], root)
+
+    def test_unknown_references_raise_an_error(self):
+        with self.assertRaises(AJsonUnknownReferenceError):
+            ASerializer(references=REFERENCES_IDS).unserialize('{"country": {"$ref": 7}}', RCity)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            ASerializer(references='weak')
@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from ajson.report_cache import ReportCache
+from ajson.type_inspector import TypeInspector
+
+
+class TestReportCache(unittest.TestCase):
+    def setUp(self):
+        self.old_directory = ReportCache().directory
+        self.temp_dir = tempfile.TemporaryDirectory()
+        ReportCache().directory = self.temp_dir.name
+
+    def tearDown(self):
+        ReportCache().directory = self.old_directory
+        self.temp_dir.cleanup()
+
+    def test_cached_reports_are_not_parsed_again(self):
+        class RCA:
+            def __init__(self):
+                self.a = 10  # @aj(name=aa groups=["admin"])
+
+        report = TypeInspector().inspect_type(RCA)
+        with mock.patch.object(TypeInspector, '_get_aj_annotation_reports') as parse_mock:
+            self.assertEqual(TypeInspector().inspect_type(RCA), report)
+        parse_mock.assert_not_called()
+
+    def test_changed_source_invalidates_the_cached_report(self):
+        class RCB:
+            def __init__(self):
+                self.a = 10  # @aj(name=aa)
+
+        TypeInspector().inspect_type(RCB)
+        cache_files = os.listdir(self.temp_dir.name)
+        self.assertEqual(len(cache_files), 1)
+        cache_path = os.path.join(self.temp_dir.name, cache_files[0])
+        with open(cache_path) as fp:
+            entry = json.load(fp)
+        entry['source_hash'] = 'outdated'
+        entry['report'] = {'b': {}}
+        with open(cache_path, 'w') as fp:
+            json.dump(entry, fp)
+
+        self.assertEqual(TypeInspector().inspect_type(RCB), {'a': {'name': 'aa'}})
+
+    def test_cache_is_disabled_without_directory(self):
+        class RCC:
+            a = 1  # @aj(name=aa)
+
+        ReportCache().directory = None
+        self.assertEqual(TypeInspector().inspect_type(RCC), {'a': {'name': 'aa'}})
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
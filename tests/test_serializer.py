@@ -1,6 +1,9 @@
+import io
 import json
+import numbers
 import unittest
 from datetime import timedelta, datetime
+from typing import Dict, List, Optional
 
 from ajson.aserializer import ASerializer
 from ajson.json_type_reports import JsonTypeReports, ISO_FORMAT
@@ -10,10 +13,12 @@ class TestSerialization(unittest.TestCase):
     def setUp(self):
         self.serializer = ASerializer()
         self.old_reports = JsonTypeReports().reports
+        self.old_pending = JsonTypeReports().pending
         JsonTypeReports().clear()
 
     def tearDown(self):
         JsonTypeReports().reports = self.old_reports
+        JsonTypeReports().pending = self.old_pending
 
     def test_basic_object_serialization(self):
         serialization = self.serializer.serialize(5)
@@ -21,6 +26,10 @@ class TestSerialization(unittest.TestCase):
         serialization = self.serializer.serialize("hi")
         self.assertTrue(serialization == '"hi"', "str serialization")
 
+    def test_frozensets_are_serialized_as_lists(self):
+        self.assertEqual(self.serializer.to_dict({'a': frozenset({1})}), {'a': [1]})
+        self.assertEqual(self.serializer.serialize(frozenset()), '[]')
+
     def test_simple_objects(self):
         class SSimpleObject(object):
             def __init__(self):
@@ -46,6 +55,20 @@ class TestSerialization(unittest.TestCase):
         self.assertTrue(ser_obj["a"]["1"] == 15)
         self.assertTrue(len(ser_obj["b"]) == 3)
 
+    def test_slots_objects(self):
+        class SSlotsParent(object):
+            __slots__ = ('a', '_private')
+
+        class SSlotsObject(SSlotsParent):
+            __slots__ = ('b', 'empty')
+
+            def __init__(self):
+                self.a = 1
+                self.b = [1, 2]
+                self._private = 3
+
+        self.assertEqual(json.loads(self.serializer.serialize(SSlotsObject())), {'a': 1, 'b': [1, 2]})
+
     def test_cycle_ref(self):
         class SCycleRefObject(object):
             def __init__(self):
@@ -74,11 +97,60 @@ class TestSerialization(unittest.TestCase):
         date_dict = self.serializer.to_dict({"datetime": date})
         self.assertEqual(date_dict["datetime"], "test")
 
+    def test_serialize_handler_of_the_most_specific_class_is_used(self):
+        self.serializer.add_serialize_handler(int, lambda d, g, a: "int")
+        self.serializer.add_serialize_handler(bool, lambda d, g, a: "bool")
+        self.assertEqual(self.serializer.to_dict([1, True]), ["int", "bool"])
+
+    def test_serialize_handler_for_abstract_classes(self):
+        self.serializer.add_serialize_handler(numbers.Number, lambda d, g, a: "number")
+        self.assertEqual(self.serializer.to_dict([1, 2.5, "hi"]), ["number", "number", "hi"])
+
+    def test_adding_serialize_handler_invalidates_resolved_types(self):
+        self.assertEqual(self.serializer.to_dict([1]), [1])
+        self.serializer.add_serialize_handler(int, lambda d, g, a: d * 2)
+        self.assertEqual(self.serializer.to_dict([1]), [2])
+
     def test_unserialize_handler_modify_specific_types(self):
         self.serializer.add_unserialize_handler(str, lambda d, a: "test")
         date_dict = self.serializer.from_dict({"datetime": "2013-12-31T10:20:34Z"})
         self.assertEqual(date_dict["datetime"], "test")
 
+    def test_serialize_iter_generates_the_same_json_as_serialize(self):
+        class SStreamObject(object):
+            def __init__(self):
+                self.a = self
+                self.b = {"a": [1.5, None, True], 1: (2, 3), "_private": 4}
+                self.c = datetime(2010, 5, 10, 2, 40)
+                self.d = []
+
+        obj = SStreamObject()
+        self.assertEqual(''.join(self.serializer.serialize_iter(obj, chunk_size=10)), self.serializer.serialize(obj))
+
+    def test_serialize_iter_consumes_generators_lazily(self):
+        consumed = []
+
+        def numbers():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        chunks = self.serializer.serialize_iter({"numbers": numbers()}, chunk_size=1)
+        self.assertEqual(next(chunks), '{')
+        self.assertEqual(consumed, [])
+        self.assertEqual(''.join(chunks), '"numbers": [0, 1, 2]}')
+        self.assertEqual(self.serializer.to_dict(i for i in range(3)), [0, 1, 2])
+
+    def test_serialize_to_text_and_binary_streams(self):
+        obj = {"a": [1, "é"], "b": None}
+        text_stream = io.StringIO()
+        self.serializer.serialize_to(obj, text_stream)
+        self.assertEqual(text_stream.getvalue(), self.serializer.serialize(obj))
+
+        binary_stream = io.BytesIO()
+        self.serializer.serialize_to(obj, binary_stream)
+        self.assertEqual(binary_stream.getvalue(), self.serializer.serialize(obj).encode('utf-8'))
+
     # Unserialize
 
     def test_simple_unserialize_returns_dict(self):
@@ -97,5 +169,24 @@ class TestSerialization(unittest.TestCase):
     def test_simple_unserialize_date_time_with_iso_format(self):
         date = datetime.now()
         date_src = self.serializer.serialize({"datetime": date})
-        date_dict = self.serializer.unserialize(date_src)
+        date_dict = ASerializer(detect_datetimes=True).unserialize(date_src)
         self.assertIsInstance(date_dict["datetime"], datetime)
+        self.assertEqual(date_dict["datetime"], date.replace(microsecond=0))
+
+    def test_strings_without_hints_are_not_parsed_as_date_time_by_default(self):
+        date_dict = self.serializer.unserialize('{"datetime": "2013-12-31T10:20:34Z"}')
+        self.assertEqual(date_dict["datetime"], "2013-12-31T10:20:34Z")
+
+    def test_strings_with_datetime_hints_are_parsed(self):
+        date = datetime(2019, 1, 2, 3, 4, 5)
+        self.assertEqual(self.serializer.unserialize('"2019-01-02T03:04:05Z"', datetime), date)
+        self.assertEqual(self.serializer.unserialize('"2019-01-02T03:04:05Z"', Optional[datetime]), date)
+        self.assertEqual(self.serializer.unserialize('["2019-01-02T03:04:05Z"]', List[datetime]), [date])
+        self.assertEqual(self.serializer.unserialize('{"a": "2019-01-02T03:04:05Z"}', Dict[str, datetime]), {'a': date})
+        self.assertEqual(self.serializer.unserialize('"2019-01-02T03:04:05Z"', str), '2019-01-02T03:04:05Z')
+
+    def test_detect_date_times_with_iso_format_behaves_like_strptime(self):
+        serializer = ASerializer(detect_datetimes=True)
+        date_list = serializer.unserialize('["2013-12-31T10:20:34Z", "2013-1-3T10:20:34Z", "2013-13-31T10:20:34Z"]')
+        self.assertEqual(date_list, [datetime(2013, 12, 31, 10, 20, 34), datetime(2013, 1, 3, 10, 20, 34),
+                                     "2013-13-31T10:20:34Z"])
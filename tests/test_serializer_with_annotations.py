@@ -1,8 +1,12 @@
+import io
 import json
 import unittest
+from unittest import mock
 
 from ajson.aserializer import ASerializer
-from ajson.json_type_reports import AJsonEmptyRequiredAttributeError, AJsonValidationError
+from ajson.validators import VALIDATION_OFF, VALIDATION_SAMPLED, VALIDATION_SHALLOW
+from ajson.json_type_reports import AJsonEmptyRequiredAttributeError, AJsonUnknownKeyError, AJsonValidationError, \
+    JsonTypeReports, UNKNOWN_KEYS_ATTRIBUTE, UNKNOWN_KEYS_COLLECT, UNKNOWN_KEYS_ERROR, _TypeReport
 from tests.types_for_tests.test_serializaer_with_annotations_types import *
 
 
@@ -80,6 +84,27 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         self.assertEqual(len(obj_dict.keys()), 1)
         self.assertEqual(obj_dict['b'], 2)
 
+    def test_serialization_plan_is_cached_per_group_set(self):
+        type_report = JsonTypeReports().reports[SObjectWithGroupsAndNoGroups]
+        self.serializer.to_dict(SObjectWithGroupsAndNoGroups(), groups=['admin', 'public'])
+        plan = type_report.get_serialization_plan(frozenset(['public', 'admin']))
+        self.assertEqual([key for key, _, _ in plan], ['a', 'b'])
+
+        self.serializer.to_dict(SObjectWithGroupsAndNoGroups(), groups=['public', 'admin'])
+        self.assertIs(type_report.get_serialization_plan(frozenset(['admin', 'public'])), plan)
+
+    def test_serialize_without_groups_keeps_instance_attributes_order(self):
+        obj = SObjectWithProperties()
+        obj.c = 3
+        obj_dict = self.serializer.to_dict(obj)
+        self.assertEqual(list(obj_dict.items()), [('c', 3), ('a', 1), ('b', 2)])
+
+    def test_serialize_iter_uses_groups_names_and_date_formats(self):
+        objs = [SSimpleObjectAJsonNested2(), SSimpleObjectWithDate(), SObjectWithProperties()]
+        for groups in (None, [], ['admin'], ['admin', 'public', 'g1']):
+            self.assertEqual(''.join(self.serializer.serialize_iter(objs, groups)),
+                             self.serializer.serialize(objs, groups))
+
     # Unserialize
     def test_simple_entity_is_unserialize_from_dict(self):
         dict_obj = {
@@ -123,6 +148,29 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         self.assertEqual(list_obj[1].date.month, 2)
         self.assertEqual(list_obj[2].date.month, 3)
 
+    def test_unserialize_iter_yields_typed_objects(self):
+        json_str = json.dumps([{'my_mane': i, 'date': '2000/0{}/01'.format(i)} for i in range(1, 4)])
+        objs = list(self.serializer.unserialize_iter(io.StringIO(json_str), USNameAndDateObjectAJson2))
+        self.assertEqual(len(objs), 3)
+        self.assertIsInstance(objs[0], USNameAndDateObjectAJson2)
+        self.assertEqual([obj.a for obj in objs], [1, 2, 3])
+        self.assertEqual(objs[2].date.month, 3)
+
+    def test_json_lines_round_trip(self):
+        fp = io.BytesIO()
+        throughput = self.serializer.serialize_many((SSimpleObjectAJsonNested2() for _ in range(3)), fp, ['admin'])
+        self.assertEqual(fp.getvalue().decode('utf-8'), '{"nested1": {"a": 1}}\n' * 3)
+        self.assertIs(self.serializer.last_throughput, throughput)
+        self.assertEqual(throughput.records, 3)
+        self.assertEqual(throughput.bytes, len(fp.getvalue()))
+
+        lines = io.StringIO('{"my_mane": 1, "date": "2000/01/01"}\n\n{"my_mane": 2, "date": "2000/02/01"}\n')
+        objs = list(self.serializer.unserialize_many(lines, USNameAndDateObjectAJson2))
+        self.assertEqual([obj.a for obj in objs], [1, 2])
+        self.assertEqual(objs[1].date.month, 2)
+        self.assertEqual(self.serializer.last_throughput.records, 2)
+        self.assertGreater(self.serializer.last_throughput.records_per_second, 0)
+
     def test_unserialize_nested_objects(self):
         obj_dict = {
             'nested': {
@@ -151,6 +199,107 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         self.assertIsInstance(obj.nested_list[0].date, datetime)
         self.assertEqual(obj.nested_list[0].date.year, 2003)
 
+    def test_unserialize_container_hints(self):
+        nested = {'my_mane': 3, 'date': '2003/01/01'}
+        obj_dict = {
+            'by_name': {'first': nested},
+            'by_id': {'1': [nested, nested]},
+            'pair': [nested, 2],
+            'numbers': [1, 2, 3],
+            'tags': ['a', 'b', 'a'],
+            'frozen_tags': ['c'],
+            'matrix': [[nested], []],
+            'optional_nested': nested,
+        }
+
+        obj: USWithContainerHintsObject = self.serializer.from_dict(obj_dict, USWithContainerHintsObject)
+        self.assertIsInstance(obj.by_name['first'], USNestedObject0)
+        self.assertEqual(obj.by_name['first'].date, datetime(2003, 1, 1))
+        self.assertEqual(list(obj.by_id), [1])
+        self.assertEqual([item.a for item in obj.by_id[1]], [3, 3])
+        self.assertIsInstance(obj.pair, tuple)
+        self.assertIsInstance(obj.pair[0], USNestedObject0)
+        self.assertEqual(obj.pair[1], 2)
+        self.assertEqual(obj.numbers, (1, 2, 3))
+        self.assertEqual(obj.tags, {'a', 'b'})
+        self.assertEqual(obj.frozen_tags, frozenset({'c'}))
+        self.assertIsInstance(obj.frozen_tags, frozenset)
+        self.assertIsInstance(obj.matrix[0][0], USNestedObject0)
+        self.assertEqual(obj.matrix[1], [])
+        self.assertIsInstance(obj.optional_nested, USNestedObject0)
+
+    def test_unserialize_container_hints_round_trip(self):
+        nested = USNestedObject0()
+        nested.date = datetime(2003, 1, 1)
+        obj = USWithContainerHintsObject()
+        obj.by_name, obj.by_id, obj.pair, obj.numbers = {'a': nested}, {2: [nested]}, (nested, 1), (1, 2)
+        obj.tags, obj.frozen_tags, obj.matrix, obj.optional_nested = {'x'}, frozenset({'y'}), [[nested]], None
+
+        result = self.serializer.unserialize(self.serializer.serialize(obj), USWithContainerHintsObject)
+        self.assertEqual(self.serializer.to_dict(result), self.serializer.to_dict(obj))
+        self.assertEqual(result.by_id[2][0].date, datetime(2003, 1, 1))
+        self.assertIsNone(result.optional_nested)
+        self.assertEqual(result.frozen_tags, frozenset({'y'}))
+
+    def test_unserialize_top_level_container_hints(self):
+        nested = {'my_mane': 3, 'date': '2003/01/01'}
+        result = self.serializer.from_dict({'a': [nested]}, Dict[str, List[USNestedObject0]])
+        self.assertIsInstance(result['a'][0], USNestedObject0)
+        self.assertEqual(self.serializer.unserialize('[1, "a"]', Tuple[int, str]), (1, 'a'))
+        self.assertEqual(self.serializer.unserialize('{"1.5": true, "x": 1}', Dict[float, int]), {1.5: True, 'x': 1})
+        self.assertEqual(self.serializer.unserialize('{"true": 1}', Dict[bool, int]), {True: 1})
+
+    def test_unserialize_with_construct_new_skips_init(self):
+        init_calls = USConstructNewObject.init_calls
+        obj_dict = {'aa': 5, 'nested': {'my_mane': 3, 'date': '2003/01/01'}, 'c': 7, 'unknown': 1}
+
+        obj: USConstructNewObject = self.serializer.from_dict(obj_dict, USConstructNewObject)
+        self.assertEqual(USConstructNewObject.init_calls, init_calls)
+        self.assertEqual(vars(obj), {'a': 5, 'nested': obj.nested, '_c': 7})
+        self.assertEqual(obj.nested.date, datetime(2003, 1, 1))
+        self.assertEqual(obj.b, 'default')
+
+    def test_unserialize_with_construct_new_validates_the_object(self):
+        with self.assertRaises(AJsonValidationError):
+            self.serializer.from_dict({'aa': 'text'}, USConstructNewObject)
+
+    def test_unserialize_with_construct_kwargs_passes_the_attributes_to_init(self):
+        obj_dict = {'aa': 5, 'nested': [{'my_mane': 3, 'date': '2003/01/01'}]}
+
+        obj: USConstructKwargsObject = self.serializer.from_dict(obj_dict, USConstructKwargsObject, extra='e')
+        self.assertEqual(obj.a, 5)
+        self.assertIsInstance(obj.nested[0], USNestedObject0)
+        self.assertEqual(obj.extra, 'e')
+        with self.assertRaises(TypeError):
+            self.serializer.from_dict({'aa': 5}, USConstructKwargsObject)
+
+    def test_unserialize_with_construct_kwargs_sets_the_attributes_that_are_not_init_args(self):
+        obj = USConstructKwargsWithClassAttributesObject(3)
+        obj.z = 4
+        json_str = self.serializer.serialize(obj)
+        self.assertEqual(json.loads(json_str), {'x': 3, 'z': 4, 'double_x': 6})
+
+        result = self.serializer.unserialize(json_str, USConstructKwargsWithClassAttributesObject)
+        self.assertEqual((result.x, result.z, result.double_x), (3, 4, 6))
+
+    def test_serialize_slots_objects(self):
+        obj = USSlotsObject()
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertEqual(self.serializer.to_dict(obj), {'kind': 'slots', 'bb': 'b', 'nested': None, 'a': 1})
+        self.assertEqual(self.serializer.to_dict(obj, groups=['public']), {'bb': 'b'})
+        obj.nested = USNestedObject0()
+        self.assertEqual(json.loads(self.serializer.serialize(obj))['nested'], {'my_mane': 1, 'date': None})
+
+    def test_unserialize_slots_objects(self):
+        obj_dict = {'a': 2, 'bb': 'c', 'nested': {'my_mane': 3, 'date': '2003/01/01'}}
+
+        obj: USSlotsObject = self.serializer.from_dict(obj_dict, USSlotsObject)
+        self.assertEqual((obj.a, obj.b, obj.nested.a), (2, 'c', 3))
+        obj: USSlotsNewObject = self.serializer.from_dict({'a': 2, 'b': 3}, USSlotsNewObject)
+        self.assertEqual((obj.a, obj.b), (2, 3))
+        with self.assertRaises(AJsonValidationError):
+            self.serializer.from_dict({'b': 'text'}, USSlotsNewObject)
+
     def test_unserialize_with_required_throws_if_required_is_not_provided(self):
         dict_obj = {
             'b': 1,
@@ -182,6 +331,14 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         self.assertIsNone(obj.b)
         self.assertEqual(obj.a, 10)
 
+    def test_unserialize_parses_date_times_only_for_date_time_hints(self):
+        date_str = '2013-12-31T10:20:34Z'
+        obj: USWithDateHintsObject = self.serializer.from_dict({'a': date_str, 'b': date_str, 'c': date_str},
+                                                               USWithDateHintsObject)
+        self.assertEqual(obj.a, datetime(2013, 12, 31, 10, 20, 34))
+        self.assertEqual(obj.b, datetime(2013, 12, 31, 10, 20, 34))
+        self.assertEqual(obj.c, date_str)
+
     def test_unserialize_allows_validation_with_multi_type(self):
         obj: USWithMultiTypeHintsObject = self.serializer.from_dict({'a': 10}, USWithMultiTypeHintsObject)
         self.assertEqual(obj.a, 10)
@@ -190,6 +347,43 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         with self.assertRaises(AJsonValidationError):
             self.serializer.from_dict({'a': 10.13}, USWithMultiTypeHintsObject)
 
+    def test_unserialize_validation_modes(self):
+        obj_dict = {'nested_list': [{'my_mane': 1}, {'my_mane': 'wrong'}]}
+        with self.assertRaises(AJsonValidationError):
+            self.serializer.from_dict(obj_dict, USNestedListObject)
+        with self.assertRaises(AJsonValidationError):
+            ASerializer(validation=VALIDATION_SAMPLED, validation_sample_step=1).from_dict(obj_dict, USNestedListObject)
+
+        for serializer in (ASerializer(validation=VALIDATION_OFF), ASerializer(validation=VALIDATION_SHALLOW),
+                           ASerializer(validation=VALIDATION_SAMPLED, validation_sample_step=2)):
+            obj: USNestedListObject = serializer.from_dict(obj_dict, USNestedListObject)
+            self.assertEqual(obj.nested_list[1].a, 'wrong')
+
+    def test_unserialize_shallow_validation_checks_top_level_objects(self):
+        serializer = ASerializer(validation=VALIDATION_SHALLOW)
+        with self.assertRaises(AJsonValidationError):
+            serializer.from_dict({'a': 10.13}, USWithMultiTypeHintsObject)
+        with self.assertRaises(AJsonEmptyRequiredAttributeError):
+            serializer.from_dict({'b': 1}, USRequiredObject)
+        # the items of the top level containers are not top level objects
+        self.assertEqual(serializer.from_dict([{'b': 1}], USRequiredObject)[0].b, 1)
+        self.assertEqual(serializer.from_dict({'x': [{'b': 1}]}, Dict[str, List[USRequiredObject]])['x'][0].b, 1)
+        self.assertEqual(ASerializer(validation=VALIDATION_OFF).from_dict({'b': 1}, USRequiredObject).b, 1)
+
+    def test_unserialize_sampled_validation_checks_one_every_step_items_of_top_level_containers(self):
+        json_str = json.dumps([{'a': i, 'b': i} for i in range(100)])
+        for serializer, validations in ((ASerializer(), 100),
+                                        (ASerializer(validation=VALIDATION_SAMPLED, validation_sample_step=10), 10),
+                                        (ASerializer(validation=VALIDATION_SHALLOW), 0)):
+            with mock.patch.object(_TypeReport, 'validate_instance', autospec=True) as validate_instance:
+                objs = serializer.unserialize(json_str, List[USRequiredObject])
+            self.assertEqual(len(objs), 100)
+            self.assertEqual(validate_instance.call_count, validations, serializer.validation)
+        serializer = ASerializer(validation=VALIDATION_SAMPLED, validation_sample_step=10)
+        self.assertEqual(len(serializer.unserialize(json_str.replace('"a": 5, ', ''), List[USRequiredObject])), 100)
+        with self.assertRaises(AJsonEmptyRequiredAttributeError):
+            serializer.unserialize(json_str.replace('"a": 10, ', ''), List[USRequiredObject])
+
     def test_unserialize_properties(self):
         obj: USWithProperties = self.serializer.from_dict({'a': 10, 'b': 5}, USWithProperties)
         self.assertEqual(obj.a, 10)
@@ -197,3 +391,38 @@ class TestSerializationWithAnnotations(unittest.TestCase):
         obj: USWithProperties = self.serializer.from_dict({'a': 4, 'new_b': 20}, USWithProperties)
         self.assertEqual(obj.a, 4)
         self.assertEqual(obj.b, 20)
+
+    def test_unserialize_finds_attributes_by_serialized_name(self):
+        type_report = JsonTypeReports().reports[USNameAndDateObjectAJson]
+        self.assertEqual(type_report.get_by_serialize_name('my_mane').attribute_name, 'a')
+        self.assertIsNone(type_report.get_by_serialize_name('a'))
+        self.assertIsNone(type_report.get_by_serialize_name('unknown'))
+
+    def test_unserialize_collects_unknown_keys(self):
+        serializer = ASerializer(unknown_keys=UNKNOWN_KEYS_COLLECT)
+        obj: USNameAndDateObjectAJson = serializer.from_dict({'a': 10, 'my_mane': 20, 'c': 3},
+                                                             USNameAndDateObjectAJson)
+        self.assertEqual(obj.a, 20)
+        self.assertEqual(getattr(obj, UNKNOWN_KEYS_ATTRIBUTE), {'a': 10, 'c': 3})
+        self.assertNotIn(UNKNOWN_KEYS_ATTRIBUTE, serializer.to_dict(obj))
+
+    def test_unserialize_collects_unknown_keys_of_slots_objects(self):
+        serializer = ASerializer(unknown_keys=UNKNOWN_KEYS_COLLECT)
+        # without __dict__ the unknown keys are only kept if the class has a slot for them
+        obj: USSlotsObject = serializer.from_dict({'bb': 'c', 'c': 3}, USSlotsObject)
+        self.assertEqual(obj.b, 'c')
+        self.assertFalse(hasattr(obj, UNKNOWN_KEYS_ATTRIBUTE))
+        obj: USSlotsUnknownKeysObject = serializer.from_dict({'b': 2, 'c': 3}, USSlotsUnknownKeysObject)
+        self.assertEqual(getattr(obj, UNKNOWN_KEYS_ATTRIBUTE), {'c': 3})
+        self.assertEqual(serializer.to_dict(obj), {'a': 1, 'b': 2})
+
+    def test_unserialize_raises_error_with_unknown_keys(self):
+        serializer = ASerializer(unknown_keys=UNKNOWN_KEYS_ERROR)
+        obj: USNameAndDateObjectAJson = serializer.from_dict({'my_mane': 20}, USNameAndDateObjectAJson)
+        self.assertEqual(obj.a, 20)
+        with self.assertRaises(AJsonUnknownKeyError):
+            serializer.from_dict({'my_mane': 20, 'c': 3}, USNameAndDateObjectAJson)
+
+    def test_unserialize_with_invalid_unknown_keys_policy_raises_error(self):
+        with self.assertRaises(ValueError):
+            ASerializer(unknown_keys='unknown')
@@ -0,0 +1,39 @@
+import unittest
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from typeguard import check_type
+
+from ajson.validators import VALIDATION_SAMPLED, VALIDATION_SHALLOW, compile_validator
+
+
+class TestValidators(unittest.TestCase):
+    def assertMatchesTypeguard(self, hint, value):
+        try:
+            check_type('value', value, hint)
+            expected = True
+        except TypeError:
+            expected = False
+        except AttributeError:
+            # typeguard 2.2 can't check sets in the latest python versions
+            return
+        self.assertEqual(compile_validator(hint)(value), expected, '{} {!r}'.format(hint, value))
+
+    def test_compiled_validators_match_typeguard(self):
+        hints = [int, float, str, bool, complex, Any, list, dict, Optional[int], Union[int, str],
+                 List[int], List[List[str]], Optional[List[float]], Set[int], FrozenSet[str], Dict[str, int],
+                 Tuple[int, str], Tuple[int, ...], Tuple[()]]
+        values = [None, 1, True, 1.5, 1j, 'a', [], [1, 2], [1, 'a'], [[], ['a']], [[1]], {1, 2}, frozenset({'a'}),
+                  {'a': 1}, {1: 'a'}, (1, 'a'), (1, 2, 3), (), ('a', 1)]
+        for hint in hints:
+            for value in values:
+                self.assertMatchesTypeguard(hint, value)
+
+    def test_shallow_validators_do_not_check_the_items(self):
+        validator = compile_validator(List[int], VALIDATION_SHALLOW)
+        self.assertTrue(validator([1, 'a']))
+        self.assertFalse(validator({1}))
+
+    def test_sampled_validators_check_every_nth_item(self):
+        validator = compile_validator(List[int], VALIDATION_SAMPLED, sample_step=2)
+        self.assertTrue(validator([1, 'a', 3, 'b']))
+        self.assertFalse(validator([1, 'a', 'c', 'b']))
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from ajson import AJson
+from ajson.json_type_reports import UNKNOWN_KEYS_ATTRIBUTE
 
 
 @AJson()
@@ -133,11 +134,107 @@ class USWithOptionalHintsObject(object):
     b: str
 
 
+@AJson()
+class USWithDateHintsObject(object):
+    a: datetime
+    b: Optional[datetime]
+    c: str
+
+
 @AJson()
 class USWithMultiTypeHintsObject(object):
     a: Union[int, str]
 
 
+@AJson()
+class USWithContainerHintsObject(object):
+    by_name: Dict[str, USNestedObject0]
+    by_id: Dict[int, List[USNestedObject0]]
+    pair: Tuple[USNestedObject0, int]
+    numbers: Tuple[int, ...]
+    tags: Set[str]
+    frozen_tags: FrozenSet[str]
+    matrix: List[List[USNestedObject0]]
+    optional_nested: Optional[USNestedObject0]
+
+
+@AJson(construct='new')
+class USConstructNewObject(object):
+    init_calls = 0
+    a: int  # @aj(name=aa)
+    b: str = 'default'
+    nested: Optional[USNestedObject0]
+
+    def __init__(self):
+        USConstructNewObject.init_calls += 1
+        self.a = 1
+        self._c = 3
+
+    @property
+    def c(self) -> int:
+        """ @aj() """
+        return self._c
+
+    @c.setter
+    def c(self, c):
+        self._c = c
+
+
+@AJson(construct='kwargs')
+class USConstructKwargsObject(object):
+    a: int  # @aj(name=aa)
+    nested: List[USNestedObject0]
+
+    def __init__(self, a, nested, extra=None):
+        self.a = a
+        self.nested = nested
+        self.extra = extra
+
+
+@AJson(construct='kwargs')
+class USConstructKwargsWithClassAttributesObject(object):
+    z = 0
+
+    def __init__(self, x=0):
+        self.x = x
+
+    @property
+    def double_x(self):
+        return self.x * 2
+
+
+class USSlotsBase(object):
+    __slots__ = ('a',)
+
+    def __init__(self):
+        self.a = 1
+
+
+@AJson()
+class USSlotsObject(USSlotsBase):
+    __slots__ = ('b', 'nested', '__private')
+    kind = 'slots'
+    b: str  # @aj(name=bb groups=["public"])
+    nested: Optional[USNestedObject0]
+
+    def __init__(self):
+        super().__init__()
+        self.b = 'b'
+        self.__private = 'private'
+
+
+@AJson(construct='new')
+class USSlotsNewObject(USSlotsBase):
+    __slots__ = ('b',)
+    b: int
+
+
+@AJson()
+class USSlotsUnknownKeysObject(USSlotsBase):
+    __slots__ = ('b', UNKNOWN_KEYS_ATTRIBUTE)
+    b: int
+
+
 @AJson()
 class USWithProperties(object):
     def __init__(self):